@@ -8,5 +8,14 @@
 #                     uniform_random_global_points, uniform_random_global_network)
 from .geoplot import *
 from .quad import *
+from .topology import *
+from .columnar import *
+from .cache import *
+from .classify import *
+from .scales import *
+from .bundle import *
+from .kde import *
+from .lod import *
+from .parallel import *
 from .crs import *
 from .utils import *
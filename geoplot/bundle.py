@@ -0,0 +1,201 @@
+"""
+This module implements force-directed edge bundling (Holten and van Wijk, "Force-Directed Edge Bundling for Graph
+Visualization", 2009), which ``geoplot.sankey`` uses to bundle dense flow maps when passed ``bundle=True``.
+
+Every edge is subdivided into points, which are pulled towards the corresponding points of compatible edges (edges
+which are similarly oriented, of similar length, and close by), while springs between consecutive points keep each
+edge smooth. Run over a few cycles, each doubling the number of points and shrinking the step size, this gathers
+edges running alongside each other into bundles.
+
+The forces on all of the points of all of the edges are computed at once, in ``numpy``. Compatible edges are found
+by hashing edge midpoints into a grid, so that each edge is only compared with the edges in its neighborhood instead
+of with every other edge.
+"""
+
+import numpy as np
+from geoplot.columnar import ColumnarGeometry
+
+__all__ = ['bundle_edges']
+
+
+def bundle_edges(x0, y0, x1, y1, threshold=0.6, neighbors=16, cycles=5, iterations=50, step=0.01, stiffness=0.1,
+                 chunksize=2**22):
+    """
+    Bundles a set of straight edges.
+
+    Parameters
+    ----------
+    x0, y0, x1, y1 : array-like
+        The coordinates of the start and end points of the edges. Edges are bundled in this coordinate space, so
+        projected coordinates should be used for projected maps.
+    threshold : float, optional
+        The minimum compatibility, between 0 and 1, of edges pulling on one another. Defaults to 0.6. Lower values
+        make for fewer, fatter bundles.
+    neighbors : int, optional
+        The maximum number of (most compatible) edges pulling on each edge. Defaults to 16. Higher values make for
+        tighter bundles, and a longer running time.
+    cycles : int, optional
+        The number of subdivision cycles. Every cycle doubles the number of segments per edge, the first has two.
+        Defaults to 5, for 32 segments per edge.
+    iterations : int, optional
+        The number of iterations in the first cycle. Every further cycle runs two thirds as many. Defaults to 50.
+    step : float, optional
+        The initial step size, as a fraction of the median edge length. Halved every cycle. Defaults to 0.01.
+    stiffness : float, optional
+        The spring constant, which keeps edges from straying too far from straight lines. Defaults to 0.1.
+    chunksize : int, optional
+        The maximum number of point pairs for which forces are computed at once, which bounds memory use.
+
+    Returns
+    -------
+    A ``ColumnarGeometry`` of ``LineString`` edges, each with ``2 ** cycles + 1`` vertices. Edges of zero length or
+    with missing coordinates are returned as is.
+    """
+    starts = np.column_stack([np.asarray(x0, dtype=float), np.asarray(y0, dtype=float)])
+    ends = np.column_stack([np.asarray(x1, dtype=float), np.asarray(y1, dtype=float)])
+    vectors = ends - starts
+    lengths = np.hypot(vectors[:, 0], vectors[:, 1])
+    valid = np.isfinite(lengths) & (lengths > 0)
+
+    # Each edge starts out as a straight line with one interior point.
+    nsegs = 2
+    t = np.linspace(0, 1, nsegs + 1)
+    points = starts[:, np.newaxis, :] + t[np.newaxis, :, np.newaxis] * vectors[:, np.newaxis, :]
+
+    if valid.sum() > 1:
+        edges = np.flatnonzero(valid)
+        e, o, flip = _compatible_pairs(starts[edges], ends[edges], threshold, neighbors)
+        e, o = edges[e], edges[o]
+        scale = np.median(lengths[valid])
+        s = step * scale
+        for cycle in range(cycles):
+            # The spring constant is scaled by edge length and subdivision, as in the original paper.
+            spring = stiffness / (np.where(valid, lengths, 1) * nsegs)
+            for _ in range(iterations):
+                interior = points[:, 1:-1]
+                springs = spring[:, np.newaxis, np.newaxis] * (points[:, :-2] + points[:, 2:] - 2 * interior)
+                forces = springs + _electrostatic_forces(points, e, o, flip, chunksize)
+                points[valid, 1:-1] += s * forces[valid]
+            if cycle < cycles - 1:
+                points = _subdivide(points)
+                nsegs *= 2
+                s /= 2
+                iterations = max(int(iterations * 2 / 3), 1)
+    else:
+        for _ in range(cycles - 1):
+            points = _subdivide(points)
+
+    npts = points.shape[1]
+    offsets = np.arange(len(points) + 1) * npts
+    return ColumnarGeometry(points[:, :, 0].ravel(), points[:, :, 1].ravel(), geom_type='LineString',
+                            offsets=(offsets,))
+
+
+def _subdivide(points):
+    """
+    Doubles the number of segments of every edge by inserting the midpoint of each segment.
+    """
+    n, npts, _ = points.shape
+    subdivided = np.empty((n, 2 * npts - 1, 2))
+    subdivided[:, ::2] = points
+    subdivided[:, 1::2] = (points[:, :-1] + points[:, 1:]) / 2
+    return subdivided
+
+
+def _compatible_pairs(starts, ends, threshold, neighbors):
+    """
+    Finds the pairs of edges compatible enough to pull on one another. Candidates are the edges whose midpoints fall
+    into the same or an adjacent cell of a grid, sized after the median edge length and the threshold, up to a fixed
+    number of them per cell. Their compatibility is the product of the angle, scale and position compatibility
+    measures of Holten and van Wijk.
+
+    Returns
+    -------
+    (e, o, flip) : tuple of ndarray
+        Indices of the edges being pulled, sorted, and of the edges pulling on them; and whether or not the latter run
+        in the opposite direction, in which case their points are matched up in reverse order.
+    """
+    vectors = ends - starts
+    lengths = np.hypot(vectors[:, 0], vectors[:, 1])
+    midpoints = (starts + ends) / 2
+    # Position compatibility alone falls below the threshold once midpoints are further apart than this fraction of
+    # the average length of the two edges, so there is no use in looking much further away than that.
+    cell = np.median(lengths) * max(1 / threshold - 1, 0.1)
+
+    # Hash midpoints into grid cells. Cell coordinates are offset by one, and the grid padded by one cell on either
+    # side, so that neighboring cell keys never wrap around onto another row.
+    cx = np.floor((midpoints[:, 0] - midpoints[:, 0].min()) / cell).astype(np.int64) + 1
+    cy = np.floor((midpoints[:, 1] - midpoints[:, 1].min()) / cell).astype(np.int64) + 1
+    width = cx.max() + 2
+    keys = cx + cy * width
+    order = np.argsort(keys, kind='mergesort')
+    sorted_keys = keys[order]
+
+    candidates = 2 * neighbors
+    pulled, pulling, compats = [], [], []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            target = keys + dx + dy * width
+            lo = np.searchsorted(sorted_keys, target, side='left')
+            hi = np.searchsorted(sorted_keys, target, side='right')
+            # Crowded cells are sampled at evenly spaced positions, to bound the number of candidates per edge.
+            counts = hi - lo
+            sampled = np.minimum(counts, candidates)
+            e = np.repeat(np.arange(len(keys)), sampled)
+            within = np.arange(sampled.sum()) - np.repeat(np.cumsum(sampled) - sampled, sampled)
+            stride = np.repeat(counts / np.maximum(sampled, 1), sampled)
+            o = order[np.repeat(lo, sampled) + (within * stride).astype(np.int64)]
+            distinct = e != o
+            e, o = e[distinct], o[distinct]
+            compat = _compatibility(vectors, lengths, midpoints, e, o)
+            keep = compat >= threshold
+            pulled.append(e[keep])
+            pulling.append(o[keep])
+            compats.append(compat[keep])
+    e, o, compat = np.concatenate(pulled), np.concatenate(pulling), np.concatenate(compats)
+
+    # Keep only the most compatible neighbors of each edge.
+    by_edge = np.lexsort((-compat, e))
+    e, o = e[by_edge], o[by_edge]
+    group_starts = np.flatnonzero(np.concatenate([[True], e[1:] != e[:-1]])) if len(e) else np.array([], dtype=int)
+    rank = np.arange(len(e)) - np.repeat(group_starts, np.diff(np.append(group_starts, len(e))))
+    keep = rank < neighbors
+    e, o = e[keep], o[keep]
+    flip = np.einsum('ij,ij->i', vectors[e], vectors[o]) < 0
+    return e, o, flip
+
+
+def _compatibility(vectors, lengths, midpoints, e, o):
+    """
+    The compatibility of pairs of edges: the product of their angle, scale, and position compatibility.
+    """
+    lp, lq = lengths[e], lengths[o]
+    angle = np.abs(np.einsum('ij,ij->i', vectors[e], vectors[o])) / (lp * lq)
+    average = (lp + lq) / 2
+    scale = 2 / (average / np.minimum(lp, lq) + np.maximum(lp, lq) / average)
+    distance = np.hypot(*(midpoints[e] - midpoints[o]).T)
+    position = average / (average + distance)
+    return angle * scale * position
+
+
+def _electrostatic_forces(points, e, o, flip, chunksize):
+    """
+    Sums up the pull of every compatible edge on the interior points of each edge: a unit vector pointing from each
+    point towards the corresponding point of the other edge. Pairs are processed in chunks, and since they are sorted
+    by the edge being pulled, the pulls on each edge within a chunk are summed with a single ``reduceat``.
+    """
+    interior = points[:, 1:-1]
+    forces = np.zeros_like(interior)
+    npts = interior.shape[1]
+    size = max(chunksize // max(npts, 1), 1)
+    for start in range(0, len(e), size):
+        ce, co, cf = e[start:start + size], o[start:start + size], flip[start:start + size]
+        others = interior[co]
+        others[cf] = others[cf, ::-1]
+        delta = others - interior[ce]
+        distance = np.hypot(delta[..., 0], delta[..., 1])[..., np.newaxis]
+        pull = np.divide(delta, distance, out=np.zeros_like(delta), where=distance > 1e-12)
+        group_starts = np.flatnonzero(np.concatenate([[True], ce[1:] != ce[:-1]]))
+        forces[ce[group_starts]] += np.add.reduceat(pull, group_starts, axis=0)
+    counts = np.bincount(e, minlength=len(points))
+    return forces / np.maximum(counts, 1)[:, np.newaxis, np.newaxis]
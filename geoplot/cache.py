@@ -0,0 +1,286 @@
+"""
+This module implements an on-disk cache of parsed geometry. Reading a large shapefile through ``fiona`` and
+``shapely`` can take longer than plotting it, so the first time a file is read through ``read_file`` its coordinates,
+offsets and attribute columns are written out as ``.npy`` buffers. Later reads memory-map those buffers straight back
+into a ``ColumnarGeometry``, which every plot type can draw without creating any ``shapely`` objects.
+
+Cache entries are keyed by a hash of the path, size and modification time of the source file (and of its sidecar
+files, e.g. the ``.dbf`` of a shapefile), so editing the source invalidates its entry. The cache lives in
+``~/.cache/geoplot`` by default; set the ``GEOPLOT_CACHE_DIR`` environment variable to change this.
+
+This module also implements the in-memory caches which the plot functions keep of structures derived from their
+input, like the quadtrees built by ``aggplot``. These are keyed by the identity of the input, which they only hold
+weak references to, so they never keep a dataset alive; ``clear_memory_cache`` empties them.
+"""
+
+import os
+import glob
+import json
+import shutil
+import hashlib
+import tempfile
+import weakref
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+from geoplot.columnar import ColumnarGeometry
+
+__all__ = ['read_file', 'clear_cache', 'clear_memory_cache']
+
+# Bumped whenever the on-disk layout changes, which invalidates every existing cache entry.
+_CACHE_VERSION = 2
+
+
+def read_file(path, columns=None, cache_dir=None, **kwargs):
+    """
+    Reads a geospatial data file into a ``ColumnarGeometry``, using the on-disk cache where possible.
+
+    Parameters
+    ----------
+    path : str
+        The path to the file. Anything ``geopandas.read_file`` can read is supported.
+    columns : list of str, optional
+        The attribute columns to load. Defaults to all of them. Columns which are not loaded are never read off of
+        the disk.
+    cache_dir : str, optional
+        The cache directory. Defaults to the ``GEOPLOT_CACHE_DIR`` environment variable if it is set, and to
+        ``~/.cache/geoplot`` otherwise.
+    kwargs : dict, optional
+        Keyword arguments passed to ``geopandas.read_file`` on a cache miss. These are part of the cache key.
+
+    Returns
+    -------
+    A ``ColumnarGeometry`` instance. Its coordinate and offset arrays are read-only memory maps of the cache entry.
+    """
+    entry = os.path.join(_get_cache_dir(cache_dir), _cache_key(path, kwargs))
+    if not os.path.exists(os.path.join(entry, 'meta.json')):
+        _write_entry(gpd.read_file(path, **kwargs), entry)
+    return _read_entry(entry, columns)
+
+
+def clear_cache(cache_dir=None):
+    """
+    Deletes every entry in the cache.
+
+    Parameters
+    ----------
+    cache_dir : str, optional
+        The cache directory. Defaults to the same directory ``read_file`` uses.
+
+    Returns
+    -------
+    None
+    """
+    cache_dir = _get_cache_dir(cache_dir)
+    if os.path.isdir(cache_dir):
+        shutil.rmtree(cache_dir)
+
+
+def _get_cache_dir(cache_dir):
+    if cache_dir is None:
+        cache_dir = os.environ.get('GEOPLOT_CACHE_DIR',
+                                   os.path.join(os.path.expanduser('~'), '.cache', 'geoplot'))
+    return cache_dir
+
+
+def _cache_key(path, kwargs):
+    """
+    Hashes the identity and state of a source file. Every file sharing its name stem is taken into account, as
+    formats like shapefiles spread a single layer over several files.
+    """
+    path = os.path.abspath(path)
+    stem = os.path.splitext(path)[0]
+    files = sorted(set([path] + glob.glob(glob.escape(stem) + '.*')))
+    h = hashlib.sha1()
+    h.update(repr((_CACHE_VERSION, path, sorted(kwargs.items()))).encode('utf-8'))
+    for f in files:
+        stat = os.stat(f)
+        h.update(repr((f, stat.st_size, stat.st_mtime)).encode('utf-8'))
+    return h.hexdigest()
+
+
+def _write_entry(gdf, entry):
+    """
+    Writes a ``GeoDataFrame`` out as a cache entry. The entry is assembled in a scratch directory and then moved into
+    place, so that readers never see a partially written entry.
+    """
+    data = pd.DataFrame({c: gdf[c] for c in gdf.columns if c != gdf.geometry.name}, index=gdf.index)
+    cg = ColumnarGeometry.from_geoseries(gdf.geometry)
+
+    parent = os.path.dirname(entry)
+    os.makedirs(parent, exist_ok=True)
+    scratch = tempfile.mkdtemp(dir=parent)
+    try:
+        np.save(os.path.join(scratch, 'x.npy'), cg.x)
+        np.save(os.path.join(scratch, 'y.npy'), cg.y)
+        for i, o in enumerate(cg.offsets):
+            np.save(os.path.join(scratch, 'offsets_{0}.npy'.format(i)), o)
+        _save_column(scratch, 'index', data.index)
+        for i, c in enumerate(data.columns):
+            _save_column(scratch, 'column_{0}'.format(i), data[c])
+        meta = {'geom_type': cg.geom_type, 'n_offsets': len(cg.offsets), 'columns': [str(c) for c in data.columns],
+                'crs': gdf.crs.to_wkt() if gdf.crs else None}
+        with open(os.path.join(scratch, 'meta.json'), 'w') as f:
+            json.dump(meta, f)
+        try:
+            os.rename(scratch, entry)
+        except OSError:  # Another process got there first.
+            shutil.rmtree(scratch, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(scratch, ignore_errors=True)
+        raise
+
+
+def _read_entry(entry, columns):
+    """
+    Memory-maps a cache entry back into a ``ColumnarGeometry``.
+    """
+    with open(os.path.join(entry, 'meta.json')) as f:
+        meta = json.load(f)
+
+    def load(name):
+        return np.load(os.path.join(entry, name + '.npy'), mmap_mode='r')
+
+    offsets = tuple(load('offsets_{0}'.format(i)) for i in range(meta['n_offsets']))
+    if columns is None:
+        columns = meta['columns']
+    missing = set(columns) - set(meta['columns'])
+    if missing:
+        raise KeyError("Columns not found in the data: {0}.".format(', '.join(sorted(missing))))
+    data = pd.DataFrame({c: _load_column(entry, 'column_{0}'.format(meta['columns'].index(c))) for c in columns},
+                        index=_load_column(entry, 'index'), columns=columns)
+    return ColumnarGeometry(load('x'), load('y'), geom_type=meta['geom_type'], offsets=offsets, data=data,
+                            crs=meta['crs'])
+
+
+def _save_column(scratch, name, values):
+    """
+    Saves a column (or index) to an array ``numpy`` can save without pickling, as pickled arrays can't be
+    memory-mapped. Object columns are stored as fixed-width unicode (string columns) or booleans (boolean columns),
+    and the positions of any null values in them are saved alongside, in a ``_null`` array. Object columns holding
+    anything else can't be stored faithfully, and raise a ``ValueError``.
+    """
+    arr = np.asarray(values)
+    if arr.dtype == object:
+        null = np.asarray(pd.isnull(arr), dtype=bool)
+        types = {type(v) for v in arr[~null]}
+        if types <= {str}:
+            arr = np.array([v if not n else '' for v, n in zip(arr, null)], dtype=str)
+        elif types <= {bool, np.bool_}:
+            arr = np.array([bool(v) if not n else False for v, n in zip(arr, null)], dtype=bool)
+        else:
+            raise ValueError("The '{0}' column holds values of type {1}, which can't be cached. Only string and "
+                             "boolean columns of Python objects are supported.".format(
+                                 values.name, ', '.join(sorted(t.__name__ for t in types))))
+        if null.any():
+            np.save(os.path.join(scratch, name + '_null.npy'), null)
+    np.save(os.path.join(scratch, name + '.npy'), arr)
+
+
+def _load_column(entry, name):
+    """
+    Memory-maps a column saved by ``_save_column`` back. Columns with null values are read into memory instead, as
+    object arrays holding None at the null positions.
+    """
+    arr = np.load(os.path.join(entry, name + '.npy'), mmap_mode='r')
+    null_path = os.path.join(entry, name + '_null.npy')
+    if os.path.exists(null_path):
+        arr = arr.astype(object)
+        arr[np.load(null_path)] = None
+    return arr
+
+
+class IdentityCache:
+    """
+    A least recently used cache of values derived from objects, keyed by the identity of those objects rather than
+    by their contents, so that a lookup costs the same however large they are. The objects are only weakly
+    referenced, and an entry is dropped as soon as any of them is garbage collected. Cached values must therefore not
+    refer back to the objects they were derived from, or these never will be.
+
+    Entries are also evicted, least recently used first, once the values held take up more than ``max_bytes``.
+    """
+    def __init__(self, max_bytes):
+        """
+        Instantiation method.
+
+        Parameters
+        ----------
+        max_bytes : int
+            The most memory the cached values may take up, as reported to ``put``.
+
+        Returns
+        -------
+        An ``IdentityCache`` instance.
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        _memory_caches.append(self)
+
+    def get(self, objs, key=()):
+        """
+        Returns the value cached for the objects ``objs`` and the hashable ``key``, or None if there is none.
+        """
+        k = (tuple(id(o) for o in objs), key)
+        entry = self._entries.get(k)
+        if entry is None or any(r() is not o for r, o in zip(entry[0], objs)):
+            return None
+        self._entries.move_to_end(k)
+        return entry[1]
+
+    def put(self, objs, value, nbytes, key=()):
+        """
+        Caches ``value`` for the objects ``objs`` and the hashable ``key``. ``nbytes`` is the memory taken up by the
+        value. Values larger than the cache, and values derived from objects which can't be weakly referenced, are
+        not cached.
+
+        Returns
+        -------
+        ``value``.
+        """
+        if nbytes > self.max_bytes:
+            return value
+        k = (tuple(id(o) for o in objs), key)
+        try:
+            refs = tuple(weakref.ref(o, lambda _, k=k: self._discard(k)) for o in objs)
+        except TypeError:
+            return value
+        self._discard(k)
+        self._entries[k] = (refs, value, nbytes)
+        self.nbytes += nbytes
+        while self.nbytes > self.max_bytes:
+            self._discard(next(iter(self._entries)))
+        return value
+
+    def clear(self):
+        """
+        Empties the cache.
+        """
+        self._entries.clear()
+        self.nbytes = 0
+
+    def _discard(self, k):
+        entry = self._entries.pop(k, None)
+        if entry is not None:
+            self.nbytes -= entry[2]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_memory_caches = []
+
+
+def clear_memory_cache():
+    """
+    Empties the in-memory caches of structures derived from plotted data (e.g. the quadtrees built by ``aggplot``).
+    Entries are dropped automatically once the data they were derived from is garbage collected, so this is only
+    needed to release memory while that data is still in use.
+
+    Returns
+    -------
+    None
+    """
+    for cache in _memory_caches:
+        cache.clear()
@@ -0,0 +1,364 @@
+"""
+This module implements ``Classifier``, which bins a continuous data column into a handful of ordinal classes for
+the ``scheme`` parameter of the plot types which accept one (``pointplot``, ``choropleth``, ``cartogram``, and
+``sankey``).
+
+Passing a scheme name to a plot type classifies its ``hue`` from scratch every time. A ``Classifier`` instead computes
+its bin edges once, and can then be passed as the ``scheme`` of any number of plots, which all share the same classes
+and thus the same legend; this is what's wanted when faceting a dataset or plotting a time series of it. Bin edges
+may be computed from a random sample of the data, or accumulated over a stream of chunks using ``partial_fit``.
+"""
+
+import numpy as np
+
+__all__ = ['Classifier']
+
+
+# Scheme names, as accepted by the ``scheme`` parameter of the plot types, mapped to their canonical form.
+_SCHEMES = {
+    'quantiles': 'Quantiles',
+    'equal_interval': 'Equal_interval',
+    'fisher_jenks': 'Fisher_Jenks'
+}
+
+
+class Classifier:
+    """
+    A classification scheme, fit to a data column, which assigns each value of it to one of at most ``k`` ordinal
+    classes.
+
+    Properties
+    ----------
+    scheme : str
+        One of ``Quantiles``, ``Equal_interval``, or ``Fisher_Jenks``.
+    k : int
+        The number of classes requested. Quantile and Fisher-Jenks classification of data with few distinct values
+        may produce fewer.
+    sample : int or None
+        The maximum number of values retained for computing bin edges. If None, every value is retained.
+    bins : ndarray
+        The upper edge of each class. The last edge is the maximum of the data the classifier was fit to. Computed
+        the first time it is accessed after fitting.
+    min, max : float
+        The extrema of the data the classifier was fit to. These are exact, even when bin edges are computed from a
+        sample.
+    n : int
+        The number of values the classifier was fit to.
+    gvf : float
+        The goodness of variance fit of the classification to the values retained for computing bin edges (every
+        value fit, unless ``sample`` is set, in which case only the sample): one minus the ratio of the squared
+        deviations of values from the means of their classes to their squared deviations from the overall mean. Use
+        ``score`` to evaluate the classification on other values, such as the full dataset.
+    gvf_exact : float
+        The goodness of variance fit of the exact Fisher-Jenks breaks into ``k`` classes of the same retained values,
+        whatever the ``scheme``. No classification into ``k`` classes fits better, so comparing this with ``gvf``
+        measures what the scheme, or the approximation of a sampled or reduced ``resolution`` classifier, cost. This
+        takes time quadratic in the number of distinct retained values, so it is only practical for a few thousand.
+    """
+    def __init__(self, scheme='Quantiles', k=5, sample=None, resolution=2000, random_state=None):
+        """
+        Instantiation method.
+
+        Parameters
+        ----------
+        scheme : {"Quantiles"|"Equal_interval"|"Fisher_Jenks"}, optional
+            The binning scheme. Case insensitive. Defaults to ``Quantiles``.
+        k : int, optional
+            The number of classes. Defaults to 5.
+        sample : int, optional
+            If specified, bin edges are computed from a uniform random sample of at most this many values, kept by
+            reservoir sampling, rather than from every value fit. Recommended for large datasets: exact Fisher-Jenks
+            classification scales quadratically with the number of distinct values.
+        resolution : int or None, optional
+            Fisher-Jenks only. Data with more than this many distinct values, 2000 by default, is compressed into
+            this many strata before being classified, and breaks are only placed between strata; this bounds the
+            running time regardless of the size of the data. Higher values are slower, and closer to exact. Set to
+            None to always compute exact breaks. Compare ``gvf`` with ``gvf_exact`` to see the fit given up.
+        random_state : int or ``numpy.random.RandomState``, optional
+            Seeds the sampling, for reproducible bin edges.
+
+        Returns
+        -------
+        An unfitted ``Classifier`` instance.
+        """
+        if scheme.lower() not in _SCHEMES:
+            raise ValueError("Invalid scheme {0!r}: expected one of {1}.".format(
+                scheme, ', '.join(sorted(_SCHEMES.values()))))
+        if k < 1:
+            raise ValueError("Invalid k {0}: at least one class is required.".format(k))
+        if sample is not None and sample < k:
+            raise ValueError("Invalid sample size {0}: it must be at least k.".format(sample))
+        if resolution is not None and resolution < 2 * k:
+            raise ValueError("Invalid resolution {0}: it must be at least twice k.".format(resolution))
+        self.scheme = _SCHEMES[scheme.lower()]
+        self.k = k
+        self.sample = sample
+        self.resolution = resolution
+        if isinstance(random_state, np.random.RandomState):
+            self._rng = random_state
+        else:
+            self._rng = np.random.RandomState(random_state)
+        self._reset()
+
+    def _reset(self):
+        self.n = 0
+        self.min = self.max = np.nan
+        self._chunks = []
+        self._reservoir = None
+        self._bins = None
+        self._gvf_exact = None
+
+    def fit(self, values):
+        """
+        Fits the classifier to a data column, discarding anything it was fit to before.
+
+        Parameters
+        ----------
+        values : iterable
+            The data. Non-finite values are ignored.
+
+        Returns
+        -------
+        The ``Classifier`` itself.
+        """
+        self._reset()
+        return self.partial_fit(values)
+
+    def partial_fit(self, values):
+        """
+        Fits the classifier to one more chunk of a data column, which may be too large to hold in memory at once.
+        Bin edges are recomputed the next time they are accessed. When ``sample`` is unset every chunk is retained,
+        so it is best set when streaming.
+
+        Parameters
+        ----------
+        values : iterable
+            The chunk. Non-finite values are ignored.
+
+        Returns
+        -------
+        The ``Classifier`` itself.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[np.isfinite(values)]
+        if len(values) == 0:
+            return self
+        self._bins = self._gvf_exact = None
+        self.min = np.nanmin([self.min, values.min()])
+        self.max = np.nanmax([self.max, values.max()])
+        seen, self.n = self.n, self.n + len(values)
+
+        if self.sample is None:
+            self._chunks.append(values)
+            return self
+
+        # Reservoir sampling (Algorithm R), vectorized over the chunk. The t-th value seen replaces a random entry of
+        # the reservoir with probability sample / (t + 1). Later values overwrite earlier ones landing on the same
+        # entry, just as they would if they were processed one at a time.
+        if self._reservoir is None:
+            self._reservoir = np.empty(0)
+        fill = min(self.sample - len(self._reservoir), len(values))
+        if fill > 0:
+            self._reservoir = np.concatenate([self._reservoir, values[:fill]])
+        rest = values[fill:]
+        if len(rest):
+            t = np.arange(seen + fill, self.n)
+            slots = (self._rng.random_sample(len(rest)) * (t + 1)).astype(np.int64)
+            replace = slots < self.sample
+            self._reservoir[slots[replace]] = rest[replace]
+        return self
+
+    @property
+    def bins(self):
+        if self.n == 0:
+            raise ValueError("This Classifier has not been fit to any data yet.")
+        if self._bins is None:
+            if self.sample is None:
+                if len(self._chunks) > 1:
+                    self._chunks = [np.concatenate(self._chunks)]
+                values = self._chunks[0]
+            else:
+                values = self._reservoir
+            if self.scheme == 'Fisher_Jenks':
+                self._bins = _fisher_jenks_bins(values, self.k, self.min, self.max, resolution=self.resolution)
+            else:
+                self._bins = _BIN_FUNCTIONS[self.scheme](values, self.k, self.min, self.max)
+        return self._bins
+
+    @property
+    def gvf(self):
+        bins = self.bins  # Computing the bins consolidates any retained chunks.
+        return _gvf(self._retained, np.minimum(np.searchsorted(bins, self._retained, side='left'), len(bins) - 1))
+
+    @property
+    def gvf_exact(self):
+        if self._gvf_exact is None:
+            self.bins  # Computing the bins consolidates any retained chunks.
+            values = self._retained
+            bins = _fisher_jenks_bins(values, self.k, self.min, self.max, resolution=None)
+            self._gvf_exact = _gvf(values, np.minimum(np.searchsorted(bins, values, side='left'), len(bins) - 1))
+        return self._gvf_exact
+
+    @property
+    def _retained(self):
+        return self._chunks[0] if self.sample is None else self._reservoir
+
+    def score(self, values):
+        """
+        Computes the goodness of variance fit of the classification to a data column, as ``gvf`` does for the values
+        retained. When ``sample`` is set, scoring the full dataset shows how well bin edges computed from the sample
+        fit all of it.
+
+        Parameters
+        ----------
+        values : iterable
+            The values being scored. Non-finite values are ignored.
+
+        Returns
+        -------
+        The goodness of variance fit, a float no greater than one.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[np.isfinite(values)]
+        if len(values) == 0:
+            raise ValueError("There are no finite values to score.")
+        return _gvf(values, self.classify(values))
+
+    def classify(self, values):
+        """
+        Assigns values to classes. Values equal to the upper edge of a class belong to that class. Values outside of
+        the range of the data the classifier was fit to are assigned to the lowest or the highest class. Missing (and
+        other non-finite) values, which the classifier ignores when fitting, are assigned to no class, -1.
+
+        Parameters
+        ----------
+        values : iterable
+            The values being classified.
+
+        Returns
+        -------
+        An integer ndarray of class indices, between 0 and ``len(bins) - 1``, or -1 for non-finite values.
+        """
+        bins = self.bins
+        values = np.asarray(values, dtype=float)
+        classes = np.minimum(np.searchsorted(bins, values, side='left'), len(bins) - 1)
+        classes[~np.isfinite(values)] = -1
+        return classes
+
+    @property
+    def categories(self):
+        """
+        Legend labels for each class, of the form ``"lower - upper"``.
+        """
+        edges = np.concatenate([[self.min], self.bins])
+        return ['{0:.2f} - {1:.2f}'.format(edges[i], edges[i + 1]) for i in range(len(edges) - 1)]
+
+    def __repr__(self):
+        return "Classifier(scheme={0!r}, k={1}, sample={2}, resolution={3})".format(
+            self.scheme, self.k, self.sample, self.resolution)
+
+
+def _quantile_bins(values, k, vmin, vmax):
+    bins = np.percentile(values, np.linspace(0, 100, k + 1)[1:])
+    bins[-1] = vmax
+    return np.unique(bins)
+
+
+def _equal_interval_bins(values, k, vmin, vmax):
+    bins = vmin + (vmax - vmin) * np.arange(1, k + 1) / k
+    bins[-1] = vmax
+    return np.unique(bins)
+
+
+def _fisher_jenks_bins(values, k, vmin, vmax, resolution=None):
+    """
+    Computes the Fisher-Jenks natural breaks of a data column: the ``k`` classes minimizing the total squared
+    deviation of each value from the mean of its class. Values are collapsed to their distinct values, weighted by
+    count, which gives the same optimum much faster on data with many repeated values.
+
+    If there are more than ``resolution`` distinct values, they are further compressed into ``resolution`` strata,
+    each represented by the mean of the values in it and weighted by their count, and breaks are only placed between
+    strata. Half of the stratum edges are spaced evenly over the range of the data and half are placed at its
+    quantiles, so that both sparse tails and dense modes are finely resolved.
+    """
+    uniques, counts = np.unique(values, return_counts=True)
+    counts = counts.astype(float)
+    if resolution is None or len(uniques) <= resolution:
+        stops = _jenks_breaks(uniques, counts, k)
+        bins = uniques[stops - 1]
+    else:
+        edges = np.unique(np.concatenate([
+            np.linspace(uniques[0], uniques[-1], resolution // 2 + 1),
+            np.percentile(values, np.linspace(0, 100, resolution - resolution // 2 + 1))
+        ]))
+        strata = np.clip(np.searchsorted(edges, uniques, side='right') - 1, 0, len(edges) - 2)
+        # Strata are contiguous runs of the sorted distinct values; drop the empty ones.
+        starts = np.flatnonzero(np.concatenate([[True], strata[1:] != strata[:-1]]))
+        weights = np.add.reduceat(counts, starts)
+        means = np.add.reduceat(counts * uniques, starts) / weights
+        tops = uniques[np.concatenate([starts[1:], [len(uniques)]]) - 1]
+        stops = _jenks_breaks(means, weights, k)
+        bins = tops[stops - 1]
+    bins[-1] = vmax
+    return bins
+
+
+def _jenks_breaks(values, weights, k):
+    """
+    The dynamic programme at the core of Fisher-Jenks classification, over sorted distinct ``values`` with the given
+    ``weights``. Runs in O(k n^2) time and O(k n) space in the number of distinct values ``n``.
+
+    Returns
+    -------
+    The end (exclusive) of each class, as an ndarray of at most ``k`` indices into ``values``.
+    """
+    n = len(values)
+    k = min(k, n)
+    # Centering the values keeps the sums of squares below from losing precision to cancellation.
+    values = values - np.average(values, weights=weights)
+    w = np.concatenate([[0], np.cumsum(weights)])
+    s1 = np.concatenate([[0], np.cumsum(weights * values)])
+    s2 = np.concatenate([[0], np.cumsum(weights * values ** 2)])
+
+    def ssd(starts, stop):
+        # The weighted sum of squared deviations of values[starts:stop] from their mean, for an array of starts.
+        sw = w[stop] - w[starts]
+        return (s2[stop] - s2[starts]) - (s1[stop] - s1[starts]) ** 2 / sw
+
+    # cost[j, i] is the least total deviation of the first i values split into j + 1 classes, and split[j, i] the
+    # start of the last of those classes.
+    cost = np.full((k, n + 1), np.inf)
+    split = np.zeros((k, n + 1), dtype=int)
+    cost[0, 1:] = ssd(np.zeros(n, dtype=int), np.arange(1, n + 1))
+    for j in range(1, k):
+        for i in range(j + 1, n + 1):
+            starts = np.arange(j, i)
+            candidates = cost[j - 1, starts] + ssd(starts, i)
+            best = np.argmin(candidates)
+            cost[j, i], split[j, i] = candidates[best], starts[best]
+
+    stops = [n]
+    for j in range(k - 1, 0, -1):
+        stops.append(split[j, stops[-1]])
+    return np.array(stops[::-1])
+
+
+def _gvf(values, classes):
+    """
+    The goodness of variance fit of a classification: one minus the ratio of the squared deviations of values from
+    their class means to their squared deviations from the overall mean.
+    """
+    sdam = ((values - values.mean()) ** 2).sum()
+    if sdam == 0:
+        return 1.0
+    counts = np.bincount(classes)
+    means = np.bincount(classes, weights=values) / np.maximum(counts, 1)
+    sdcm = ((values - means[classes]) ** 2).sum()
+    return 1 - sdcm / sdam
+
+
+_BIN_FUNCTIONS = {
+    'Quantiles': _quantile_bins,
+    'Equal_interval': _equal_interval_bins,
+    'Fisher_Jenks': _fisher_jenks_bins
+}
@@ -0,0 +1,837 @@
+"""
+This module implements a columnar geometry container, ``ColumnarGeometry``. Coordinates are held in contiguous
+``numpy`` arrays, and the nesting of geometries into parts and rings is expressed using integer offset arrays, following
+the GeoArrow memory layout (https://github.com/geoarrow/geoarrow).
+
+Plot types accept a ``ColumnarGeometry`` anywhere a ``GeoDataFrame`` is accepted. Data which is already held in array
+form (raw x and y coordinate arrays, or coordinate and offset buffers read out of Arrow) can thus be plotted without
+first being materialized into millions of ``shapely`` objects.
+"""
+
+import numpy as np
+import matplotlib as mpl
+import shapely.geometry
+from geoplot.parallel import chunk_bounds, parallel_map
+
+
+# The number of offset arrays needed to describe each geometry type, outermost first.
+_OFFSET_LEVELS = {
+    'Point': 0,
+    'MultiPoint': 1,
+    'LineString': 1,
+    'MultiLineString': 2,
+    'Polygon': 2,
+    'MultiPolygon': 3
+}
+
+
+class ColumnarGeometry:
+    """
+    A column of geometries of a single type stored as coordinate and offset arrays.
+
+    Properties
+    ----------
+    x, y : ndarray
+        Flat arrays of vertex coordinates, shared by every geometry in the column.
+    geom_type : str
+        One of ``Point``, ``MultiPoint``, ``LineString``, ``MultiLineString``, ``Polygon``, or ``MultiPolygon``.
+    offsets : tuple of ndarray
+        The GeoArrow offset arrays, outermost first. ``Point`` data has none; ``LineString`` and ``MultiPoint`` data
+        has one (geometry to coordinate); ``Polygon`` data has two (geometry to ring, ring to coordinate);
+        ``MultiLineString`` data has two (geometry to part, part to coordinate); and ``MultiPolygon`` data has three
+        (geometry to polygon, polygon to ring, ring to coordinate).
+    data : DataFrame or None
+        Attribute columns, one row per geometry. String ``hue``, ``scale``, and ``by`` parameters are looked up here.
+    crs : None or object
+        The coordinate reference system of the coordinates, in any form ``pyproj.CRS.from_user_input`` accepts (as
+        with the ``crs`` of a ``GeoDataFrame``), or None if they are in longitude and latitude.
+    """
+    def __init__(self, x, y, geom_type='Point', offsets=(), data=None, crs=None):
+        """
+        Instantiation method. Inputs are used as-is wherever possible: no copy is made of coordinate or offset arrays
+        which are already ``numpy`` arrays of an appropriate type.
+
+        Parameters
+        ----------
+        x, y : array-like
+            Flat arrays of vertex coordinates.
+        geom_type : str, optional
+            The geometry type. Defaults to ``Point``.
+        offsets : tuple of array-like, optional
+            The GeoArrow offset arrays, outermost first. Must be empty if ``geom_type`` is ``Point``.
+        data : DataFrame, optional
+            Attribute columns, one row per geometry.
+        crs : optional
+            The coordinate reference system of the coordinates. Defaults to None, longitude and latitude.
+
+        Returns
+        -------
+        A ``ColumnarGeometry`` instance.
+        """
+        if geom_type not in _OFFSET_LEVELS:
+            raise ValueError("Unsupported geometry type '{0}'; expected one of {1}.".format(
+                geom_type, ', '.join(_OFFSET_LEVELS)))
+        if len(offsets) != _OFFSET_LEVELS[geom_type]:
+            raise ValueError("'{0}' geometries require {1} offset arrays, but {2} were provided.".format(
+                geom_type, _OFFSET_LEVELS[geom_type], len(offsets)))
+
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        if self.x.shape != self.y.shape or self.x.ndim != 1:
+            raise ValueError("The 'x' and 'y' coordinate arrays must be one-dimensional and of equal length.")
+        self.geom_type = geom_type
+        self.offsets = tuple(np.asarray(o) for o in offsets)
+        for o in self.offsets:
+            if not np.issubdtype(o.dtype, np.integer):
+                raise ValueError("Offset arrays must be integer arrays.")
+
+        if data is not None and len(data) != len(self):
+            raise ValueError("The 'data' input has {0} rows, but there are {1} geometries.".format(
+                len(data), len(self)))
+        self.data = data
+        self.crs = crs
+
+    @classmethod
+    def from_xy(cls, x, y, data=None, crs=None):
+        """
+        Creates a column of points from coordinate arrays.
+
+        Parameters
+        ----------
+        x, y : array-like
+            The point coordinates.
+        data : DataFrame, optional
+            Attribute columns, one row per point.
+        crs : optional
+            The coordinate reference system of the coordinates. Defaults to None, longitude and latitude.
+
+        Returns
+        -------
+        A ``ColumnarGeometry`` instance.
+        """
+        return cls(x, y, geom_type='Point', data=data, crs=crs)
+
+    @classmethod
+    def from_geoarrow(cls, geom_type, coords, offsets=(), data=None, crs=None):
+        """
+        Creates a column of geometries from GeoArrow-style buffers. This mirrors the argument signature of
+        ``shapely.from_ragged_array``.
+
+        Parameters
+        ----------
+        geom_type : str
+            The geometry type.
+        coords : (n, 2) array, (2n,) interleaved array, or (x, y) tuple of arrays
+            The vertex coordinates, in either the interleaved or the separated GeoArrow coordinate layout.
+        offsets : tuple of array-like, optional
+            The offset arrays, outermost first.
+        data : DataFrame, optional
+            Attribute columns, one row per geometry.
+        crs : optional
+            The coordinate reference system of the coordinates. Defaults to None, longitude and latitude.
+
+        Returns
+        -------
+        A ``ColumnarGeometry`` instance.
+        """
+        if isinstance(coords, tuple):
+            x, y = coords
+        else:
+            coords = np.asarray(coords, dtype=float)
+            if coords.ndim == 1:
+                coords = coords.reshape(-1, 2)
+            x, y = coords[:, 0], coords[:, 1]
+        return cls(x, y, geom_type=geom_type, offsets=offsets, data=data, crs=crs)
+
+    @classmethod
+    def from_geoseries(cls, geoms, data=None, crs=None):
+        """
+        Creates a column of geometries from ``shapely`` objects. Polygons and multipolygons are stored together as
+        ``MultiPolygon`` data, and linestrings and multilinestrings as ``MultiLineString`` data. Empty or missing
+        geometries are stored as empty entries.
+
+        Parameters
+        ----------
+        geoms : GeoSeries or iterable of shapely geometries
+            The geometries being converted.
+        data : DataFrame, optional
+            Attribute columns, one row per geometry.
+        crs : optional
+            The coordinate reference system of the coordinates. Defaults to the ``crs`` of ``geoms``, if it has one.
+
+        Returns
+        -------
+        A ``ColumnarGeometry`` instance.
+        """
+        if crs is None:
+            crs = getattr(geoms, 'crs', None)
+        geoms = list(geoms)
+        types = {g.geom_type for g in geoms if g is not None and not g.is_empty}
+        if types <= {'Point'}:
+            xs = np.array([np.nan if g is None or g.is_empty else g.x for g in geoms])
+            ys = np.array([np.nan if g is None or g.is_empty else g.y for g in geoms])
+            return cls(xs, ys, geom_type='Point', data=data, crs=crs)
+        elif types <= {'Polygon', 'MultiPolygon'}:
+            geom_type, depth = 'MultiPolygon', 2
+        elif types <= {'LineString', 'MultiLineString'}:
+            geom_type, depth = 'MultiLineString', 1
+        elif types <= {'Point', 'MultiPoint'}:
+            geom_type, depth = 'MultiPoint', 0
+        else:
+            raise ValueError("Cannot store a mix of {0} geometries in a single column.".format(
+                ', '.join(sorted(types))))
+
+        # Iterating over ``shapely`` objects holds the GIL, so large inputs are converted on separate processes.
+        bounds = chunk_bounds(len(geoms), min_chunk=2**14)
+        chunks = parallel_map(_build_coordinates, [(geoms[a:b], depth) for a, b in bounds], releases_gil=False)
+        coords = np.concatenate([coords for coords, _ in chunks])
+        counts = [np.concatenate([c[level] for _, c in chunks]) for level in range(depth + 1)]
+        offsets = tuple(np.concatenate([[0], np.cumsum(c, dtype=np.int64)]) for c in counts)
+        return cls(coords[:, 0], coords[:, 1], geom_type=geom_type, offsets=offsets, data=data, crs=crs)
+
+    def __len__(self):
+        return len(self.offsets[0]) - 1 if self.offsets else len(self.x)
+
+    def __getitem__(self, key):
+        if self.data is None:
+            raise KeyError("'{0}' was requested, but this ColumnarGeometry has no attribute data.".format(key))
+        return self.data[key]
+
+    def __repr__(self):
+        return "<ColumnarGeometry: {0} {1} geometries, {2} vertices>".format(len(self), self.geom_type, len(self.x))
+
+    def with_xy(self, x, y, crs=None):
+        """
+        Returns a copy of this column with its vertex coordinates replaced, e.g. by a projected version of themselves,
+        in the coordinate reference system ``crs`` (None being longitude and latitude). Offset arrays and attribute
+        data are shared with the original.
+        """
+        return ColumnarGeometry(x, y, geom_type=self.geom_type, offsets=self.offsets, data=self.data, crs=crs)
+
+    def coordinate_offsets(self):
+        """
+        Returns the offsets of each geometry's vertices into the ``x`` and ``y`` arrays, a ``len(self) + 1`` array.
+        """
+        if not self.offsets:
+            return np.arange(len(self.x) + 1)
+        o = self.offsets[0]
+        for level in self.offsets[1:]:
+            o = level[o]
+        return o
+
+    def ring_offsets(self):
+        """
+        Returns the offsets of each ring (or, for line data, each part) into the coordinate arrays, and a boolean
+        array flagging which rings are polygon exteriors.
+        """
+        if self.geom_type in ('Point', 'MultiPoint'):
+            raise ValueError("'{0}' geometries have no rings.".format(self.geom_type))
+        ro = self.offsets[-1]
+        exterior = np.zeros(len(ro) - 1, dtype=bool)
+        if self.geom_type in ('Polygon', 'MultiPolygon'):
+            po = self.offsets[-2]
+            starts = po[:-1][po[1:] > po[:-1]]
+            exterior[starts] = True
+        return ro, exterior
+
+    def bounds(self):
+        """
+        Returns the bounds of each geometry, as an ``(n, 4)`` array of ``(minx, miny, maxx, maxy)`` rows. Empty
+        geometries have ``nan`` bounds.
+        """
+        chunks = self._split()
+        if len(chunks) > 1:
+            return np.concatenate(parallel_map(ColumnarGeometry._bounds, [(chunk,) for _, _, chunk in chunks]))
+        return self._bounds()
+
+    def _bounds(self):
+        co = self.coordinate_offsets()
+        out = np.full((len(co) - 1, 4), np.nan)
+        nonempty = co[1:] > co[:-1]
+        if nonempty.any():
+            starts = co[:-1][nonempty]
+            out[nonempty, 0] = np.minimum.reduceat(self.x, starts)
+            out[nonempty, 1] = np.minimum.reduceat(self.y, starts)
+            out[nonempty, 2] = np.maximum.reduceat(self.x, starts)
+            out[nonempty, 3] = np.maximum.reduceat(self.y, starts)
+        return out
+
+    def total_bounds(self):
+        """
+        Returns the ``(minx, miny, maxx, maxy)`` bounds of the column as a whole.
+        """
+        co = self.coordinate_offsets()
+        xs, ys = self.x[co[0]:co[-1]], self.y[co[0]:co[-1]]
+        return np.nanmin(xs), np.nanmin(ys), np.nanmax(xs), np.nanmax(ys)
+
+    def centroid(self):
+        """
+        Returns the centroids of the geometries in the column, as a tuple of ``x`` and ``y`` arrays. Polygon
+        centroids are area-weighted, with holes subtracted. Lines and multipoints use the mean of their vertices.
+        """
+        if self.geom_type == 'Point':
+            return self.x, self.y
+        chunks = self._split()
+        if len(chunks) > 1:
+            centroids = parallel_map(ColumnarGeometry._centroid, [(chunk,) for _, _, chunk in chunks])
+            return np.concatenate([xs for xs, _ in centroids]), np.concatenate([ys for _, ys in centroids])
+        return self._centroid()
+
+    def _centroid(self):
+        co = self.coordinate_offsets()
+        counts = np.diff(co)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean_x = _reduce_sum(self.x, co) / counts
+            mean_y = _reduce_sum(self.y, co) / counts
+        if self.geom_type not in ('Polygon', 'MultiPolygon'):
+            return mean_x, mean_y
+
+        # Ring centroids are the shoelace moments divided by the ring's signed area. Exterior rings add area and
+        # interior rings take it away, whatever their orientation.
+        ro, exterior = self.ring_offsets()
+        x, y = self.x, self.y
+        cross = self._shoelace_terms()
+        cx, cy = np.zeros(len(x)), np.zeros(len(y))
+        cx[:-1] = (x[:-1] + x[1:]) * cross[:-1]
+        cy[:-1] = (y[:-1] + y[1:]) * cross[:-1]
+        ring_area = _reduce_sum(cross, ro) / 2
+        sign = np.where(exterior, 1, -1) * np.sign(ring_area)
+
+        go = self._ring_geometry_offsets()
+        area = _reduce_sum(sign * ring_area, go)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            xs = _reduce_sum(sign * _reduce_sum(cx, ro) / 6, go) / area
+            ys = _reduce_sum(sign * _reduce_sum(cy, ro) / 6, go) / area
+        degenerate = ~(area > 0)
+        xs[degenerate], ys[degenerate] = mean_x[degenerate], mean_y[degenerate]
+        return xs, ys
+
+    def _shoelace_terms(self):
+        """
+        Returns the shoelace cross product of every vertex with its successor, zeroed out at the final vertex of each
+        ring so that consecutive rings are not joined together. Summing these terms over a ring gives twice its
+        signed area.
+        """
+        ro, _ = self.ring_offsets()
+        x, y = self.x, self.y
+        cross = np.zeros(len(x))
+        cross[:-1] = x[:-1] * y[1:] - x[1:] * y[:-1]
+        cross[ro[1:][ro[1:] > ro[:-1]] - 1] = 0
+        return cross
+
+    def _ring_geometry_offsets(self):
+        """
+        Returns the offsets of each geometry's rings (or parts) into the ring list.
+        """
+        o = self.offsets[0]
+        for level in self.offsets[1:-1]:
+            o = level[o]
+        return o
+
+    def _split(self):
+        """
+        Splits the column into contiguous chunks of geometries, for processing in parallel, as returned by
+        ``geoplot.parallel.chunk_bounds``. Chunks share their coordinates with the column. Returns a list of
+        ``(start, stop, chunk)`` tuples, holding just the column itself if it is too small to be worth splitting.
+        """
+        bounds = chunk_bounds(len(self), len(self.x))
+        if len(bounds) == 1:
+            return [(0, len(self), self)]
+        x, y = self.x, self.y
+        chunks = []
+        for start, stop in bounds:
+            lo, hi = start, stop
+            offsets = []
+            for o in self.offsets:
+                o = o[lo:hi + 1]
+                offsets.append(o - o[0])
+                lo, hi = o[0], o[-1]
+            chunks.append((start, stop, ColumnarGeometry(x[lo:hi], y[lo:hi], geom_type=self.geom_type,
+                                                         offsets=tuple(offsets))))
+        return chunks
+
+    def take(self, indices):
+        """
+        Returns a new column containing only the geometries at the given positions, in the given order.
+
+        Parameters
+        ----------
+        indices : array-like of int or bool
+            Positional indices, or a boolean mask, of the geometries to keep.
+
+        Returns
+        -------
+        A ``ColumnarGeometry`` instance.
+        """
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            indices = np.flatnonzero(indices)
+        data = self.data.iloc[indices] if self.data is not None else None
+
+        selection = indices
+        offsets = []
+        for o in self.offsets:
+            starts, stops = o[selection], o[selection + 1]
+            offsets.append(np.concatenate([[0], np.cumsum(stops - starts)]).astype(o.dtype))
+            selection = _ranges(starts, stops)
+        return ColumnarGeometry(self.x[selection], self.y[selection], geom_type=self.geom_type,
+                                offsets=tuple(offsets), data=data, crs=self.crs)
+
+    def scale(self, factors):
+        """
+        Scales each geometry about the center of its bounding box, the same origin used by
+        ``shapely.affinity.scale``.
+
+        Parameters
+        ----------
+        factors : float or array-like
+            The scale factor, or one scale factor per geometry.
+
+        Returns
+        -------
+        A ``ColumnarGeometry`` instance.
+        """
+        factors = np.broadcast_to(np.asarray(factors, dtype=float), (len(self),))
+        chunks = self._split()
+        if len(chunks) > 1:
+            return _concat(parallel_map(ColumnarGeometry._scale, [(chunk, factors[a:b]) for a, b, chunk in chunks]),
+                           data=self.data, crs=self.crs)
+        return self._scale(factors)
+
+    def _scale(self, factors):
+        b = self._bounds()
+        co = self.coordinate_offsets()
+        counts = np.diff(co)
+
+        # Vertices outside of the range covered by the offsets (if any) are left where they are.
+        f, cx, cy = np.ones(len(self.x)), np.zeros(len(self.x)), np.zeros(len(self.x))
+        f[co[0]:co[-1]] = np.repeat(factors, counts)
+        cx[co[0]:co[-1]] = np.repeat((b[:, 0] + b[:, 2]) / 2, counts)
+        cy[co[0]:co[-1]] = np.repeat((b[:, 1] + b[:, 3]) / 2, counts)
+        return self.with_xy(cx + (self.x - cx) * f, cy + (self.y - cy) * f, crs=self.crs)
+
+    def simplify(self, tolerance):
+        """
+        Drops the vertices of lines and polygons which are too close to their predecessors to be told apart at a
+        given scale. Vertices are bucketed into the cells of a grid of the given size, and runs of consecutive
+        vertices falling into the same cell are collapsed onto the first of them. The first and last vertices of every
+        ring and part are always kept, so rings stay closed, but rings smaller than a cell collapse to a sliver.
+        This is meant for drawing, not analysis: unlike ``shapely`` simplification it does not preserve validity.
+
+        Parameters
+        ----------
+        tolerance : float
+            The grid cell size. Point data, or a tolerance of zero, is returned as is.
+
+        Returns
+        -------
+        A ``ColumnarGeometry`` instance.
+        """
+        if self.geom_type in ('Point', 'MultiPoint') or not tolerance > 0:
+            return self
+        chunks = self._split()
+        if len(chunks) > 1:
+            return _concat(parallel_map(ColumnarGeometry._simplify, [(chunk, tolerance) for _, _, chunk in chunks]),
+                           data=self.data, crs=self.crs)
+        return self._simplify(tolerance)
+
+    def _simplify(self, tolerance):
+        x, y = self.x, self.y
+        cx, cy = np.floor(x / tolerance), np.floor(y / tolerance)
+        keep = np.ones(len(x), dtype=bool)
+        keep[1:] = (cx[1:] != cx[:-1]) | (cy[1:] != cy[:-1])
+        runs = self.offsets[-1]
+        nonempty = runs[1:] > runs[:-1]
+        keep[runs[:-1][nonempty]] = True
+        keep[runs[1:][nonempty] - 1] = True
+
+        positions = np.concatenate([[0], np.cumsum(keep)]).astype(runs.dtype)
+        return ColumnarGeometry(x[keep], y[keep], geom_type=self.geom_type,
+                                offsets=self.offsets[:-1] + (positions[runs],), data=self.data, crs=self.crs)
+
+    def paths(self):
+        """
+        Returns one ``matplotlib.path.Path`` per geometry, suitable for use in a ``PathCollection``. Polygon rings
+        are reoriented where necessary so that holes are rendered as holes.
+        """
+        if self.geom_type in ('Point', 'MultiPoint'):
+            raise ValueError("'{0}' geometries cannot be converted to paths.".format(self.geom_type))
+        ro, exterior = self.ring_offsets()
+        n = len(self.x)
+        order = np.arange(n)
+        codes = np.full(n, mpl.path.Path.LINETO, dtype=mpl.path.Path.code_type)
+        nonempty = ro[1:] > ro[:-1]
+        starts, stops = ro[:-1][nonempty], ro[1:][nonempty]
+        codes[starts] = mpl.path.Path.MOVETO
+
+        if self.geom_type in ('Polygon', 'MultiPolygon'):
+            codes[stops - 1] = mpl.path.Path.CLOSEPOLY
+            # matplotlib fills compound paths using the nonzero winding rule, so exteriors are made counterclockwise
+            # and holes clockwise.
+            area = _reduce_sum(self._shoelace_terms(), ro)
+            flip = (exterior & (area < 0)) | (~exterior & (area > 0))
+            flip = flip[nonempty]
+            if flip.any():
+                lengths = stops - starts
+                mask = np.repeat(flip, lengths)
+                order[mask] = np.repeat((starts + stops - 1)[flip], lengths[flip]) - order[mask]
+
+        vertices = np.column_stack([self.x[order], self.y[order]])
+        co = self.coordinate_offsets()
+        return [mpl.path.Path(vertices[s:e], codes[s:e]) for s, e in zip(co[:-1], co[1:])]
+
+    def to_geoseries(self):
+        """
+        Materializes the column as a list of ``shapely`` geometries. This is the inverse of ``from_geoseries``.
+
+        Returns
+        -------
+        list of shapely geometries
+        """
+        if self.geom_type == 'Point':
+            return [shapely.geometry.Point(x, y) for x, y in zip(self.x, self.y)]
+
+        coords = np.column_stack([self.x, self.y])
+
+        def build(level, start, stop):
+            o = self.offsets[level]
+            children = [(o[i], o[i + 1]) for i in range(start, stop)]
+            if level == len(self.offsets) - 1:
+                return [coords[s:e] for s, e in children]
+            return [build(level + 1, s, e) for s, e in children]
+
+        out = []
+        for members in build(0, 0, len(self)):
+            if self.geom_type == 'MultiPolygon':
+                out.append(shapely.geometry.MultiPolygon([(rs[0], rs[1:]) for rs in members if rs]))
+            elif self.geom_type == 'Polygon':
+                out.append(shapely.geometry.Polygon(members[0], members[1:]) if members else
+                           shapely.geometry.Polygon())
+            elif self.geom_type == 'MultiLineString':
+                out.append(shapely.geometry.MultiLineString(members))
+            elif self.geom_type == 'LineString':
+                out.append(shapely.geometry.LineString(members))
+            else:
+                out.append(shapely.geometry.MultiPoint(members))
+        return out
+
+
+class QuantizedGeometry(ColumnarGeometry):
+    """
+    A compact, read-only ``ColumnarGeometry``, for holding very large layers in memory. Coordinates are quantized to
+    integers on a grid spanning the bounds of the column, at a precision chosen to be finer than the output can
+    show. Line and polygon coordinates are then delta-encoded along each ring or part, where that takes less space,
+    and stored in the smallest integer type which holds them. Offsets are stored as ``int32``. Parcel-scale polygons
+    typically need a single byte per coordinate, an eighth of the size of the ``float64`` original.
+
+    The ``x`` and ``y`` coordinates are decoded whenever they are accessed, so every plot type accepts this anywhere a
+    ``ColumnarGeometry`` is accepted, while only the compact encoding stays resident in between renders. Decoded
+    coordinates are rounded to the quantization grid, which shared vertices of adjacent polygons snap to alike.
+
+    Properties
+    ----------
+    x, y : ndarray
+        The decoded vertex coordinates.
+    geom_type, offsets, data, crs
+        As for ``ColumnarGeometry``.
+    resolution : int
+        The number of quantization steps spanning the longer side of the bounds of the column.
+    nbytes : int
+        The memory taken up by the coordinates and offsets.
+    """
+    def __init__(self, x, y, geom_type='Point', offsets=(), data=None, resolution=None, crs=None):
+        """
+        Instantiation method. Quantizes and encodes the given coordinates.
+
+        Parameters
+        ----------
+        x, y, geom_type, offsets, data, crs
+            As for ``ColumnarGeometry``.
+        resolution : int, optional
+            The number of quantization steps spanning the longer side of the bounds of the column. Defaults to eight
+            steps per pixel of the longer side of a default-sized figure, at the resolution it is saved at. Plots
+            zooming in on a fraction of the data need a proportionally higher resolution.
+
+        Returns
+        -------
+        A ``QuantizedGeometry`` instance.
+        """
+        column = ColumnarGeometry(x, y, geom_type=geom_type, offsets=offsets, data=data, crs=crs)
+        self.geom_type, self.crs = column.geom_type, column.crs
+        self.offsets = tuple(o.astype(np.int32) for o in column.offsets)
+        self.data = column.data
+        self.resolution = int(resolution) if resolution is not None else _default_resolution()
+
+        x, y = column.x, column.y
+        missing = np.isnan(x) | np.isnan(y)
+        finite = ~missing
+        if finite.any():
+            xmin, ymin = x[finite].min(), y[finite].min()
+            span = max(x[finite].max() - xmin, y[finite].max() - ymin)
+        else:
+            xmin = ymin = span = 0.0
+        self._origin = (xmin, ymin)
+        self._step = span / self.resolution if span > 0 else 1.0
+        self._missing = np.packbits(missing) if missing.any() else None
+        self._length = len(x)
+
+        with np.errstate(invalid='ignore'):
+            qx = np.where(missing, 0, np.round((x - xmin) / self._step)).astype(np.int64)
+            qy = np.where(missing, 0, np.round((y - ymin) / self._step)).astype(np.int64)
+        self._encode(qx, qy)
+
+    @classmethod
+    def from_columnar(cls, geoms, resolution=None):
+        """
+        Creates a compact copy of a ``ColumnarGeometry``.
+
+        Parameters
+        ----------
+        geoms : ColumnarGeometry
+            The geometries being converted.
+        resolution : int, optional
+            The quantization resolution. See the class constructor.
+
+        Returns
+        -------
+        A ``QuantizedGeometry`` instance.
+        """
+        return cls(geoms.x, geoms.y, geom_type=geoms.geom_type, offsets=geoms.offsets, data=geoms.data,
+                   resolution=resolution, crs=geoms.crs)
+
+    @classmethod
+    def from_geoseries(cls, geoms, data=None, resolution=None, crs=None):
+        """
+        Creates a compact column of geometries from ``shapely`` objects. The inverse of ``to_geoseries``, up to
+        the quantization of the coordinates.
+
+        Parameters
+        ----------
+        geoms : GeoSeries or iterable of shapely geometries
+            The geometries being converted.
+        data : DataFrame, optional
+            Attribute columns, one row per geometry.
+        resolution : int, optional
+            The quantization resolution. See the class constructor.
+        crs : optional
+            The coordinate reference system of the coordinates. Defaults to the ``crs`` of ``geoms``, if it has one.
+
+        Returns
+        -------
+        A ``QuantizedGeometry`` instance.
+        """
+        return cls.from_columnar(ColumnarGeometry.from_geoseries(geoms, data=data, crs=crs), resolution=resolution)
+
+    def _runs(self):
+        """
+        Returns the offsets of the runs of coordinates which are delta-encoded together: the rings (or parts) of
+        line and polygon data.
+        """
+        if self.geom_type in ('Point', 'MultiPoint'):
+            return None
+        return self.offsets[-1]
+
+    def _encode(self, qx, qy):
+        """
+        Stores quantized coordinates, delta-encoded along each run if that allows a smaller integer type. The first
+        coordinate of every run is stored separately, as an anchor, and its delta is zero.
+        """
+        runs = self._runs()
+        if runs is not None and len(qx):
+            starts = runs[:-1][runs[1:] > runs[:-1]]
+            dx, dy = np.zeros(len(qx), dtype=np.int64), np.zeros(len(qy), dtype=np.int64)
+            dx[1:], dy[1:] = np.diff(qx), np.diff(qy)
+            dx[starts], dy[starts] = 0, 0
+            delta_type = _smallest_int_type(min(dx.min(), dy.min()), max(dx.max(), dy.max()))
+            if delta_type.itemsize < _smallest_int_type(0, self.resolution).itemsize:
+                self._deltas = True
+                self._qx, self._qy = dx.astype(delta_type), dy.astype(delta_type)
+                self._anchors = (qx[starts].astype(np.int32), qy[starts].astype(np.int32))
+                return
+        self._deltas = False
+        self._qx = qx.astype(_smallest_int_type(0, self.resolution))
+        self._qy = qy.astype(self._qx.dtype)
+        self._anchors = None
+
+    def _decode(self, q, anchors):
+        if not self._deltas:
+            return q.astype(np.int64)
+        runs = self._runs()
+        nonempty = runs[1:] > runs[:-1]
+        starts, lengths = runs[:-1][nonempty], (runs[1:] - runs[:-1])[nonempty]
+        total = np.cumsum(q, dtype=np.int64)
+        out = total.copy()
+        out[runs[0]:runs[-1]] -= np.repeat(total[starts] - anchors, lengths)
+        return out
+
+    def _dequantize(self, q, origin):
+        values = origin + q * self._step
+        if self._missing is not None:
+            values[np.unpackbits(self._missing, count=self._length).astype(bool)] = np.nan
+        return values
+
+    @property
+    def x(self):
+        return self._dequantize(self._decode(self._qx, self._anchors[0] if self._deltas else None), self._origin[0])
+
+    @property
+    def y(self):
+        return self._dequantize(self._decode(self._qy, self._anchors[1] if self._deltas else None), self._origin[1])
+
+    @property
+    def nbytes(self):
+        arrays = [self._qx, self._qy] + list(self.offsets) + (list(self._anchors) if self._deltas else [])
+        if self._missing is not None:
+            arrays.append(self._missing)
+        return sum(arr.nbytes for arr in arrays)
+
+    def __repr__(self):
+        return "<QuantizedGeometry: {0} {1} geometries, {2} vertices, {3} bytes>".format(
+            len(self), self.geom_type, self._length, self.nbytes)
+
+    def take(self, indices):
+        """
+        Returns a new compact column containing only the geometries at the given positions, in the given order.
+        Unlike the other methods returning new columns, this does not decode the coordinates.
+
+        Parameters
+        ----------
+        indices : array-like of int or bool
+            Positional indices, or a boolean mask, of the geometries to keep.
+
+        Returns
+        -------
+        A ``QuantizedGeometry`` instance.
+        """
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            indices = np.flatnonzero(indices)
+        out = object.__new__(QuantizedGeometry)
+        out.geom_type, out.resolution, out.crs = self.geom_type, self.resolution, self.crs
+        out._origin, out._step, out._deltas = self._origin, self._step, self._deltas
+        out.data = self.data.iloc[indices] if self.data is not None else None
+
+        selection, run_selection = indices, None
+        offsets = []
+        for o in self.offsets:
+            starts, stops = o[selection], o[selection + 1]
+            offsets.append(np.concatenate([[0], np.cumsum(stops - starts)]).astype(np.int32))
+            run_selection, selection = selection, _ranges(starts, stops)
+        out.offsets = tuple(offsets)
+        out._qx, out._qy = self._qx[selection], self._qy[selection]
+        if self._deltas:
+            # Empty runs have no anchor, so anchors are indexed by their position among the non-empty runs.
+            runs = self._runs()
+            position = np.cumsum(runs[1:] > runs[:-1]) - 1
+            kept = run_selection[runs[run_selection + 1] > runs[run_selection]]
+            out._anchors = (self._anchors[0][position[kept]], self._anchors[1][position[kept]])
+        else:
+            out._anchors = None
+        out._length = len(selection)
+        out._missing = None
+        if self._missing is not None:
+            missing = np.unpackbits(self._missing, count=self._length).astype(bool)[selection]
+            out._missing = np.packbits(missing) if missing.any() else None
+        return out
+
+
+def _default_resolution():
+    """
+    Returns the default quantization resolution of a ``QuantizedGeometry``: eight steps per pixel along the longer
+    side of a default-sized figure, at the resolution figures are saved at.
+    """
+    dpi = mpl.rcParams['savefig.dpi']
+    if dpi == 'figure':
+        dpi = mpl.rcParams['figure.dpi']
+    return int(max(mpl.rcParams['figure.figsize']) * dpi * 8)
+
+
+def _smallest_int_type(lo, hi):
+    """
+    Returns the smallest signed integer type which holds every integer between ``lo`` and ``hi``.
+    """
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def _build_coordinates(geoms, depth):
+    """
+    The core of ``ColumnarGeometry.from_geoseries``: gathers up the coordinates of a list of non-point geometries,
+    and the number of members of each geometry, part, and (for polygons) ring, outermost first. ``depth`` is 2 for
+    polygons, 1 for lines, and 0 for multipoints.
+    """
+    def parts(g):
+        if g is None or g.is_empty:
+            return []
+        return list(g.geoms) if g.geom_type.startswith('Multi') else [g]
+
+    def rings(p):
+        return [p.exterior] + list(p.interiors)
+
+    arrays = []
+    counts = [[] for _ in range(depth + 1)]
+    for g in geoms:
+        ps = parts(g)
+        counts[0].append(len(ps))
+        for p in ps:
+            if depth == 2:
+                rs = rings(p)
+                counts[1].append(len(rs))
+                for r in rs:
+                    arr = np.asarray(r.coords)[:, :2]
+                    counts[2].append(len(arr))
+                    arrays.append(arr)
+            elif depth == 1:
+                arr = np.asarray(p.coords)[:, :2]
+                counts[1].append(len(arr))
+                arrays.append(arr)
+            else:
+                arrays.append(np.asarray(p.coords)[:, :2])
+    coords = np.concatenate(arrays) if arrays else np.empty((0, 2))
+    return coords, [np.asarray(c, dtype=np.int64) for c in counts]
+
+
+def _concat(columns, data=None, crs=None):
+    """
+    Joins columns of the same geometry type, whose offsets start at zero and cover all of their coordinates (as the
+    chunks returned by ``ColumnarGeometry._split`` do), back together.
+    """
+    first = columns[0]
+    offsets = []
+    for level in range(len(first.offsets)):
+        parts, shift = [], 0
+        for column in columns:
+            o = column.offsets[level]
+            parts.append(o[:-1] + shift)
+            shift += o[-1]
+        offsets.append(np.concatenate(parts + [[shift]]).astype(first.offsets[level].dtype))
+    return ColumnarGeometry(np.concatenate([c.x for c in columns]), np.concatenate([c.y for c in columns]),
+                            geom_type=first.geom_type, offsets=tuple(offsets), data=data, crs=crs)
+
+
+def _ranges(starts, stops):
+    """
+    Returns the concatenation of ``np.arange(start, stop)`` over the given start and stop arrays, without a Python
+    loop.
+    """
+    lengths = stops - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    shifts = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return shifts + np.arange(total)
+
+
+def _reduce_sum(values, offsets):
+    """
+    Sums ``values`` over each ``[offsets[i], offsets[i + 1])`` slice. Empty slices sum to zero.
+    """
+    out = np.zeros(len(offsets) - 1)
+    nonempty = offsets[1:] > offsets[:-1]
+    if nonempty.any():
+        # ``reduceat`` sums each slice up to the next start index, and the final slice up to the end of the array.
+        out[nonempty] = np.add.reduceat(values[:offsets[-1]], offsets[:-1][nonempty])
+    return out
@@ -3,44 +3,98 @@ This module defines the majority of geoplot functions, including all plot types.
 """
 
 import geopandas as gpd
-from geopandas.plotting import __pysal_choro, norm_cmap
+from geopandas.plotting import norm_cmap
 import matplotlib.pyplot as plt
 import matplotlib as mpl
 import numpy as np
 from cartopy.feature import ShapelyFeature
 import cartopy.crs as ccrs
+import pyproj
 import warnings
-from geoplot.quad import QuadTree
+import itertools
+import logging
+import functools
+from geoplot.quad import QuadTree, cached_quadtree, _geometry_hash
+from geoplot.topology import cached_topology
+from geoplot.columnar import ColumnarGeometry
+from geoplot.cache import IdentityCache
+from geoplot.classify import Classifier
+from geoplot.scales import linear_scale, is_vectorized
+from geoplot.bundle import bundle_edges
+from geoplot.lod import LevelOfDetail
+from geoplot.parallel import chunk_bounds, parallel_map
+from geoplot.kde import KDEGrid
 import shapely.geometry
+import shapely.ops
 import pandas as pd
 import descartes
 
+_log = logging.getLogger(__name__)
+
+# The feature and vertex counts above which data collections are rasterized. See ``set_rasterization_thresholds``.
+_RASTERIZATION_THRESHOLDS = {'features': None, 'vertices': None}
+
+# The margin kept around the view by level-of-detail layers, as a fraction of its width and height.
+_DETAIL_MARGIN = 0.1
+
+
+def set_rasterization_thresholds(features=None, vertices=None):
+    """
+    Sets the policy for automatically rasterizing the data drawn by ``pointplot`` and ``choropleth``. Vector outputs
+    (PDF, SVG) holding hundreds of thousands of features are huge and slow to open; once a plot draws more features,
+    or more vertices, than these thresholds, its points or polygons are drawn with ``rasterized=True``. Legends,
+    colorbars, and anything else drawn onto the plot stay vector. Each decision is logged to the ``geoplot.geoplot``
+    logger at the ``INFO`` level.
+
+    Passing ``rasterized=True`` or ``rasterized=False`` to a plot overrides the policy for that plot.
+
+    Parameters
+    ----------
+    features : int, optional
+        The number of features (points or polygons) drawn above which a plot is rasterized. Defaults to None, which
+        disables this threshold.
+    vertices : int, optional
+        The number of vertices drawn above which a plot is rasterized. Defaults to None, which disables this
+        threshold.
+
+    Returns
+    -------
+    None
+    """
+    _RASTERIZATION_THRESHOLDS['features'] = features
+    _RASTERIZATION_THRESHOLDS['vertices'] = vertices
+
 
 def pointplot(df, projection=None,
               hue=None, categorical=False, scheme=None, k=5, cmap='Set1', vmin=None, vmax=None,
               scale=None, limits=(0.5, 2), scale_func=None,
               legend=False, legend_values=None, legend_labels=None, legend_kwargs=None, legend_var=None,
-              figsize=(8, 6), extent=None, ax=None, **kwargs):
+              raster=False, gridsize=256, lod=False,
+              figsize=(8, 6), extent=None, cull_margin=0.1, ax=None, **kwargs):
     """
     A geospatial scatter plot. The simplest useful plot type available.
 
     Parameters
     ----------
-    df : GeoDataFrame
-        The data being plotted.
+    df : GeoDataFrame or ColumnarGeometry, or an iterator of these
+        The data being plotted. An iterator of chunks (e.g. a generator wrapping a ``pandas.read_csv(...,
+        chunksize=...)`` reader) is streamed onto a raster grid, so that the data never has to be held in memory all
+        at once. In this case ``hue``, if specified, must be the name of a column.
     projection : geoplot.crs object instance, optional
         A geographic projection. Must be an instance of an object in the ``geoplot.crs`` module,
         e.g. ``geoplot.crs.PlateCarree()``. This parameter is optional: if left unspecified, a pure unprojected
         ``matplotlib`` object will be returned. For more information refer to the tutorial page on `projections
-        <http://localhost:63342/geoplot/docs/_build/html/tutorial/projections.html>`_.
+        <http://localhost:63342/geoplot/docs/_build/html/tutorial/projections.html>`_. Data is reprojected from its
+        ``crs``, if it has one, and is otherwise assumed to be in longitude and latitude.
     hue : None, Series, GeoSeries, iterable, or str, optional
         A data column whose values are to be colorized. Defaults to None, in which case no colormap will be applied.
     categorical : boolean, optional
         Specify this variable to be ``True`` if ``hue`` points to a categorical variable. Defaults to False. Ignored
         if ``hue`` is set to None or not specified.
-    scheme : None or {"Quantiles"|"Equal_interval"|"Fisher_Jenks"}, optional
+    scheme : None or {"Quantiles"|"Equal_interval"|"Fisher_Jenks"} or Classifier, optional
         The scheme which will be used to determine categorical bins for the ``hue`` choropleth. If ``hue`` is
-        left unspecified or set to None this variable is ignored.
+        left unspecified or set to None this variable is ignored. Pass the same ``geoplot.Classifier`` to several
+        plots to have them share bins, colors, and legend; if it has not been fit yet, it is fit to this ``hue``.
     k : int or None, optional
         If ``hue`` is specified and ``categorical`` is False, this number, set to 5 by default, will determine how
         many bins will exist in the output visualization. If ``hue`` is specified and this variable is set to
@@ -64,7 +118,9 @@ def pointplot(df, projection=None,
     scale_func : ufunc, optional
         The function used to scale point sizes. This should be a factory function of two 
         variables, the minimum and maximum values in the dataset, which returns a scaling function which will be 
-        applied to the rest of the data. Defaults to a linear scale. A demo is available in the `example 
+        applied to the rest of the data. Defaults to a linear scale. Scaling functions marked with
+        ``geoplot.vectorized`` are applied to all of the data in a single call; ``geoplot.linear_scale``,
+        ``log_scale``, ``sqrt_scale`` and ``power_scale`` are built in. A demo is available in the `example
         gallery <examples/usa-city-elevations.html>`_.
     legend : boolean, optional
         Whether or not to include a legend in the output plot. This parameter will not work if neither ``hue`` nor
@@ -81,9 +137,25 @@ def pointplot(df, projection=None,
     legend_kwargs : dict, optional
         Keyword arguments to be passed to the underlying ``matplotlib.pyplot.legend`` instance (`ref
         <http://matplotlib.org/users/legend_guide.html>`_).
+    raster : boolean, optional
+        If True, the points are binned onto a grid which is drawn as a single image, colored by the number of
+        points in each cell or, if ``hue`` is specified, by their mean ``hue`` value. This is much faster than
+        drawing very many points individually. Defaults to False. Chunked input is always plotted this way.
+    gridsize : int or (int, int) tuple, optional
+        The number of raster cells along each axis. Ignored unless ``raster=True`` or the input is chunked. Defaults
+        to 256.
+    lod : boolean, optional
+        Whether or not to redraw the plot for the visible area whenever the axis is panned or zoomed, for interactive
+        use. Points outside of the view are dropped from the plot or, in raster mode, the points inside of it are
+        re-binned onto a grid covering just the view. Not supported for chunked input. Defaults to False. See
+        ``geoplot.LevelOfDetail``.
     extent : None or (minx, maxx, miny, maxy), optional
         If this parameter is unset ``geoplot`` will calculate the plot limits. If an extrema tuple is passed,
         that input will be used instead.
+    cull_margin : float or None, optional
+        If ``extent`` is specified, features falling wholly outside of it are discarded before any artists are
+        created. This parameter sets the margin kept around the extent, as a fraction of its width and height.
+        Defaults to 0.1. Set this to None to disable culling.
     figsize : tuple, optional
         An (x, y) tuple passed to ``matplotlib.figure`` which sets the size, in inches, of the resultant plot.
         Defaults to (8, 6), the ``matplotlib`` default global.
@@ -92,7 +164,9 @@ def pointplot(df, projection=None,
         will be graphed. If this parameter is left undefined a new axis will be created and used instead.
     kwargs: dict, optional
         Keyword arguments to be passed to the underlying ``matplotlib.pyplot.scatter`` instance (`ref
-        <http://matplotlib.org/api/pyplot_api.html#matplotlib.pyplot.scatter>`_).
+        <http://matplotlib.org/api/pyplot_api.html#matplotlib.pyplot.scatter>`_), or in raster mode to the
+        underlying ``matplotlib.pyplot.imshow`` instance. Pass ``rasterized`` to override the policy set by
+        ``geoplot.set_rasterization_thresholds``.
 
     Returns
     -------
@@ -291,18 +365,49 @@ def pointplot(df, projection=None,
 
     .. image:: ../figures/pointplot/pointplot-legend-var.png
 
+    Datasets too large to plot point-by-point (or to fit in memory) can be binned onto a raster grid instead,
+    using ``raster=True``. Passing an iterator of chunks streams them onto the grid one at a time, so that memory use
+    is bounded by the size of the grid rather than that of the data.
+
+    .. code-block:: python
+
+        chunks = (gplt.ColumnarGeometry.from_xy(c['LONGITUDE'], c['LATITUDE'], data=c)
+                  for c in pd.read_csv('collisions.csv', chunksize=10**6))
+        gplt.pointplot(chunks, projection=gcrs.AlbersEqualArea(),
+                       hue='NUMBER OF PERSONS INJURED', cmap='Reds', legend=True)
+
     """
+    # Chunked input is peeled apart into its first chunk, which stands in for the whole dataset when setting up the
+    # projection, and the rest of the stream.
+    chunks = None
+    if _is_chunked(df):
+        chunks = df
+        df = next(chunks, None)
+        if df is None:
+            raise ValueError("No data was provided.")
+        if isinstance(df, shapely.geometry.base.BaseGeometry):  # An iterator of points, not of chunks.
+            df, chunks = gpd.GeoSeries(list(itertools.chain([df], chunks))), None
+    if raster or chunks is not None:
+        if scale is not None:
+            raise ValueError("The 'scale' parameter is not supported in raster mode.")
+        if categorical:
+            raise ValueError("Categorical 'hue' data is not supported in raster mode.")
+        if chunks is not None and not (hue is None or isinstance(hue, str)):
+            raise ValueError("With chunked input the 'hue' parameter must be the name of a column.")
+        if chunks is not None and lod:
+            raise ValueError("The 'lod' parameter is not supported for chunked input, which can only be read once.")
+
     # Initialize the figure, if one hasn't been initialized already.
     fig = _init_figure(ax, figsize)
 
-    xs = np.array([p.x for p in df.geometry])
-    ys = np.array([p.y for p in df.geometry])
+    xs, ys = _get_xy(df)
+    crs = _get_crs(df)
 
     if projection:
         # Properly set up the projection.
         projection = projection.load(df, {
-            'central_longitude': lambda df: np.mean(np.array([p.x for p in df.geometry.centroid])),
-            'central_latitude': lambda df: np.mean(np.array([p.y for p in df.geometry.centroid]))
+            'central_longitude': lambda df: np.nanmean(_to_geographic(xs, ys, crs)[0]),
+            'central_latitude': lambda df: np.nanmean(_to_geographic(xs, ys, crs)[1])
         })
 
         # Set up the axis.
@@ -317,9 +422,27 @@ def pointplot(df, projection=None,
     else:
         ax = plt.subplot(111)
 
+        # Set extent.
+        if extent:
+            ax.set_xlim((extent[0], extent[1]))
+            ax.set_ylim((extent[2], extent[3]))
+
     # Clean up patches.
     _lay_out_axes(ax, projection)
 
+    # In raster mode the points are streamed onto a grid instead of being plotted one-by-one.
+    if raster or chunks is not None:
+        if hue is not None and not isinstance(hue, str):
+            hue = _validate_hue(df, hue)
+        image = _paint_raster(ax, projection, [df] if chunks is None else itertools.chain([df], chunks),
+                              hue, gridsize, extent, cmap, vmin, vmax, legend, legend_kwargs, crs=crs, **kwargs)
+        if lod and image is not None:
+            pxs, pys = _project_points(ax, xs, ys, crs=crs) if projection else (np.asarray(xs, dtype=float),
+                                                                                np.asarray(ys, dtype=float))
+            weights = None if hue is None else np.asarray(_validate_hue(df, hue), dtype=float)
+            _paint_detailed_raster(ax, image, pxs, pys, weights, gridsize)
+        return ax
+
     # Validate hue input.
     hue = _validate_hue(df, hue)
 
@@ -338,57 +461,45 @@ def pointplot(df, projection=None,
 
         if hue is not None:
             cmap, categories, hue_values = _discrete_colorize(categorical, hue, scheme, k, cmap, vmin, vmax)
-            colors = [cmap.to_rgba(v) for v in hue_values]
+            colors = cmap.to_rgba(np.asarray(hue_values))
 
             # Add a legend, if appropriate.
             if legend and (legend_var != "scale" or scale is None):
                 _paint_hue_legend(ax, categories, cmap, legend_labels, legend_kwargs)
-        else:
-            if 'color' not in kwargs.keys():
-                colors = ['steelblue']*len(df)
-            else:
-                colors = [kwargs['color']]*len(df)
-                kwargs.pop('color')
     elif k is None and hue is not None:
         # Continuous colormap code path.
         hue_values = hue
         cmap = _continuous_colormap(hue_values, cmap, vmin, vmax)
-        colors = [cmap.to_rgba(v) for v in hue_values]
+        colors = cmap.to_rgba(np.asarray(hue_values))
 
         # Add a legend, if appropriate.
         if legend and (legend_var != "scale" or scale is None):
             _paint_colorbar_legend(ax, hue_values, cmap, legend_kwargs)
+    if hue is None:
+        # Uniformly colored markers are passed as a single color, which ``matplotlib`` draws much faster.
+        colors = np.array([mpl.colors.to_rgba(kwargs.pop('color', 'steelblue'))])
+
+    # On a map, the points are projected onto the axis once and in bulk, and drawn in its native coordinates. This
+    # spares ``cartopy`` from transforming every point again on every redraw.
+    if projection:
+        pxs, pys = _project_points(ax, xs, ys, crs=crs)
+    else:
+        pxs, pys = np.asarray(xs), np.asarray(ys)
 
     # Check if the ``scale`` parameter is filled, and use it to fill a ``values`` name.
-    if scale:
-        if isinstance(scale, str):
-            scalar_values = df[scale]
-        else:
-            scalar_values = scale
-
-        # Compute a scale function.
-        dmin, dmax = np.min(scalar_values), np.max(scalar_values)
-        if not scale_func:
-            dslope = (limits[1] - limits[0]) / (dmax - dmin)
-            if np.isinf(dslope):  # Edge case: if dmax, dmin are <=10**-30 or so, will overflow and eval to infinity.
-                raise ValueError("The data range provided to the 'scale' variable is too small for the default "
-                                 "scaling function. Normalize your data or provide a custom 'scale_func'.")
-            dscale = lambda dval: limits[0] + dslope * (dval - dmin)
-        else:
-            dscale = scale_func(dmin, dmax)
+    scale = _validate_scale(df, scale)
+    order = None
+    if scale is not None:
+        scalar_values = scale
 
-        # Apply the scale function.
-        scalar_multiples = np.array([dscale(d) for d in scalar_values])
+        # Compute and apply a scale function.
+        dscale, scalar_multiples = _scale_values(scalar_values, limits, scale_func)
         sizes = scalar_multiples * 20
 
         # When a scale is applied, large points will tend to obfuscate small ones. Bringing the smaller
         # points to the front (by plotting them last) is a necessary intermediate step, which is what this bit of
         # code does.
-        sorted_indices = np.array(sorted(enumerate(sizes), key=lambda tup: tup[1])[::-1])[:,0].astype(int)
-        xs = np.array(xs)[sorted_indices]
-        ys = np.array(ys)[sorted_indices]
-        sizes = np.array(sizes)[sorted_indices]
-        colors = np.array(colors)[sorted_indices]
+        order = _descending_order(sizes)
 
         # Draw a legend, if appropriate.
         if legend and (legend_var == "scale" or hue is None):
@@ -396,17 +507,31 @@ def pointplot(df, projection=None,
     else:
         sizes = kwargs.pop('s') if 's' in kwargs.keys() else 20
 
+    # Cull points falling outside of the plot extent. This is done after the colors and sizes are computed, so that
+    # these stay consistent with those of the full dataset. Level-of-detail layers cull to the view themselves.
+    cull_box = _get_cull_box(ax, projection, extent, cull_margin, crs=crs) if not lod else None
+    mask = _cull(df, cull_box, bounds=(xs, ys, xs, ys)) if cull_box is not None else None
+
+    # The sort and the cull are applied together, so that every per-point array is gathered at most once.
+    if order is not None or mask is not None:
+        index = mask if order is None else (order if mask is None else order[mask[order]])
+        pxs, pys = pxs[index], pys[index]
+        if hue is not None:
+            colors = colors[index]
+        if np.ndim(sizes):
+            sizes = np.asarray(sizes)[index]
+
     # Draw.
-    if projection:
-        ax.scatter(xs, ys, transform=ccrs.PlateCarree(), c=colors, s=sizes, **kwargs)
-    else:
-        ax.scatter(xs, ys, c=colors, s=sizes, **kwargs)
+    _apply_rasterization_policy('pointplot', kwargs, len(pxs), lambda: len(pxs))
+    collection = ax.scatter(pxs, pys, c=colors, s=sizes, **kwargs)
+    if lod:
+        _paint_detailed_points(ax, collection, pxs, pys, colors, sizes)
 
     return ax
 
 
 def polyplot(df, projection=None,
-             extent=None,
+             extent=None, cull_margin=0.1, clip_extent=False, topology=False,
              figsize=(8, 6), ax=None,
              edgecolor='black',
              facecolor='None', **kwargs):
@@ -416,16 +541,30 @@ def polyplot(df, projection=None,
 
     Parameters
     ----------
-    df : GeoDataFrame
+    df : GeoDataFrame or ColumnarGeometry
         The data being plotted.
     projection : geoplot.crs object instance, optional
         A geographic projection. Must be an instance of an object in the ``geoplot.crs`` module,
         e.g. ``geoplot.crs.PlateCarree()``. This parameter is optional: if left unspecified, a pure unprojected
         ``matplotlib`` object will be returned. For more information refer to the tutorial page on `projections
-        <http://localhost:63342/geoplot/docs/_build/html/tutorial/projections.html>`_.
+        <http://localhost:63342/geoplot/docs/_build/html/tutorial/projections.html>`_. Data is reprojected from its
+        ``crs``, if it has one, and is otherwise assumed to be in longitude and latitude.
     extent : None or (minx, maxx, miny, maxy), optional
         If this parameter is unset ``geoplot`` will calculate the plot limits. If an extrema tuple is passed,
         that input will be used instead.
+    cull_margin : float or None, optional
+        If ``extent`` is specified, features falling wholly outside of it are discarded before any artists are
+        created. This parameter sets the margin kept around the extent, as a fraction of its width and height.
+        Defaults to 0.1. Set this to None to disable culling.
+    clip_extent : boolean, optional
+        Whether or not to also clip features straddling the edge of the (margin-padded) ``extent`` to it. Defaults
+        to False.
+    topology : boolean or Topology, optional
+        Whether or not to draw polygon outlines as the arcs of a shared-boundary ``geoplot.Topology`` of ``df``,
+        which draws every border shared by adjacent polygons once instead of twice, as a single ``LineCollection``
+        on top of fills drawn without edges. Pass a prebuilt ``Topology`` of ``df`` to use it instead of building a
+        new one. Either way topologies are cached, so re-plotting the same (unmodified) ``df`` reuses them. Defaults
+        to False.
     figsize : tuple, optional
         An (x, y) tuple passed to ``matplotlib.figure`` which sets the size, in inches, of the resultant plot.
         Defaults to (8, 6), the ``matplotlib`` default global.
@@ -483,12 +622,13 @@ def polyplot(df, projection=None,
     fig = _init_figure(ax, figsize)
 
     # In this case we can return a `matplotlib` plot directly.
+    crs = _get_crs(df)
 
     if projection:
         # Properly set up the projection.
         projection = projection.load(df, {
-            'central_longitude': lambda df: np.mean(np.array([p.x for p in df.geometry.centroid])),
-            'central_latitude': lambda df: np.mean(np.array([p.y for p in df.geometry.centroid]))
+            'central_longitude': lambda df: np.nanmean(_get_centroids(df, crs)[0]),
+            'central_latitude': lambda df: np.nanmean(_get_centroids(df, crs)[1])
         })
 
         # Set up the axis.
@@ -502,16 +642,42 @@ def polyplot(df, projection=None,
     _lay_out_axes(ax, projection)
 
     # Set extent.
-    extrema = _get_envelopes_min_maxes(df.geometry.envelope.exterior)
-    _set_extent(ax, projection, extent, extrema)
-
-    # Finally we draw the features.
-    if projection:
-        for geom in df.geometry:
+    extrema = _get_extrema(df)
+    _set_extent(ax, projection, extent, extrema, crs=crs)
+
+    # The topology is built from (and cached with) the full dataset, before it is culled.
+    if topology is True:
+        topology = cached_topology(df)
+
+    # Cull (and optionally clip) features falling outside of the plot extent.
+    cull_box = _get_cull_box(ax, projection, extent, cull_margin, crs=crs)
+    if cull_box is not None:
+        df = _take(df, _cull(df, cull_box))
+    if projection and crs is not None and not isinstance(df, ColumnarGeometry):
+        # Data in a projected coordinate reference system is reprojected in bulk, straight onto the axis.
+        df = ColumnarGeometry.from_geoseries(df.geometry)
+    clip_box = cull_box if clip_extent else None
+    if clip_box is not None and not isinstance(df, ColumnarGeometry):
+        geoms = _clip_geometries(df.geometry, clip_box)
+    elif not isinstance(df, ColumnarGeometry):
+        geoms = df.geometry
+
+    # Finally we draw the features. With a topology, fills are drawn without edges, and skipped altogether if
+    # they are transparent, and outlines are drawn as its arcs afterwards.
+    if topology:
+        arc_kwargs = _split_outline_kwargs(kwargs, edgecolor)
+        edgecolor = 'none'
+    if topology and str(facecolor).lower() == 'none':
+        pass
+    elif isinstance(df, ColumnarGeometry):
+        _paint_columnar(ax, df, projection, clip_box=clip_box, crs=crs, facecolor=facecolor, edgecolor=edgecolor,
+                        **kwargs)
+    elif projection:
+        for geom in geoms:
             features = ShapelyFeature([geom], ccrs.PlateCarree())
             ax.add_feature(features, facecolor=facecolor, edgecolor=edgecolor, **kwargs)
     else:
-        for geom in df.geometry:
+        for geom in geoms:
             try:  # Duck test for MultiPolygon.
                 for subgeom in geom:
                     feature = descartes.PolygonPatch(subgeom, facecolor=facecolor, edgecolor=edgecolor, **kwargs)
@@ -519,6 +685,8 @@ def polyplot(df, projection=None,
             except (TypeError, AssertionError):  # Shapely Polygon.
                 feature = descartes.PolygonPatch(geom, facecolor=facecolor, edgecolor=edgecolor, **kwargs)
                 ax.add_patch(feature)
+    if topology:
+        _paint_arcs(ax, topology, projection, cull_box=cull_box, clip_box=clip_box, crs=crs, **arc_kwargs)
 
     return ax
 
@@ -527,7 +695,7 @@ def choropleth(df, projection=None,
                hue=None,
                scheme=None, k=5, cmap='Set1', categorical=False, vmin=None, vmax=None,
                legend=False, legend_kwargs=None, legend_labels=None,
-               extent=None,
+               extent=None, cull_margin=0.1, clip_extent=False, topology=False, lod=False,
                figsize=(8, 6), ax=None,
                **kwargs):
     """
@@ -535,21 +703,23 @@ def choropleth(df, projection=None,
 
     Parameters
     ----------
-    df : GeoDataFrame
+    df : GeoDataFrame or ColumnarGeometry
         The data being plotted.
     projection : geoplot.crs object instance, optional
         A geographic projection. Must be an instance of an object in the ``geoplot.crs`` module,
         e.g. ``geoplot.crs.PlateCarree()``. This parameter is optional: if left unspecified, a pure unprojected
         ``matplotlib`` object will be returned. For more information refer to the tutorial page on `projections
-        <http://localhost:63342/geoplot/docs/_build/html/tutorial/projections.html>`_.
+        <http://localhost:63342/geoplot/docs/_build/html/tutorial/projections.html>`_. Data is reprojected from its
+        ``crs``, if it has one, and is otherwise assumed to be in longitude and latitude.
     hue : None, Series, GeoSeries, iterable, or str
         A data column whose values are to be colorized. Defaults to None, in which case no colormap will be applied.
     categorical : boolean, optional
         Specify this variable to be ``True`` if ``hue`` points to a categorical variable. Defaults to False. Ignored
         if ``hue`` is set to None or not specified.
-    scheme : None or {"Quantiles"|"Equal_interval"|"Fisher_Jenks"}, optional
+    scheme : None or {"Quantiles"|"Equal_interval"|"Fisher_Jenks"} or Classifier, optional
         The scheme which will be used to determine categorical bins for the ``hue`` choropleth. If ``hue`` is
-        left unspecified or set to None this variable is ignored.
+        left unspecified or set to None this variable is ignored. Pass the same ``geoplot.Classifier`` to several
+        plots to have them share bins, colors, and legend; if it has not been fit yet, it is fit to this ``hue``.
     k : int or None, optional
         If ``categorical`` is False or left unspecified, this number, set to 5 by default, will determine how
         many bins will exist in the output visualization. If this variable is set to ``None``, a continuous colormap
@@ -577,6 +747,23 @@ def choropleth(df, projection=None,
     extent : None or (minx, maxx, miny, maxy), optional
         If this parameter is unset ``geoplot`` will calculate the plot limits. If an extrema tuple is passed,
         that input will be used instead.
+    cull_margin : float or None, optional
+        If ``extent`` is specified, features falling wholly outside of it are discarded before any artists are
+        created. This parameter sets the margin kept around the extent, as a fraction of its width and height.
+        Defaults to 0.1. Set this to None to disable culling.
+    clip_extent : boolean, optional
+        Whether or not to also clip features straddling the edge of the (margin-padded) ``extent`` to it. Defaults
+        to False.
+    topology : boolean or Topology, optional
+        Whether or not to draw polygon outlines as the arcs of a shared-boundary ``geoplot.Topology`` of ``df``,
+        which draws every border shared by adjacent polygons once instead of twice, as a single ``LineCollection``
+        on top of fills drawn without edges. Pass a prebuilt ``Topology`` of ``df`` to use it instead of building a
+        new one. Either way topologies are cached, so re-plotting the same (unmodified) ``df`` reuses them. Outlines are
+        black unless an ``edgecolor`` is given. Defaults to False.
+    lod : boolean, optional
+        Whether or not to redraw the plot for the visible area whenever the axis is panned or zoomed, for interactive
+        use. Features outside of the view are dropped from the plot, and the rest are simplified to the size of a
+        pixel. Defaults to False. See ``geoplot.LevelOfDetail``.
     figsize : tuple, optional
         An (x, y) tuple passed to ``matplotlib.figure`` which sets the size, in inches, of the resultant plot.
         Defaults to (8, 6), the ``matplotlib`` default global.
@@ -585,7 +772,8 @@ def choropleth(df, projection=None,
         will be graphed. If this parameter is left undefined a new axis will be created and used instead.
     kwargs: dict, optional
         Keyword arguments to be passed to the underlying ``matplotlib.patches.Polygon`` instances (`ref
-        <http://matplotlib.org/api/patches_api.html#matplotlib.patches.Polygon>`_).
+        <http://matplotlib.org/api/patches_api.html#matplotlib.patches.Polygon>`_). Pass ``rasterized`` to
+        override the policy set by ``geoplot.set_rasterization_thresholds``.
 
     Returns
     -------
@@ -700,11 +888,12 @@ def choropleth(df, projection=None,
     """
     # Initialize the figure.
     fig = _init_figure(ax, figsize)
+    crs = _get_crs(df)
 
     if projection:
         projection = projection.load(df, {
-            'central_longitude': lambda df: np.mean(np.array([p.x for p in df.geometry.centroid])),
-            'central_latitude': lambda df: np.mean(np.array([p.y for p in df.geometry.centroid]))
+            'central_longitude': lambda df: np.nanmean(_get_centroids(df, crs)[0]),
+            'central_latitude': lambda df: np.nanmean(_get_centroids(df, crs)[1])
         })
 
         # Set up the axis.
@@ -717,8 +906,8 @@ def choropleth(df, projection=None,
     _lay_out_axes(ax, projection)
 
     # Set extent.
-    extrema = _get_envelopes_min_maxes(df.geometry.envelope.exterior)
-    _set_extent(ax, projection, extent, extrema)
+    extrema = _get_extrema(df)
+    _set_extent(ax, projection, extent, extrema, crs=crs)
 
     # Format the data to be displayed for input.
     hue = _validate_hue(df, hue)
@@ -735,30 +924,59 @@ def choropleth(df, projection=None,
 
         if hue is not None:
             cmap, categories, hue_values = _discrete_colorize(categorical, hue, scheme, k, cmap, vmin, vmax)
-            colors = [cmap.to_rgba(v) for v in hue_values]
+            colors = cmap.to_rgba(np.asarray(hue_values))
 
             # Add a legend, if appropriate.
             if legend:
                 _paint_hue_legend(ax, categories, cmap, legend_labels, legend_kwargs)
-        else:
-            colors = ['steelblue']*len(df)
     elif k is None and hue is not None:
         # Continuous colormap code path.
         hue_values = hue
         cmap = _continuous_colormap(hue_values, cmap, vmin, vmax)
-        colors = [cmap.to_rgba(v) for v in hue_values]
+        colors = cmap.to_rgba(np.asarray(hue_values))
 
         # Add a legend, if appropriate.
         if legend:
             _paint_colorbar_legend(ax, hue_values, cmap, legend_kwargs)
 
-    # Draw the features.
-    if projection:
-        for color, geom in zip(colors, df.geometry):
+    # The topology is built from (and cached with) the full dataset, before it is culled.
+    if topology is True:
+        topology = cached_topology(df)
+
+    # Cull (and optionally clip) features falling outside of the plot extent. This is done after the colors are
+    # computed, so that the color scale stays that of the full dataset. Level-of-detail layers cull to the view
+    # themselves, but are still clipped to the extent.
+    cull_box = _get_cull_box(ax, projection, extent, cull_margin, crs=crs)
+    if cull_box is not None and not lod:
+        mask = _cull(df, cull_box)
+        df, colors = _take(df, mask), _take(colors, mask)
+    if (lod or projection and crs is not None) and not isinstance(df, ColumnarGeometry):
+        # Data in a projected coordinate reference system is reprojected in bulk, straight onto the axis.
+        df = ColumnarGeometry.from_geoseries(df.geometry)
+    clip_box = cull_box if clip_extent else None
+    if clip_box is not None and not isinstance(df, ColumnarGeometry):
+        geoms = _clip_geometries(df.geometry, clip_box)
+    elif not isinstance(df, ColumnarGeometry):
+        geoms = df.geometry
+
+    # Draw the features. With a topology, fills are drawn without edges, and outlines as its arcs afterwards.
+    if topology:
+        arc_kwargs = _split_outline_kwargs(kwargs, kwargs.pop('edgecolor', 'black'))
+        kwargs['edgecolor'] = 'none'
+    _apply_rasterization_policy('choropleth', kwargs, len(df),
+                                lambda: len(df.x) if isinstance(df, ColumnarGeometry) else _count_vertices(geoms))
+    if lod:
+        _paint_detailed_polygons(ax, df, colors, projection, clip_box=clip_box, crs=crs,
+                                 topology=topology or None, arc_kwargs=arc_kwargs if topology else None, **kwargs)
+        return ax
+    elif isinstance(df, ColumnarGeometry):
+        _paint_columnar(ax, df, projection, clip_box=clip_box, crs=crs, facecolor=colors, **kwargs)
+    elif projection:
+        for color, geom in zip(colors, geoms):
             features = ShapelyFeature([geom], ccrs.PlateCarree())
             ax.add_feature(features, facecolor=color, **kwargs)
     else:
-        for color, geom in zip(colors, df.geometry):
+        for color, geom in zip(colors, geoms):
             try:  # Duck test for MultiPolygon.
                 for subgeom in geom:
                     feature = descartes.PolygonPatch(subgeom, facecolor=color, **kwargs)
@@ -766,6 +984,8 @@ def choropleth(df, projection=None,
             except (TypeError, AssertionError):  # Shapely Polygon.
                 feature = descartes.PolygonPatch(geom, facecolor=color, **kwargs)
                 ax.add_patch(feature)
+    if topology:
+        _paint_arcs(ax, topology, projection, cull_box=cull_box, clip_box=clip_box, crs=crs, **arc_kwargs)
 
     return ax
 
@@ -775,10 +995,11 @@ def aggplot(df, projection=None,
             by=None,
             geometry=None,
             nmax=None, nmin=None, nsig=0,
+            kind='quad', gridsize=30, quadtree=None,
             agg=np.mean,
             cmap='viridis', vmin=None, vmax=None,
             legend=True, legend_kwargs=None,
-            extent=None,
+            extent=None, lod=False,
             figsize=(8, 6), ax=None,
             **kwargs):
     """
@@ -786,13 +1007,14 @@ def aggplot(df, projection=None,
 
     Parameters
     ----------
-    df : GeoDataFrame
+    df : GeoDataFrame or ColumnarGeometry
         The data being plotted.
     projection : geoplot.crs object instance, optional
         A geographic projection. Must be an instance of an object in the ``geoplot.crs`` module,
         e.g. ``geoplot.crs.PlateCarree()``. This parameter is optional: if left unspecified, a pure unprojected
         ``matplotlib`` object will be returned. For more information refer to the tutorial page on `projections
-        <http://localhost:63342/geoplot/docs/_build/html/tutorial/projections.html>`_.
+        <http://localhost:63342/geoplot/docs/_build/html/tutorial/projections.html>`_. Data is reprojected from its
+        ``crs``, if it has one, and is otherwise assumed to be in longitude and latitude.
     hue : None, Series, GeoSeries, iterable, or str, optional
         The data column whose entries are being discretely colorized. May be passed in any of a number of flexible
         formats. Defaults to None, in which case no colormap will be applied at all.
@@ -818,6 +1040,17 @@ def aggplot(df, projection=None,
         A floor on the number of observations in an aggregation that gets reported. Aggregations containing fewer than
         ``nsig`` points are not aggregated and are instead returned as white patches, indicative of their status as
         "empty" spaces. Defaults to 0.
+    kind : "quad" or "hex", optional
+        The kind of regions to aggregate by when ``by`` is not specified: either recursive quadtree rectangles
+        ("quad", the default) or the cells of a regular hexagonal grid ("hex").
+    gridsize : int, optional
+        This variable will only be used if the plot is functioning in hexagonal mode. It specifies the number of
+        hexagons spanning the width of the data. Defaults to 30.
+    quadtree : QuadTree, optional
+        This variable will only be used if the plot is functioning in quadtree mode. A prebuilt ``geoplot.QuadTree``
+        index of ``df``, to be used instead of building a new one (a ``ValueError`` is raised if it was built from
+        different data). Either way, quadtrees are cached, so re-plotting the same (unmodified) ``df`` with a
+        different ``hue``, ``agg`` or ``nsig`` does not rebuild or re-partition the tree.
     agg : function, optional
         The aggregation ufunc that will be applied to the ``numpy`` array of values for the variable of interest of
         observations inside of each quadrangle. Defaults to ``np.mean``.
@@ -845,6 +1078,12 @@ def aggplot(df, projection=None,
         If this parameter is set to None (default) this method will calculate its own cartographic display region. If
         an extrema tuple is passed---useful if you want to focus on a particular area, for example, or exclude certain
         outliers---that input will be used instead.
+    lod : boolean, optional
+        Whether or not to redraw the plot for the visible area whenever the axis is panned or zoomed, for interactive
+        use. In quadtree mode the tree is re-partitioned into finer cells the further in the view is zoomed, and in
+        hexagonal mode the visible points are re-binned into hexagons spanning the view. Only the cells inside of
+        the view are drawn, and colors keep the scale of the full plot. Not supported together with ``by``. Defaults
+        to False. See ``geoplot.LevelOfDetail``.
     ax : AxesSubplot or GeoAxesSubplot instance, optional
         A ``matplotlib.axes.AxesSubplot`` or ``cartopy.mpl.geoaxes.GeoAxesSubplot`` instance onto which this plot
         will be graphed. If this parameter is left undefined a new axis will be created and used instead.
@@ -918,6 +1157,14 @@ def aggplot(df, projection=None,
 
     You'll have to play around with these parameters to get the clearest picture.
 
+    Alternatively, specify ``kind='hex'`` to aggregate by the cells of a regular hexagonal grid instead, controlling
+    its resolution using ``gridsize``. This is much faster than building a quadtree, and works well on very large
+    datasets. If ``hue`` is left unspecified, the number of observations in each cell is plotted.
+
+    .. code-block:: python
+
+        gplt.aggplot(collisions, projection=gcrs.PlateCarree(), hue='LATDEP', kind='hex', gridsize=40)
+
     Usually, however, observations with a geospatial component will be provided with some form of spatial
     categorization. In the case of our collisions example, this comes in the form of a postal zip code. With the
     simple addition of this data column via the ``by`` parameter, our output changes radically, taking advantage of
@@ -986,13 +1233,21 @@ def aggplot(df, projection=None,
 
     .. image:: ../figures/aggplot/aggplot-legend-kwargs.png
     """
+    if kind not in ('quad', 'hex'):
+        raise ValueError("Invalid 'kind' {0}; expected 'quad' or 'hex'.".format(kind))
+    if kind == 'hex' and by is not None:
+        raise ValueError("The 'by' parameter cannot be combined with kind='hex'.")
+    if lod and by is not None:
+        raise ValueError("The 'lod' parameter cannot be combined with 'by'.")
+
     fig = _init_figure(ax, figsize)
+    crs = _get_crs(df)
 
     # Set up projection.
     if projection:
         projection = projection.load(df, {
-            'central_longitude': lambda df: np.mean(np.array([p.x for p in df.geometry.centroid])),
-            'central_latitude': lambda df: np.mean(np.array([p.y for p in df.geometry.centroid]))
+            'central_longitude': lambda df: np.nanmean(_get_centroids(df, crs)[0]),
+            'central_latitude': lambda df: np.nanmean(_get_centroids(df, crs)[1])
         })
 
         if not ax:
@@ -1003,15 +1258,43 @@ def aggplot(df, projection=None,
     # Clean up patches.
     _lay_out_axes(ax, projection)
 
-    # Upconvert input to a GeoDataFrame (necessary for quadtree comprehension).
-    df = gpd.GeoDataFrame(df, geometry=df.geometry)
+    if kind == 'hex':
+        # Hexagonal binning works on the coordinates of the observations (or, for non-point geometries, of their
+        # centroids) directly. Binning is done in the native coordinates of the axis, so that the cells are regular
+        # hexagons on the map.
+        xs, ys = _get_centroids(df)
+        hue_values = None if hue is None else np.asarray(_validate_hue(df, hue), dtype=float)
+        pxs, pys = _project_coords(ax, xs, ys, crs=crs) if projection else (xs, ys)
+        verts, counts, values = _hex_aggregate(pxs, pys, hue_values, gridsize, agg)
 
-    # Validate hue.
-    if not isinstance(hue, str):
-        hue_col = hash(str(hue))
-        df[hue_col] = _validate_hue(df, hue)
-    else:
-        hue_col = hue
+        # Generate colormap.
+        # If no cell holds more than ``nsig`` points every cell is blank, and the colormap and legend span the values
+        # of every cell instead.
+        significant = counts > nsig
+        scale_values = values[significant] if significant.any() else values
+        scale_values = scale_values[np.isfinite(scale_values)]
+        if len(scale_values) == 0:
+            scale_values = np.array([0., 1.])
+        cmap = _continuous_colormap(scale_values, cmap, vmin, vmax)
+        colors = cmap.to_rgba(values)
+        colors[~significant] = mpl.colors.to_rgba("white")
+
+        #  Draw.
+        collection = mpl.collections.PolyCollection(verts, facecolors=colors, **kwargs)
+        ax.add_collection(collection, autolim=False)
+
+        # Set extent.
+        extrema = (np.nanmin(xs), np.nanmax(xs), np.nanmin(ys), np.nanmax(ys))
+        _set_extent(ax, projection, extent, extrema, crs=crs)
+        if lod:
+            _paint_detailed_hexagons(ax, collection, np.asarray(pxs, dtype=float), np.asarray(pys, dtype=float),
+                                     hue_values, gridsize, agg, nsig, cmap)
+
+        # Append a legend, if appropriate.
+        if legend:
+            _paint_colorbar_legend(ax, scale_values, cmap, legend_kwargs)
+
+        return ax
 
     if geometry is not None and by is None:
         raise NotImplementedError("Aggregation by geometry alone is not currently implemented and unlikely to be "
@@ -1034,62 +1317,65 @@ def aggplot(df, projection=None,
             # Downconvert GeoDataFrame to GeoSeries objects.
             if isinstance(geometry, gpd.GeoDataFrame):
                 geometry = geometry.geometry
+            # The sectors are drawn in the coordinate reference system of the geometry, if it has one.
+            if getattr(geometry, 'crs', None):
+                crs = _get_crs(geometry)
+
+        # Validate hue.
+        hue = _validate_hue(df, hue)
+        if hue is None:
+            raise ValueError("No 'hue' specified.")
 
-        sectors = []
-        values = []
+        # Generators have no length, so they are read into an array.
+        by = _as_values(df[by] if isinstance(by, str) else by)
 
-        # The groupby operation does not take generators as inputs, so we duck test and convert them to lists.
-        if not isinstance(by, str):
-            try: len(by)
-            except TypeError: by = list(by)
+        # Label each observation with the (sorted) position of its group, as ``groupby`` would. Observations with a
+        # null group are dropped.
+        codes, labels = pd.factorize(by, sort=True)
+        grouped = codes >= 0
+        values = pd.Series(hue[grouped]).groupby(codes[grouped]).agg(agg).values
 
-        for label, p in df.groupby(by):
-            if geometry is not None:
+        if geometry is not None:
+            sectors = []
+            for label in labels:
                 try:
-                    sector = geometry.loc[label]
+                    sectors.append(geometry.loc[label])
                 except KeyError:
                     raise KeyError("Data contains a '{0}' label which lacks a corresponding value in the provided "
                                    "geometry.".format(label))
-            else:
-                xs = [c.x for c in p.geometry]
-                ys = [c.y for c in p.geometry]
-                coords = list(zip(xs, ys))
-                sector = shapely.geometry.MultiPoint(coords).convex_hull
-
-            sectors.append(sector)
-            values.append(agg(p[hue_col]))
+            areas = np.array([sector.area for sector in sectors])
+            bounds = np.array([sector.bounds for sector in sectors])
+        else:
+            xs, ys = _get_xy(df)
+            hulls, areas, bounds = _grouped_convex_hulls(xs, ys, codes, len(labels))
+            sectors = [shapely.geometry.Polygon(hull) if len(hull) > 2 else
+                       shapely.geometry.LineString(hull) if len(hull) == 2 else
+                       shapely.geometry.Point(hull[0]) if len(hull) == 1 else
+                       shapely.geometry.Polygon() for hull in hulls]
 
         # Because we have to set the extent ourselves, we have to do some bookkeeping to keep track of the
-        # extrema of the hulls we are generating.
-        bxmin = bxmax = bymin = bymax = None
-        if not extent:
-            for sector in sectors:
-                if not isinstance(sector.envelope, shapely.geometry.Point):
-                    hxmin, hxmax, hymin, hymax = _get_envelopes_min_maxes(pd.Series(sector.envelope.exterior))
-                    if not bxmin or hxmin < bxmin:
-                        bxmin = hxmin
-                    if not bxmax or hxmax > bxmax:
-                        bxmax = hxmax
-                    if not bymin or hymin < bymin:
-                        bymin = hymin
-                    if not bymax or hymax > bymax:
-                        bymax = hymax
+        # extrema of the hulls we are generating. Sectors which collapse to a single point are ignored.
+        extended = (bounds[:, 2] > bounds[:, 0]) | (bounds[:, 3] > bounds[:, 1])
+        if extended.any():
+            bxmin, bymin = np.nanmin(bounds[extended, :2], axis=0)
+            bxmax, bymax = np.nanmax(bounds[extended, 2:], axis=0)
+        else:
+            bxmin = bxmax = bymin = bymax = None
 
         # By often creates overlapping polygons, to keep smaller polygons from being hidden by possibly overlapping
         # larger ones we have to bring the smaller ones in front in the plotting order. This bit of code does that.
-        sorted_indices = np.array(sorted(enumerate(gpd.GeoSeries(sectors).area.values),
-                                         key=lambda tup: tup[1])[::-1])[:, 0].astype(int)
-        sectors = np.array(sectors)[sorted_indices]
-        values = np.array(values)[sorted_indices]
+        order = _descending_order(areas)
+        sectors = [sectors[i] for i in order]
+        values = np.asarray(values)[order]
 
         # Generate a colormap.
         cmap = _continuous_colormap(values, cmap, vmin, vmax)
-        colors = [cmap.to_rgba(value) for value in values]
+        colors = cmap.to_rgba(values)
 
         #  Draw.
         for sector, color in zip(sectors, colors):
             if projection:
-                features = ShapelyFeature([sector], ccrs.PlateCarree())
+                features = ShapelyFeature([sector], crs if crs is not None else ccrs.PlateCarree())
                 ax.add_feature(features, facecolor=color, **kwargs)
             else:
                 try:  # Duck test for MultiPolygon.
@@ -1102,46 +1388,61 @@ def aggplot(df, projection=None,
 
         # Set extent.
         extrema = (bxmin, bxmax, bymin, bymax)
-        _set_extent(ax, projection, extent, extrema)
+        _set_extent(ax, projection, extent, extrema, crs=crs)
 
     else:
+        hue = _validate_hue(df, hue)
+        if hue is None:
+            raise ValueError("No 'hue' specified.")
+
         # Set reasonable defaults for the n-params if appropriate.
         nmax = nmax if nmax else len(df)
         nmin = nmin if nmin else np.max([1, np.min([20, int(0.05 * len(df))])])
 
-        # Generate a quadtree.
-        quad = QuadTree(df)
-        bxmin, bxmax, bymin, bymax = quad.bounds
+        # Generate a quadtree, or reuse a cached one. Building and partitioning the tree is the expensive part of
+        # this plot type, while the aggregation below is cheap.
+        if quadtree is None:
+            quadtree = cached_quadtree(df)
+        elif quadtree._gdf is not df and (len(quadtree._gdf) != len(df) or
+                                          _geometry_hash(quadtree._gdf) != _geometry_hash(df)):
+            raise ValueError("The quadtree passed to 'quadtree' was built for different data than the plotted "
+                             "dataset. Build it from the same data with 'geoplot.QuadTree(df)'.")
+        bxmin, bxmax, bymin, bymax = quadtree.bounds
 
         # Assert that nmin is not smaller than the largest number of co-located observations (otherwise the algorithm
         # would continue running until the recursion limit).
-        max_coloc = np.max([len(l) for l in quad.agg.values()])
+        max_coloc = quadtree.max_colocated()
         if max_coloc > nmin:
             raise ValueError("nmin is set to {0}, but there is a coordinate containing {1} observations in the "
                              "dataset.".format(nmin, max_coloc))
 
         # Run the partitions.
-        # partitions = quad.partition(nmin, nmax)
-        partitions = list(quad.partition(nmin, nmax))
+        partitions = quadtree.partition(nmin, nmax)
 
         # Generate colormap.
-        values = [agg(p.data[hue_col]) for p in partitions if p.n > nsig]
+        aggregates = [agg(hue[p.indices]) if p.n > nsig else None for p in partitions]
+        values = [a for a, p in zip(aggregates, partitions) if p.n > nsig]
         cmap = _continuous_colormap(values, cmap, vmin, vmax)
 
-        for p in partitions:
-            xmin, xmax, ymin, ymax = p.bounds
-            rect = shapely.geometry.Polygon([(xmin, ymin), (xmin, ymax), (xmax, ymax), (xmax, ymin)])
-            color = cmap.to_rgba(agg(p.data[hue_col])) if p.n > nsig else "white"
-            if projection:
-                feature = ShapelyFeature([rect], ccrs.PlateCarree())
-                ax.add_feature(feature, facecolor=color, **kwargs)
-            else:
-                feature = descartes.PolygonPatch(rect, facecolor=color, **kwargs)
-                ax.add_patch(feature)
+        if lod:
+            # Level-of-detail layers are drawn for the view, so the extent is set first.
+            _set_extent(ax, projection, extent, (bxmin, bxmax, bymin, bymax), crs=crs)
+            _paint_detailed_quadtree(ax, quadtree, hue, nmin, nmax, nsig, agg, cmap, projection, crs=crs, **kwargs)
+        else:
+            for p, a in zip(partitions, aggregates):
+                xmin, xmax, ymin, ymax = p.bounds
+                rect = shapely.geometry.Polygon([(xmin, ymin), (xmin, ymax), (xmax, ymax), (xmax, ymin)])
+                color = cmap.to_rgba(a) if p.n > nsig else "white"
+                if projection:
+                    feature = ShapelyFeature([rect], crs if crs is not None else ccrs.PlateCarree())
+                    ax.add_feature(feature, facecolor=color, **kwargs)
+                else:
+                    feature = descartes.PolygonPatch(rect, facecolor=color, **kwargs)
+                    ax.add_patch(feature)
 
-        # Set extent.
-        extrema = (bxmin, bxmax, bymin, bymax)
-        _set_extent(ax, projection, extent, extrema)
+            # Set extent.
+            extrema = (bxmin, bxmax, bymin, bymax)
+            _set_extent(ax, projection, extent, extrema, crs=crs)
 
     # Append a legend, if appropriate.
     if legend:
@@ -1162,13 +1463,14 @@ def cartogram(df, projection=None,
 
     Parameters
     ----------
-    df : GeoDataFrame
+    df : GeoDataFrame or ColumnarGeometry
         The data being plotted.
     projection : geoplot.crs object instance, optional
         A geographic projection. Must be an instance of an object in the ``geoplot.crs`` module,
         e.g. ``geoplot.crs.PlateCarree()``. This parameter is optional: if left unspecified, a pure unprojected
         ``matplotlib`` object will be returned. For more information refer to the tutorial page on `projections
-        <http://localhost:63342/geoplot/docs/_build/html/tutorial/projections.html>`_.
+        <http://localhost:63342/geoplot/docs/_build/html/tutorial/projections.html>`_. Data is reprojected from its
+        ``crs``, if it has one, and is otherwise assumed to be in longitude and latitude.
     scale : str or iterable
         A data column whose values will be used to scale the points.
     limits : (min, max) tuple, optional
@@ -1176,7 +1478,9 @@ def cartogram(df, projection=None,
     scale_func : ufunc, optional
         The function used to scale point sizes. This should be a factory function of two 
         variables, the minimum and maximum values in the dataset, which returns a scaling function which will be 
-        applied to the rest of the data. Defaults to a linear scale. A demo is available in the `example 
+        applied to the rest of the data. Defaults to a linear scale. Scaling functions marked with
+        ``geoplot.vectorized`` are applied to all of the data in a single call; ``geoplot.linear_scale``,
+        ``log_scale``, ``sqrt_scale`` and ``power_scale`` are built in. A demo is available in the `example
         gallery <examples/usa-city-elevations.html>`_.
     trace : boolean, optional
         Whether or not to include a trace of the polygon's original outline in the plot result.
@@ -1188,9 +1492,10 @@ def cartogram(df, projection=None,
     categorical : boolean, optional
         Specify this variable to be ``True`` if ``hue`` points to a categorical variable. Defaults to False. Ignored
         if ``hue`` is set to None or not specified.
-    scheme : None or {"Quantiles"|"Equal_interval"|"Fisher_Jenks"}, optional
+    scheme : None or {"Quantiles"|"Equal_interval"|"Fisher_Jenks"} or Classifier, optional
         The scheme which will be used to determine categorical bins for the ``hue`` choropleth. If ``hue`` is
-        left unspecified or set to None this variable is ignored.
+        left unspecified or set to None this variable is ignored. Pass the same ``geoplot.Classifier`` to several
+        plots to have them share bins, colors, and legend; if it has not been fit yet, it is fit to this ``hue``.
     k : int or None, optional
         If ``hue`` is specified and ``categorical`` is False, this number, set to 5 by default, will determine how
         many bins will exist in the output visualization. If ``hue`` is specified and this variable is set to
@@ -1351,10 +1656,11 @@ def cartogram(df, projection=None,
     fig = _init_figure(ax, figsize)
 
     # Load the projection.
+    crs = _get_crs(df)
     if projection:
         projection = projection.load(df, {
-            'central_longitude': lambda df: np.mean(np.array([p.x for p in df.geometry.centroid])),
-            'central_latitude': lambda df: np.mean(np.array([p.y for p in df.geometry.centroid]))
+            'central_longitude': lambda df: np.nanmean(_get_centroids(df, crs)[0]),
+            'central_latitude': lambda df: np.nanmean(_get_centroids(df, crs)[1])
         })
 
         # Set up the axis.
@@ -1369,24 +1675,16 @@ def cartogram(df, projection=None,
     _lay_out_axes(ax, projection)
 
     # Set extent.
-    extrema = _get_envelopes_min_maxes(df.geometry.envelope.exterior)
-    _set_extent(ax, projection, extent, extrema)
+    extrema = _get_extrema(df)
+    _set_extent(ax, projection, extent, extrema, crs=crs)
 
     # Check that the ``scale`` parameter is filled, and use it to fill a ``values`` name.
-    if not scale:
+    values = _validate_scale(df, scale)
+    if values is None:
         raise ValueError("No scale parameter provided.")
-    elif isinstance(scale, str):
-        values = df[scale]
-    else:
-        values = scale
 
-    # Compute a scale function.
-    dmin, dmax = np.min(values), np.max(values)
-    if not scale_func:
-        dslope = (limits[1] - limits[0]) / (dmax - dmin)
-        dscale = lambda dval: limits[0] + dslope * (dval - dmin)
-    else:
-        dscale = scale_func(dmin, dmax)
+    # Compute and apply a scale function.
+    dscale, scale_factors = _scale_values(values, limits, scale_func)
 
     # Create a legend, if appropriate.
     if legend:
@@ -1403,26 +1701,27 @@ def cartogram(df, projection=None,
 
         if hue is not None:
             cmap, categories, hue_values = _discrete_colorize(categorical, hue, scheme, k, cmap, vmin, vmax)
-            colors = [cmap.to_rgba(v) for v in hue_values]
+            colors = cmap.to_rgba(np.asarray(hue_values))
 
             # Add a legend, if appropriate.
             if legend and (legend_var != "scale" or scale is None):
                 _paint_hue_legend(ax, categories, cmap, legend_labels, legend_kwargs)
-        else:
-            colors = ['None']*len(df)
     elif k is None and hue is not None:
         # Continuous colormap code path.
         hue_values = hue
         cmap = _continuous_colormap(hue_values, cmap, vmin, vmax)
-        colors = [cmap.to_rgba(v) for v in hue_values]
+        colors = cmap.to_rgba(np.asarray(hue_values))
 
         # Add a legend, if appropriate.
         if legend and (legend_var != "scale" or scale is None):
             _paint_colorbar_legend(ax, hue_values, cmap, legend_kwargs)
-    elif 'facecolor' in kwargs:
-        colors = [kwargs.pop('facecolor')]*len(df)
     else:
-        colors = ['None']*len(df)
+        # A constant fill is kept as a single value, rather than being repeated once per feature.
+        colors = kwargs.pop('facecolor', 'None')
+
+    # Data in a projected coordinate reference system is reprojected in bulk, straight onto the axis.
+    if projection and crs is not None and not isinstance(df, ColumnarGeometry):
+        df = ColumnarGeometry.from_geoseries(df.geometry)
 
     # Manipulate trace_kwargs.
     if trace:
@@ -1435,7 +1734,9 @@ def cartogram(df, projection=None,
 
     # Draw traces first, if appropriate.
     if trace:
-        if projection:
+        if isinstance(df, ColumnarGeometry):
+            _paint_columnar(ax, df, projection, crs=crs, **trace_kwargs)
+        elif projection:
             for polygon in df.geometry:
                 features = ShapelyFeature([polygon], ccrs.PlateCarree())
                 ax.add_feature(features, **trace_kwargs)
@@ -1450,8 +1751,13 @@ def cartogram(df, projection=None,
                     ax.add_patch(feature)
 
     # Finally, draw the scaled geometries.
-    for value, color, polygon in zip(values, colors, df.geometry):
-        scale_factor = dscale(value)
+    if isinstance(df, ColumnarGeometry):
+        scaled = df.scale(scale_factors)
+        _paint_columnar(ax, scaled, projection, crs=crs, facecolor=colors, **kwargs)
+        return ax
+
+    feature_colors = colors if hue is not None else itertools.repeat(colors)
+    for scale_factor, color, polygon in zip(scale_factors, feature_colors, df.geometry):
         scaled_polygon = shapely.affinity.scale(polygon, xfact=scale_factor, yfact=scale_factor)
         if projection:
             features = ShapelyFeature([scaled_polygon], ccrs.PlateCarree())
@@ -1478,13 +1784,15 @@ def kdeplot(df, projection=None,
 
     Parameters
     ----------
-    df : GeoDataFrame
-        The data being plotted.
+    df : GeoDataFrame, GeoSeries, ColumnarGeometry, or KDEGrid
+        The data being plotted, or a density estimated ahead of time by ``kde_grid``, in which case only the contours
+        are drawn.
     projection : geoplot.crs object instance, optional
         A geographic projection. Must be an instance of an object in the ``geoplot.crs`` module,
         e.g. ``geoplot.crs.PlateCarree()``. This parameter is optional: if left unspecified, a pure unprojected
         ``matplotlib`` object will be returned. For more information refer to the tutorial page on `projections
-        <http://localhost:63342/geoplot/docs/_build/html/tutorial/projections.html>`_.
+        <http://localhost:63342/geoplot/docs/_build/html/tutorial/projections.html>`_. Data is reprojected from its
+        ``crs``, if it has one, and is otherwise assumed to be in longitude and latitude.
     clip : iterable or GeoSeries, optional
         An iterable of geometries that the KDE plot will be clipped to. This is a visual parameter useful for
         "cleaning up" the plot. This feature has not yet actually been implemented!
@@ -1508,8 +1816,10 @@ def kdeplot(df, projection=None,
         A ``matplotlib.axes.AxesSubplot`` or ``cartopy.mpl.geoaxes.GeoAxesSubplot`` instance onto which this plot
         will be graphed. If this parameter is left undefined a new axis will be created and used instead.
     kwargs: dict, optional
-        Keyword arguments to be passed to the ``sns.kdeplot`` method doing the plotting (`ref
-        <http://seaborn.pydata.org/generated/seaborn.kdeplot.html>`_).
+        The ``bw``, ``gridsize`` and ``cut`` of the density estimate (see ``kde_grid``), which can't be set when
+        ``df`` is a ``KDEGrid``; the ``n_levels``, ``shade``, ``shade_lowest`` and ``cmap`` of the contours; and
+        keyword arguments to be passed to the ``matplotlib`` ``contour`` (or ``contourf``) method doing the
+        plotting. A ``hue`` is accepted for consistency with the other plot types, but is ignored.
 
     Returns
     -------
@@ -1542,9 +1852,8 @@ def kdeplot(df, projection=None,
 
     .. image:: ../figures/kdeplot/kdeplot-overlay.png
 
-    Most of the rest of the parameters to ``kdeplot`` are parameters inherited from `the seaborn method by the same
-    name <http://seaborn.pydata.org/generated/seaborn.kdeplot.html#seaborn.kdeplot>`_, on which this plot type is
-    based. For example, specifying ``shade=True`` provides a filled KDE instead of a contour one:
+    The rest of the parameters to ``kdeplot`` control the density estimate and the contours drawn from it. For
+    example, specifying ``shade=True`` provides a filled KDE instead of a contour one:
 
     .. code-block:: python
 
@@ -1585,23 +1894,49 @@ def kdeplot(df, projection=None,
 
     .. image:: ../figures/kdeplot/kdeplot-clip.png
 
-    """
-    import seaborn as sns  # Immediately fail if no seaborn.
-    sns.reset_orig()  # Reset to default style.
+    Estimating the density is the slow part of making a ``kdeplot``. When iterating on the styling of a plot, or
+    making several variants of it, estimate the density once with ``kde_grid`` and pass the result to ``kdeplot``
+    instead of the data. Grids can be saved with ``grid.save`` and loaded back with ``gplt.KDEGrid.load``.
+
+    .. code-block:: python
 
+        grid = gplt.kde_grid(collisions, projection=gcrs.AlbersEqualArea())
+        for cmap in ['Purples', 'Greens', 'Reds']:
+            gplt.kdeplot(grid, projection=gcrs.AlbersEqualArea(), shade=True, cmap=cmap)
+
+    """
     # Initialize the figure.
     fig = _init_figure(ax, figsize)
 
-    # Necessary prior.
-    xs = np.array([p.x for p in df.geometry])
-    ys = np.array([p.y for p in df.geometry])
+    # A density has no per-observation colors, so a hue (which the other plot types all accept) is ignored.
+    kwargs.pop('hue', None)
+
+    # The density is either estimated here, or precomputed. The parameters of the estimate are fixed in the latter case.
+    estimate_kwargs = {k: kwargs.pop(k) for k in ('bw', 'gridsize', 'cut') if k in kwargs}
+    if isinstance(df, KDEGrid):
+        if estimate_kwargs:
+            raise ValueError("The {0} of a precomputed KDEGrid cannot be changed; build a new grid with kde_grid "
+                             "instead.".format(", ".join(sorted(estimate_kwargs))))
+        grid = df
+        crs = None if grid.crs is None else _as_cartopy_crs(pyproj.CRS.from_wkt(grid.crs))
+        centerings = {'central_longitude': lambda df: grid.center[0], 'central_latitude': lambda df: grid.center[1]}
+        extrema = grid.extrema
+    else:
+        grid = None
+        xs, ys = _get_xy(df)
+        crs = _get_crs(df)
+        centerings = {
+            'central_longitude': lambda df: np.nanmean(_to_geographic(xs, ys, crs)[0]),
+            'central_latitude': lambda df: np.nanmean(_to_geographic(xs, ys, crs)[1])
+        }
+        extrema = np.nanmin(xs), np.nanmax(xs), np.nanmin(ys), np.nanmax(ys)
 
     # Load the projection.
     if projection:
-        projection = projection.load(df, {
-            'central_longitude': lambda df: np.mean(xs),
-            'central_latitude': lambda df: np.mean(ys)
-        })
+        if grid is not None and grid.center is None:
+            raise ValueError("This KDEGrid was estimated without a projection, so it can only be plotted without "
+                             "one.")
+        projection = projection.load(df, centerings)
 
         # Set up the axis.
         if not ax:
@@ -1613,38 +1948,93 @@ def kdeplot(df, projection=None,
     _lay_out_axes(ax, projection)
 
     # Set extent.
-    extrema = np.min(xs), np.max(xs), np.min(ys), np.max(ys)
-    _set_extent(ax, projection, extent, extrema)
+    _set_extent(ax, projection, extent, extrema, crs=crs)
+
+    if grid is None:
+        # The points are projected onto the axis once and in bulk, and the density is estimated in its native
+        # coordinates. Points falling outside of the domain of the projection are dropped.
+        if projection:
+            xs, ys = _project_points(ax, xs, ys, crs=crs)
+        grid = KDEGrid.from_points(xs, ys, projection=ax.projection.proj4_init if projection else None,
+                                   **estimate_kwargs)
+    elif grid.projection != (ax.projection.proj4_init if projection else None):
+        raise ValueError("This KDEGrid was estimated in a different projection than the one being plotted. Pass the "
+                         "projection it was built with, or build a new grid with kde_grid.")
 
     if projection:
-        if clip is None:
-            sns.kdeplot(pd.Series([p.x for p in df.geometry]), pd.Series([p.y for p in df.geometry]),
-                        transform=ccrs.PlateCarree(), ax=ax, **kwargs)
-        else:
-            sns.kdeplot(pd.Series([p.x for p in df.geometry]), pd.Series([p.y for p in df.geometry]),
-                        transform=ccrs.PlateCarree(), ax=ax, **kwargs)
+        _paint_kde(ax, grid, **kwargs)
+        if clip is not None:
             clip_geom = _get_clip(ax.get_extent(crs=ccrs.PlateCarree()), clip)
             feature = ShapelyFeature([clip_geom], ccrs.PlateCarree())
             ax.add_feature(feature, facecolor=(1,1,1), linewidth=0, zorder=100)
     else:
-        if clip is None:
-            sns.kdeplot(pd.Series([p.x for p in df.geometry]), pd.Series([p.y for p in df.geometry]), ax=ax, **kwargs)
-        else:
+        if clip is not None:
             clip_geom = _get_clip(ax.get_xlim() + ax.get_ylim(), clip)
             polyplot(gpd.GeoSeries(clip_geom),
                      facecolor='white', linewidth=0, zorder=100, extent=ax.get_xlim() + ax.get_ylim(), ax=ax)
-            sns.kdeplot(pd.Series([p.x for p in df.geometry]), pd.Series([p.y for p in df.geometry]),
-                        ax=ax, **kwargs)
+        _paint_kde(ax, grid, **kwargs)
     return ax
 
 
+def kde_grid(df, projection=None, bw='scott', gridsize=100, cut=3):
+    """
+    Estimates the density of a point dataset for ``kdeplot``, ahead of time. The result can be passed to ``kdeplot``
+    in place of the data any number of times, with different styling, and is only drawn, not estimated again.
+
+    .. code-block:: python
+
+        grid = gplt.kde_grid(collisions, projection=gcrs.AlbersEqualArea())
+        gplt.kdeplot(grid, projection=gcrs.AlbersEqualArea(), n_levels=30)
+        gplt.kdeplot(grid, projection=gcrs.AlbersEqualArea(), shade=True, cmap='Purples')
+        grid.save('collisions-kde.npz')
+
+    Parameters
+    ----------
+    df : GeoDataFrame, GeoSeries, or ColumnarGeometry
+        The point data.
+    projection : geoplot.crs object instance, optional
+        The projection the grid will be plotted in. The density is estimated in the coordinates of the projection,
+        so the grid can only be plotted in the same one (with the same parameters). Defaults to None, which estimates
+        the density in the coordinates of the data, for plotting without a projection.
+    bw : "scott", "silverman", or float, optional
+        The bandwidth estimation method, or a scalar bandwidth factor (as in ``scipy.stats.gaussian_kde``). Defaults
+        to Scott's rule.
+    gridsize : int, optional
+        The number of grid lines along each axis. Defaults to 100.
+    cut : float, optional
+        How many bandwidths past the extremes of the data the grid extends by. Defaults to 3.
+
+    Returns
+    -------
+    A ``geoplot.KDEGrid`` instance.
+    """
+    xs, ys = _get_xy(df)
+    crs = _get_crs(df)
+    extrema = np.nanmin(xs), np.nanmax(xs), np.nanmin(ys), np.nanmax(ys)
+    center, target = None, None
+    if projection:
+        lons, lats = _to_geographic(xs, ys, crs)
+        center = np.nanmean(lons), np.nanmean(lats)
+        target = projection.load(df, {'central_longitude': lambda df: center[0],
+                                      'central_latitude': lambda df: center[1]})
+        source = crs or ccrs.PlateCarree()
+        if source != target:
+            xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+            projected = np.concatenate(parallel_map(_transform_points, [(target, source, xs[a:b], ys[a:b])
+                                                                        for a, b in chunk_bounds(len(xs))]))
+            xs, ys = projected[:, 0], projected[:, 1]
+    return KDEGrid.from_points(xs, ys, bw=bw, gridsize=gridsize, cut=cut,
+                               projection=None if target is None else target.proj4_init, center=center,
+                               extrema=extrema, crs=None if crs is None else crs.to_wkt())
+
+
 def sankey(*args, projection=None,
            start=None, end=None, path=None,
            hue=None, categorical=False, scheme=None, k=5, cmap='viridis', vmin=None, vmax=None,
            legend=False, legend_kwargs=None, legend_labels=None, legend_values=None, legend_var=None,
-           extent=None, figsize=(8, 6), ax=None,
-           scale=None, limits=(1, 5), scale_func=None,
-           **kwargs):
+           extent=None, cull_margin=0.1, clip_extent=False, figsize=(8, 6), ax=None,
+           scale=None, limits=(1, 5), scale_func=None, aggregate=False, agg=np.sum, hue_agg=None, bundle=False,
+           bundle_kwargs=None, **kwargs):
     """
     A geospatial Sankey diagram (flow map).
 
@@ -1657,7 +2047,8 @@ def sankey(*args, projection=None,
         A geographic projection. Must be an instance of an object in the ``geoplot.crs`` module,
         e.g. ``geoplot.crs.PlateCarree()``. This parameter is optional: if left unspecified, a pure unprojected
         ``matplotlib`` object will be returned. For more information refer to the tutorial page on `projections
-        <http://localhost:63342/geoplot/docs/_build/html/tutorial/projections.html>`_.
+        <http://localhost:63342/geoplot/docs/_build/html/tutorial/projections.html>`_. Data is reprojected from its
+        ``crs``, if it has one, and is otherwise assumed to be in longitude and latitude.
     start : str or iterable
         Linear starting points: either the name of a column in ``df`` or a self-contained iterable. This parameter is
         required.
@@ -1676,9 +2067,10 @@ def sankey(*args, projection=None,
     categorical : boolean, optional
         Specify this variable to be ``True`` if ``hue`` points to a categorical variable. Defaults to False. Ignored
         if ``hue`` is set to None or not specified.
-    scheme : None or {"Quantiles"|"Equal_interval"|"Fisher_Jenks"}, optional
+    scheme : None or {"Quantiles"|"Equal_interval"|"Fisher_Jenks"} or Classifier, optional
         The scheme which will be used to determine categorical bins for the ``hue`` choropleth. If ``hue`` is
-        left unspecified or set to None this variable is ignored.
+        left unspecified or set to None this variable is ignored. Pass the same ``geoplot.Classifier`` to several
+        plots to have them share bins, colors, and legend; if it has not been fit yet, it is fit to this ``hue``.
     k : int or None, optional
         If ``hue`` is specified and ``categorical`` is False, this number, set to 5 by default, will determine how
         many bins will exist in the output visualization. If ``hue`` is specified and this variable is set to
@@ -1702,8 +2094,32 @@ def sankey(*args, projection=None,
     scale_func : ufunc, optional
         The function used to scale point sizes. This should be a factory function of two 
         variables, the minimum and maximum values in the dataset, which returns a scaling function which will be 
-        applied to the rest of the data. Defaults to a linear scale. A demo is available in the `example 
+        applied to the rest of the data. Defaults to a linear scale. Scaling functions marked with
+        ``geoplot.vectorized`` are applied to all of the data in a single call; ``geoplot.linear_scale``,
+        ``log_scale``, ``sqrt_scale`` and ``power_scale`` are built in. A demo is available in the `example
         gallery <examples/usa-city-elevations.html>`_.
+    aggregate : boolean or float, optional
+        Whether or not to merge routes sharing the same ``start`` and ``end`` points into a single route before
+        drawing, combining their ``scale`` values using ``agg`` and their ``hue`` values using ``hue_agg``. Pass a
+        number instead of ``True`` to also merge routes whose endpoints fall into the same cell of a grid of that cell
+        size, which are then drawn between the mean endpoints of the merged routes. Defaults to False. Requires
+        ``start`` and ``end``.
+    agg : function, optional
+        The function used to combine the ``scale`` values of merged routes. Any function accepted by
+        ``pandas.Series.groupby(...).agg`` will do. Defaults to ``np.sum``, which totals flows. Ignored unless
+        ``aggregate`` is set.
+    hue_agg : function or str, optional
+        The function used to combine the ``hue`` values of merged routes, accepted in the same forms as ``agg``.
+        Defaults to ``agg`` for a numeric, non-``categorical`` ``hue``, and to ``"first"``, which keeps the value of
+        the first merged route, otherwise. Ignored unless ``aggregate`` is set.
+    bundle : boolean, optional
+        Whether or not to bundle routes running alongside one another together, using force-directed edge bundling
+        (see ``geoplot.bundle_edges``). This declutters dense flow maps, at the cost of no longer drawing routes along
+        their ``path``: routes are bundled, and drawn, in the coordinates of the map. Defaults to False. Requires
+        ``start`` and ``end``.
+    bundle_kwargs : dict, optional
+        Keyword arguments to be passed to ``geoplot.bundle_edges``, for tuning the bundling. Ignored unless ``bundle``
+        is set.
     legend : boolean, optional
         Whether or not to include a legend in the output plot. This parameter will not work if neither ``hue`` nor
         ``scale`` is unspecified.
@@ -1722,6 +2138,13 @@ def sankey(*args, projection=None,
     extent : None or (minx, maxx, miny, maxy), optional
         If this parameter is unset ``geoplot`` will calculate the plot limits. If an extrema tuple is passed,
         that input will be used instead.
+    cull_margin : float or None, optional
+        If ``extent`` is specified, features falling wholly outside of it are discarded before any artists are
+        created. This parameter sets the margin kept around the extent, as a fraction of its width and height.
+        Defaults to 0.1. Set this to None to disable culling.
+    clip_extent : boolean, optional
+        Whether or not to also clip ``path`` geometries straddling the edge of the (margin-padded) ``extent`` to it.
+        Defaults to False.
     figsize : tuple, optional
         An (x, y) tuple passed to ``matplotlib.figure`` which sets the size, in inches, of the resultant plot.
         Defaults to (8, 6), the ``matplotlib`` default global.
@@ -2000,19 +2423,20 @@ def sankey(*args, projection=None,
         df = None  # bind the local name here; initialize in a bit.
 
     # Validate the rest of the input.
-    if ((start is None) or (end is None)) and not hasattr(path, "__iter__"):
+    path_is_iterable = hasattr(path, "__iter__") or isinstance(path, ColumnarGeometry)
+    if ((start is None) or (end is None)) and not path_is_iterable:
         raise ValueError("The 'start' and 'end' parameters must both be specified.")
     if (isinstance(start, str) or isinstance(end, str)) and (df is None):
         raise ValueError("Invalid input.")
     if isinstance(start, str):
         start = df[start]
-    elif start is not None:
+    elif start is not None and not isinstance(start, ColumnarGeometry):
         start = gpd.GeoSeries(start)
     if isinstance(end, str):
         end = df[end]
-    elif end is not None:
+    elif end is not None and not isinstance(end, ColumnarGeometry):
         end = gpd.GeoSeries(end)
-    if (start is not None) and (end is not None) and hasattr(path, "__iter__"):
+    if (start is not None) and (end is not None) and path_is_iterable:
         raise ValueError("One of 'start' and 'end' OR 'path' must be specified, but they cannot be specified "
                          "simultaneously.")
     if path is None:  # No path provided.
@@ -2020,14 +2444,39 @@ def sankey(*args, projection=None,
         path_geoms = None
     elif isinstance(path, str):  # Path is a column in the dataset.
         path_geoms = df[path]
-    elif hasattr(path, "__iter__"):  # Path is an iterable.
+    elif isinstance(path, ColumnarGeometry):  # Path is a column of linear geometries.
+        path_geoms = path
+    elif path_is_iterable:  # Path is an iterable.
         path_geoms = gpd.GeoSeries(path)
     else:  # Path is a cartopy.crs object.
         path_geoms = None
-    if start is not None and end is not None:
-        points = pd.concat([start, end])
-    else:
-        points = None
+    crs = None
+    if path_geoms is None:
+        start_xs, start_ys = _get_xy(start)
+        end_xs, end_ys = _get_xy(end)
+        # Routes are laid out in longitude and latitude, so on a map points in another coordinate reference system are
+        # transformed into those first, in bulk.
+        if projection:
+            start_xs, start_ys = _to_geographic(start_xs, start_ys, _get_crs(start))
+            end_xs, end_ys = _to_geographic(end_xs, end_ys, _get_crs(end))
+
+    if bundle and path_geoms is not None:
+        raise ValueError("The 'bundle' parameter requires the 'start' and 'end' parameters to be specified.")
+
+    # Merge repeated origin-destination pairs, if requested. The ``hue`` and ``scale`` columns are resolved here so
+    # that their values can be combined along with the routes.
+    if aggregate:
+        if path_geoms is not None:
+            raise ValueError("The 'aggregate' parameter requires the 'start' and 'end' parameters to be specified.")
+        hue, scale = _validate_hue(df, hue), _validate_scale(df, scale)
+        tolerance = None if aggregate is True else aggregate
+        if hue_agg is None:
+            # Summing category labels, or codes standing in for them, is meaningless.
+            numeric = hue is not None and np.asarray(hue).dtype.kind in 'iuf'
+            hue_agg = agg if numeric and not categorical else 'first'
+        (start_xs, start_ys, end_xs, end_ys), (hue, scale) = _aggregate_flows(
+            (start_xs, start_ys, end_xs, end_ys), (hue, scale), (hue_agg, agg), tolerance=tolerance
+        )
 
     # Set legend variable.
     if legend_var is None:
@@ -2037,35 +2486,38 @@ def sankey(*args, projection=None,
             legend_var = "hue"
 
     # After validating the inputs, we are in one of two modes:
-    # 1. Projective mode. In this case ``path_geoms`` is None, while ``points`` contains a concatenation of our
-    #    points (for use in initializing the plot extents). This case occurs when the user specifies ``start`` and
+    # 1. Projective mode. In this case ``path_geoms`` is None, while ``start_xs``, ``start_ys``, ``end_xs``, and
+    #    ``end_ys`` contain the coordinates of our points. This case occurs when the user specifies ``start`` and
     #    ``end``, and not ``path``. This is "projective mode" because it means that ``path`` will be a
     #    projection---if one is not provided explicitly, the ``gcrs.Geodetic()`` projection.
-    # 2. Path mode. In this case ``path_geoms`` is an iterable of LineString entities to be plotted, while ``points``
-    #    is None. This occurs when the user specifies ``path``, and not ``start`` or ``end``. This is path mode
+    # 2. Path mode. In this case ``path_geoms`` is an iterable of LineString entities (or a ``ColumnarGeometry``) to be
+    #    plotted. This occurs when the user specifies ``path``, and not ``start`` or ``end``. This is path mode
     #    because we will need to plot exactly those paths!
 
     # At this point we'll initialize the rest of the variables we need. The way that we initialize them is going to
-    # depend on which code path we are on. Additionally, we will initialize the `df` variable with a projection
-    # dummy, if it has not been initialized already. This `df` will only be used for figuring out the extent,
-    # and will be discarded afterwards!
+    # depend on which code path we are on.
     #
     # Variables we need to generate at this point, and why we need them:
     # 1. (clong, clat) --- To pass this to the projection settings.
     # 2. (xmin. xmax, ymin. ymax) --- To pass this to the extent settings.
-    # 3. n --- To pass this to the color array in case no ``color`` is specified.
-    if path_geoms is None and points is not None:
-        if df is None:
-            df = gpd.GeoDataFrame(geometry=points)
-        xs = np.array([p.x for p in points])
-        ys = np.array([p.y for p in points])
-        xmin, xmax, ymin, ymax = np.min(xs), np.max(xs), np.min(ys), np.max(ys)
-        clong, clat = np.mean(xs), np.mean(ys)
-        n = int(len(points) / 2)
+    # 3. n --- The number of routes.
+    if path_geoms is None:
+        # The endpoints are reduced separately and the results combined, rather than being concatenated first.
+        xmin, xmax = np.nanmin([np.nanmin(start_xs), np.nanmin(end_xs)]), np.nanmax([np.nanmax(start_xs),
+                                                                                       np.nanmax(end_xs)])
+        ymin, ymax = np.nanmin([np.nanmin(start_ys), np.nanmin(end_ys)]), np.nanmax([np.nanmax(start_ys),
+                                                                                       np.nanmax(end_ys)])
+        clong = (np.nansum(start_xs) + np.nansum(end_xs)) / (np.count_nonzero(~np.isnan(start_xs)) +
+                                                             np.count_nonzero(~np.isnan(end_xs)))
+        clat = (np.nansum(start_ys) + np.nansum(end_ys)) / (np.count_nonzero(~np.isnan(start_ys)) +
+                                                            np.count_nonzero(~np.isnan(end_ys)))
+        n = len(start_xs)
     else:  # path_geoms is an iterable
-        path_geoms = gpd.GeoSeries(path_geoms)
-        xmin, xmax, ymin, ymax = _get_envelopes_min_maxes(path_geoms.envelope.exterior)
-        clong, clat = (xmin + xmax) / 2, (ymin + ymax) / 2
+        if not isinstance(path_geoms, ColumnarGeometry):
+            path_geoms = gpd.GeoSeries(path_geoms)
+        crs = _get_crs(path_geoms)
+        xmin, xmax, ymin, ymax = _get_extrema(path_geoms)
+        (clong,), (clat,) = _to_geographic([(xmin + xmax) / 2], [(ymin + ymax) / 2], crs)
         n = len(path_geoms)
 
     # Initialize the figure.
@@ -2092,7 +2544,7 @@ def sankey(*args, projection=None,
         if extent:
             ax.set_extent(extent)
         else:
-            ax.set_extent((xmin, xmax, ymin, ymax))
+            ax.set_extent((xmin, xmax, ymin, ymax), crs=crs)
     else:
         if extent:
             ax.set_xlim((extent[0], extent[1]))
@@ -2103,59 +2555,45 @@ def sankey(*args, projection=None,
 
     # Generate the coloring information, if needed. Follows one of two schemes, categorical or continuous,
     # based on whether or not ``k`` is specified (``hue`` must be specified for either to work).
+    hue = _validate_hue(df, hue)
     if k is not None:
         # Categorical colormap code path.
         categorical, k, scheme = _validate_buckets(categorical, k, scheme)
 
-        hue = _validate_hue(df, hue)
-
         if hue is not None:
             cmap, categories, hue_values = _discrete_colorize(categorical, hue, scheme, k, cmap, vmin, vmax)
-            colors = [cmap.to_rgba(v) for v in hue_values]
+            colors = cmap.to_rgba(np.asarray(hue_values))
 
             # Add a legend, if appropriate.
             if legend and (legend_var != "scale" or scale is None):
                 _paint_hue_legend(ax, categories, cmap, legend_labels, legend_kwargs)
-        else:
-            if 'color' not in kwargs.keys():
-                colors = ['steelblue'] * n
-            else:
-                colors = [kwargs['color']] * n
-                kwargs.pop('color')
     elif k is None and hue is not None:
         # Continuous colormap code path.
         hue_values = hue
         cmap = _continuous_colormap(hue_values, cmap, vmin, vmax)
-        colors = [cmap.to_rgba(v) for v in hue_values]
+        colors = cmap.to_rgba(np.asarray(hue_values))
 
         # Add a legend, if appropriate.
         if legend and (legend_var != "scale" or scale is None):
             _paint_colorbar_legend(ax, hue_values, cmap, legend_kwargs)
 
-    # Check if the ``scale`` parameter is filled, and use it to fill a ``values`` name.
-    if scale:
-        if isinstance(scale, str):
-            scalar_values = df[scale]
-        else:
-            scalar_values = scale
+    if hue is None:
+        # Constant styles are kept as single values, rather than being repeated once per route.
+        colors = kwargs.pop('color', 'steelblue')
 
-        # Compute a scale function.
-        dmin, dmax = np.min(scalar_values), np.max(scalar_values)
-        if not scale_func:
-            dslope = (limits[1] - limits[0]) / (dmax - dmin)
-            dscale = lambda dval: limits[0] + dslope * (dval - dmin)
-        else:
-            dscale = scale_func(dmin, dmax)
+    # Check if the ``scale`` parameter is filled, and use it to fill a ``values`` name.
+    if scale is not None:
+        scalar_values = _validate_scale(df, scale)
 
-        # Apply the scale function.
-        scalar_multiples = np.array([dscale(d) for d in scalar_values])
+        # Compute and apply a scale function.
+        dscale, scalar_multiples = _scale_values(scalar_values, limits, scale_func)
         widths = scalar_multiples * 1
 
         # Draw a legend, if appropriate.
         if legend and (legend_var == "scale"):
             _paint_carto_legend(ax, scalar_values, legend_values, legend_labels, dscale, legend_kwargs)
     else:
-        widths = [1] * n  # pyplot default
+        widths = 1  # pyplot default
 
     # Allow overwriting visual arguments.
     if 'linestyle' in kwargs.keys():
@@ -2163,31 +2601,94 @@ def sankey(*args, projection=None,
     else:
         linestyle = '-'
     if 'color' in kwargs.keys():
-        colors = [kwargs['color']]*n; kwargs.pop('color')
+        colors = kwargs.pop('color')
     elif 'edgecolor' in kwargs.keys():  # plt.plot uses 'color', mpl.ax.add_feature uses 'edgecolor'. Support both.
-        colors = [kwargs['edgecolor']]*n; kwargs.pop('edgecolor')
+        colors = kwargs.pop('edgecolor')
     if 'linewidth' in kwargs.keys():
-        widths = [kwargs['linewidth']]*n; kwargs.pop('linewidth')
-
-    if projection:
-        # Duck test plot. The first will work if a valid transformation is passed to ``path`` (e.g. we are in the
-        # ``start + ``end`` case), the second will work if ``path`` is an iterable (e.g. we are in the ``path`` case).
-        try:
-            for origin, destination, color, width in zip(start, end, colors, widths):
-                ax.plot([origin.x, destination.x], [origin.y, destination.y], transform=path,
+        widths = kwargs.pop('linewidth')
+    # Colors computed from ``hue`` are an array of one RGBA row per route, and widths computed from ``scale`` one
+    # value per route. Anything else is a single value shared by every route.
+    per_route_colors = isinstance(colors, np.ndarray) and colors.ndim == 2
+    per_route_widths = isinstance(widths, np.ndarray)
+
+    # Cull (and optionally clip) lines falling outside of the plot extent.
+    cull_box = _get_cull_box(ax, projection, extent, cull_margin, crs=crs)
+    if cull_box is not None:
+        if path_geoms is None:
+            bounds = [np.minimum(start_xs, end_xs), np.minimum(start_ys, end_ys),
+                      np.maximum(start_xs, end_xs), np.maximum(start_ys, end_ys)]
+            if projection and isinstance(path, ccrs.Geodetic):
+                # Great circles bow out towards the poles, so the endpoints only bound their longitudes. Those
+                # spanning half the globe or more wrap around the antimeridian and aren't bounded at all.
+                bounds[1], bounds[3] = np.full(n, -90.0), np.full(n, 90.0)
+                wraps = (bounds[2] - bounds[0]) >= 180
+                bounds[0], bounds[2] = np.where(wraps, -np.inf, bounds[0]), np.where(wraps, np.inf, bounds[2])
+            mask = _cull(None, cull_box, bounds=bounds)
+            start_xs, start_ys, end_xs, end_ys = [_take(np.asarray(arr), mask)
+                                                  for arr in (start_xs, start_ys, end_xs, end_ys)]
+        else:
+            mask = _cull(path_geoms, cull_box)
+            path_geoms = _take(path_geoms, mask)
+        if per_route_colors:
+            colors = colors[mask]
+        if per_route_widths:
+            widths = widths[mask]
+    if projection and crs is not None and not isinstance(path_geoms, ColumnarGeometry):
+        # Paths in a projected coordinate reference system are reprojected in bulk, straight onto the axis.
+        path_geoms = ColumnarGeometry.from_geoseries(path_geoms)
+    clip_box = cull_box if clip_extent else None
+    if clip_box is not None and path_geoms is not None and not isinstance(path_geoms, ColumnarGeometry):
+        path_geoms = _clip_geometries(path_geoms, clip_box)
+
+    # The drawing loops below need one style value per route.
+    route_colors = colors if per_route_colors else itertools.repeat(colors)
+    route_widths = widths if per_route_widths else itertools.repeat(widths)
+
+    # Plot. In the ``start`` and ``end`` case ``path`` is a valid transformation, while in the ``path`` case
+    # ``path_geoms`` holds the lines to be drawn. Where we can, routes are interpolated along their ``path`` and
+    # projected in bulk ourselves, instead of being handed over to ``cartopy`` one at a time. Bundled routes are
+    # computed in the coordinates of the map, so their endpoints are projected first.
+    if path_geoms is None and bundle:
+        if projection:
+            start_xs, start_ys = _project_coords(ax, start_xs, start_ys)
+            end_xs, end_ys = _project_coords(ax, end_xs, end_ys)
+        routes = bundle_edges(start_xs, start_ys, end_xs, end_ys, **(bundle_kwargs or {}))
+        _paint_columnar(ax, routes, None, linestyle=linestyle, linewidth=widths, edgecolor=colors, facecolor='None',
+                        **kwargs)
+    elif path_geoms is None and (not projection or isinstance(path, (ccrs.Geodetic, ccrs.Projection))):
+        if not projection:
+            routes, crs = _straight_lines(start_xs, start_ys, end_xs, end_ys), None
+        elif isinstance(path, ccrs.Geodetic):
+            central_longitude = ax.projection.proj4_params.get('lon_0', 0.0)
+            routes, crs = _great_circle_lines(start_xs, start_ys, end_xs, end_ys, central_longitude), None
+        else:
+            # Straight lines in the ``path`` projection, broken into segments of a degree's worth of its width.
+            width = path.x_limits[1] - path.x_limits[0]
+            lengths = np.hypot(np.asarray(end_xs) - start_xs, np.asarray(end_ys) - start_ys)
+            nsegs = np.maximum(np.ceil(360 * lengths / width), 1).astype(int)
+            routes, crs = _straight_lines(start_xs, start_ys, end_xs, end_ys, nsegs), path
+        _paint_columnar(ax, routes, projection, crs=crs, linestyle=linestyle, linewidth=widths,
+                        edgecolor=colors, facecolor='None', **kwargs)
+    elif isinstance(path_geoms, ColumnarGeometry):
+        _paint_columnar(ax, path_geoms, projection, clip_box=clip_box, crs=crs, linestyle=linestyle, linewidth=widths,
+                        edgecolor=colors, facecolor='None', **kwargs)
+    elif projection:
+        if path_geoms is None:
+            for x0, y0, x1, y1, color, width in zip(start_xs, start_ys, end_xs, end_ys, route_colors, route_widths):
+                ax.plot([x0, x1], [y0, y1], transform=path,
                         linestyle=linestyle, linewidth=width, color=color, **kwargs)
-        except TypeError:
-            for line, color, width in zip(path_geoms, colors, widths):
+        else:
+            for line, color, width in zip(path_geoms, route_colors, route_widths):
                 feature = ShapelyFeature([line], ccrs.PlateCarree())
                 ax.add_feature(feature, linestyle=linestyle, linewidth=width, edgecolor=color, facecolor='None',
                 **kwargs)
     else:
-        try:
-            for origin, destination, color, width in zip(start, end, colors, widths):
-                ax.plot([origin.x, destination.x], [origin.y, destination.y],
+        if path_geoms is None:
+            for x0, y0, x1, y1, color, width in zip(start_xs, start_ys, end_xs, end_ys, route_colors, route_widths):
+                ax.plot([x0, x1], [y0, y1],
                         linestyle=linestyle, linewidth=width, color=color, **kwargs)
-        except TypeError:
-            for path, color, width in zip(path_geoms, colors, widths):
+        else:
+            for path, color, width in zip(path_geoms, route_colors, route_widths):
                 # We have to implement different methods for dealing with LineString and MultiLineString objects.
                 # This calls for, yep, another duck test.
                 try:  # LineString
@@ -2230,151 +2731,1560 @@ def _init_figure(ax, figsize):
         fig = plt.figure(figsize=figsize)
         return fig
 
-def _get_envelopes_min_maxes(envelopes):
+
+def _get_xy(df):
     """
-    Returns the extrema of the inputted polygonal envelopes. Used for setting chart extent where appropriate. Note
-    tha the ``Quadtree.bounds`` object property serves a similar role.
+    Returns the coordinates of a point dataset as a pair of ``numpy`` arrays. ``ColumnarGeometry`` input is returned
+    as-is, without any ``shapely`` objects being created.
 
     Parameters
     ----------
-    envelopes : GeoSeries
-        The envelopes of the given geometries, as would be returned by e.g. ``data.geometry.envelope.exterior``.
+    df : GeoDataFrame, GeoSeries, or ColumnarGeometry
+        The point data.
 
     Returns
     -------
-    (xmin, xmax, ymin, ymax) : tuple
-        The data extrema.
+    (xs, ys) : tuple
+        The point coordinates.
+    """
+    if isinstance(df, ColumnarGeometry):
+        if df.geom_type != 'Point':
+            raise ValueError("Expected point data, but got '{0}' geometries.".format(df.geom_type))
+        return df.x, df.y
+    geoms = df.geometry if hasattr(df, 'geometry') else df
+    return np.array([p.x for p in geoms]), np.array([p.y for p in geoms])
 
+
+def _get_centroids(df, crs=None):
     """
-    xmin = np.min(envelopes.map(lambda linearring: np.min([linearring.coords[1][0],
-                                                          linearring.coords[2][0],
-                                                          linearring.coords[3][0],
-                                                          linearring.coords[4][0]])))
-    xmax = np.max(envelopes.map(lambda linearring: np.max([linearring.coords[1][0],
-                                                          linearring.coords[2][0],
-                                                          linearring.coords[3][0],
-                                                          linearring.coords[4][0]])))
-    ymin = np.min(envelopes.map(lambda linearring: np.min([linearring.coords[1][1],
-                                                           linearring.coords[2][1],
-                                                           linearring.coords[3][1],
-                                                           linearring.coords[4][1]])))
-    ymax = np.max(envelopes.map(lambda linearring: np.max([linearring.coords[1][1],
-                                                           linearring.coords[2][1],
-                                                           linearring.coords[3][1],
-                                                           linearring.coords[4][1]])))
-    return xmin, xmax, ymin, ymax
+    Returns the centroids of the geometries in a dataset as a pair of ``numpy`` arrays. Used for centering
+    projections.
 
+    Parameters
+    ----------
+    df : GeoDataFrame, GeoSeries, or ColumnarGeometry
+        The data being plotted.
+    crs : None or cartopy.crs.Projection instance, optional
+        The coordinate reference system of the data, as returned by ``_get_crs``. If specified, the centroids are
+        transformed into longitude and latitude.
 
-def _get_envelopes_centroid(envelopes):
+    Returns
+    -------
+    (xs, ys) : tuple
+        The centroid coordinates.
     """
-    Returns the centroid of an inputted geometry column. Not currently in use, as this is now handled by this
-    library's CRS wrapper directly. Light wrapper over ``_get_envelopes_min_maxes``.
+    if isinstance(df, ColumnarGeometry):
+        return _to_geographic(*df.centroid(), crs=crs)
+    geoms = df.geometry
+    centroids = parallel_map(_centroids, [(geoms.iloc[a:b],) for a, b in chunk_bounds(len(geoms), min_chunk=2**14)])
+    return _to_geographic(np.concatenate([xs for xs, _ in centroids]), np.concatenate([ys for _, ys in centroids]),
+                          crs)
+
+
+def _centroids(geoms):
+    """
+    Computes the centroids of a chunk of a ``GeoSeries``, which ``shapely`` does with the GIL released.
+    """
+    centroids = geoms.centroid
+    return np.asarray(centroids.x, dtype=float), np.asarray(centroids.y, dtype=float)
+
+
+def _get_extrema(df):
+    """
+    Returns the extrema of the geometries in a dataset. Used for setting chart extent where appropriate.
 
     Parameters
     ----------
-    envelopes : GeoSeries
-        The envelopes of the given geometries, as would be returned by e.g. ``data.geometry.envelope``.
+    df : GeoDataFrame, GeoSeries, or ColumnarGeometry
+        The data being plotted.
 
     Returns
     -------
-    (mean_x, mean_y) : tuple
-        The data centroid.
+    (xmin, xmax, ymin, ymax) : tuple
+        The data extrema.
     """
-    xmin, xmax, ymin, ymax = _get_envelopes_min_maxes(envelopes)
-    return np.mean(xmin, xmax), np.mean(ymin, ymax)
+    if isinstance(df, ColumnarGeometry):
+        xmin, ymin, xmax, ymax = df.total_bounds()
+        return xmin, xmax, ymin, ymax
+    return _get_envelopes_min_maxes(df.geometry.envelope.exterior)
 
 
-def _set_extent(ax, projection, extent, extrema):
+def _apply_rasterization_policy(plot, kwargs, n_features, count_vertices):
     """
-    Sets the plot extent.
+    Applies the policy set by ``set_rasterization_thresholds``, setting ``rasterized`` in the keyword arguments of the
+    data collection of a plot if it is drawing too many features or vertices, and logs the decision. A ``rasterized``
+    keyword argument passed by the user takes precedence.
 
     Parameters
     ----------
-    ax : cartopy.GeoAxesSubplot instance
-        The axis whose boundaries are being tweaked.
-    projection : None or geoplot.crs instance
-        The projection, if one is being used.
-    extent : None or (xmin, xmax, ymin, ymax) tuple
-        A copy of the ``extent`` top-level parameter, if the user choses to specify their own extent. These values
-        will be used if ``extent`` is non-``None``.
-    extrema : None or (xmin, xmax, ymin, ymax) tuple
-        Plot-calculated extrema. These values, which are calculated in the plot above and passed to this function
-        (different plots require different calculations), will be used if a user-provided ``extent`` is not provided.
+    plot : str
+        The name of the plot type, for the log.
+    kwargs : dict
+        The keyword arguments which will be passed to the data collection. Modified in place.
+    n_features : int
+        The number of features being drawn.
+    count_vertices : callable
+        A function returning the number of vertices being drawn. Counting these can be expensive, so this is only
+        called if the vertex threshold is needed to make the decision.
 
     Returns
     -------
     None
     """
-    if extent and projection:  # Input ``extent`` into set_extent().
-        ax.set_extent(extent)
-    elif extent and not projection:  # Input ``extent`` into set_ylim, set_xlim.
-        xmin, xmax, ymin, ymax = extent
-        ax.set_xlim((xmin, xmax))
-        ax.set_ylim((ymin, ymax))
-    if not extent and projection:  # Input ``extrema`` into set_extent.
-        xmin, xmax, ymin, ymax = extrema
-        ax.set_extent((xmin, xmax, ymin, ymax))
-    if not extent and not projection:  # Input ``extrema`` into set_ylim, set_xlim.
-        xmin, xmax, ymin, ymax = extrema
-        ax.set_xlim((xmin, xmax))
-        ax.set_ylim((ymin, ymax))
+    features, vertices = _RASTERIZATION_THRESHOLDS['features'], _RASTERIZATION_THRESHOLDS['vertices']
+    if 'rasterized' in kwargs:
+        _log.info("%s: %d features, rasterized=%s (set by the caller).", plot, n_features, kwargs['rasterized'])
+        return
+    if features is None and vertices is None:
+        return
+    if features is not None and n_features > features:
+        kwargs['rasterized'] = True
+        _log.info("%s: %d features, over the threshold of %d; rasterized.", plot, n_features, features)
+        return
+    if vertices is not None:
+        n_vertices = count_vertices()
+        if n_vertices > vertices:
+            kwargs['rasterized'] = True
+            _log.info("%s: %d features, %d vertices, over the threshold of %d; rasterized.",
+                      plot, n_features, n_vertices, vertices)
+            return
+    _log.info("%s: %d features, under the rasterization thresholds; drawn as vectors.", plot, n_features)
+
+
+def _count_vertices(geoms):
+    """
+    Counts the vertices of an iterable of ``shapely`` geometries, without copying out their coordinates.
+    """
+    def count(geom):
+        if geom is None or geom.is_empty:
+            return 0
+        if hasattr(geom, 'geoms'):
+            return sum(count(part) for part in geom.geoms)
+        if hasattr(geom, 'exterior'):
+            return len(geom.exterior.coords) + sum(len(ring.coords) for ring in geom.interiors)
+        return len(geom.coords)
 
+    return sum(count(geom) for geom in geoms)
 
-def _lay_out_axes(ax, projection):
+
+def _project_coords(ax, xs, ys, crs=None):
     """
-    ``cartopy`` enables a a transparent background patch and an "outline" patch by default. This short method simply
-    hides these extraneous visual features. If the plot is a pure ``matplotlib`` one, it does the same thing by
-    removing the axis altogether.
+    Transforms coordinates into the native coordinate reference system of a ``GeoAxesSubplot`` in bulk. Large
+    arrays are transformed in chunks, in parallel (see ``geoplot.set_workers``). Coordinates which fall outside of the
+    domain of the projection are returned as ``nan``, which ``matplotlib`` treats as a break in the path.
 
     Parameters
     ----------
-    ax : matplotlib.Axes instance
-        The ``matplotlib.Axes`` instance being manipulated.
-    projection : None or geoplot.crs instance
-        The projection, if one is used.
+    ax : cartopy.GeoAxesSubplot instance
+        The axis being plotted on.
+    xs, ys : ndarray
+        The coordinates being transformed.
+    crs : cartopy.crs object instance, optional
+        The coordinate reference system of the input. Defaults to ``ccrs.PlateCarree()``.
 
     Returns
     -------
-    None
+    (xs, ys) : tuple
+        The transformed coordinates.
     """
-    if projection is not None:
-        try:
-            ax.background_patch.set_visible(False)
-            ax.outline_patch.set_visible(False)
-        except AttributeError:  # Testing...
-            pass
-    else:
-        plt.gca().axison = False
+    if crs is None:
+        crs = ccrs.PlateCarree()
+    xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+    if crs == ax.projection:  # The data is already in the coordinates of the axis.
+        return xs, ys
+    projected = np.concatenate(parallel_map(_transform_points, [(ax.projection, crs, xs[a:b], ys[a:b])
+                                                                for a, b in chunk_bounds(len(xs))]))
+    projected[~np.isfinite(projected)] = np.nan
+    return projected[:, 0], projected[:, 1]
+
+
+def _transform_points(target, source, xs, ys):
+    """
+    Transforms a chunk of coordinates from one coordinate reference system into another. ``pyproj`` releases the
+    GIL while it does so, so chunks are transformed on threads.
+    """
+    return target.transform_points(source, xs, ys)
 
 
-def _validate_hue(df, hue):
+# The most memory the projected point sets retained by ``_project_points`` may take up.
+_PROJECTED_CACHE_BYTES = 2**27
+_projected_cache = IdentityCache(_PROJECTED_CACHE_BYTES)
+
+
+def _project_points(ax, xs, ys, crs=None):
     """
-    The top-level ``hue`` parameter present in most plot types accepts a variety of input types. This method
-    condenses this variety into a single preferred format---an iterable---which is expected by all submethods working
-    with the data downstream of it.
+    Projects point coordinates into the native coordinate reference system of a ``GeoAxesSubplot`` in bulk, so that
+    they can be drawn in data coordinates instead of being transformed by ``cartopy`` on every draw. The result is
+    cached by the projection and the identity of the coordinate arrays, for as long as they are alive, so that
+    overlaying the same points again (or on another axis with the same projection) reuses it. The least recently used
+    results are evicted once the cached results take up more than 128 MB; ``geoplot.clear_memory_cache`` empties the
+    cache.
 
     Parameters
     ----------
-    df : GeoDataFrame
-        The full data input, from which standardized ``hue`` information may need to be extracted.
-    hue : Series, GeoSeries, iterable, str
-        The data column whose entries are being discretely colorized, as (loosely) passed by the top-level ``hue``
-        variable.
-    required : boolean
-        Whether or not this parameter is required for the plot in question.
+    ax : cartopy.GeoAxesSubplot instance
+        The axis being plotted on.
+    xs, ys : ndarray
+        The coordinates being transformed.
+    crs : cartopy.crs object instance, optional
+        The coordinate reference system of the input. Defaults to ``ccrs.PlateCarree()``.
 
     Returns
     -------
-    hue : iterable
-        The ``hue`` parameter input as an iterable.
+    (xs, ys) : tuple
+        The transformed coordinates, as read-only arrays.
     """
-    if hue is None:
-        return None
-    elif isinstance(hue, str):
-        hue = df[hue]
-        return hue
-    else:
-        return gpd.GeoSeries(hue)
+    xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+    key = (ax.projection, crs)
+    projected = _projected_cache.get((xs, ys), key)
+    if projected is None:
+        pxs, pys = _project_coords(ax, xs, ys, crs=crs)
+        pxs, pys = np.array(pxs), np.array(pys)
+        pxs.flags.writeable, pys.flags.writeable = False, False
+        projected = _projected_cache.put((xs, ys), (pxs, pys), pxs.nbytes + pys.nbytes, key)
+    return projected
+
+
+def _get_crs(df):
+    """
+    Returns the coordinate reference system of a dataset as a ``cartopy`` object, for use as the source of the
+    transforms onto the projection of the plot.
+
+    Parameters
+    ----------
+    df : GeoDataFrame, GeoSeries, ColumnarGeometry, or iterable
+        The data being plotted. Only ``GeoDataFrame``, ``GeoSeries`` and ``ColumnarGeometry`` input carries a ``crs``.
+
+    Returns
+    -------
+    None or cartopy.crs.Projection instance
+        None if the data is in longitude and latitude (or does not specify its coordinate reference system), in
+        which case it is treated as ``ccrs.PlateCarree()`` data, as before. Otherwise, its projection.
+    """
+    crs = getattr(df, 'crs', None)
+    if not crs:
+        return None
+    return _as_cartopy_crs(pyproj.CRS.from_user_input(crs))
+
+
+@functools.lru_cache(maxsize=16)
+def _as_cartopy_crs(crs):
+    """
+    Converts a ``pyproj.CRS`` into a ``cartopy`` projection. Building one is expensive, and the same handful of
+    coordinate reference systems are used over and over again, so conversions are cached.
+    """
+    if crs.is_geographic:
+        return None
+    return ccrs.Projection(crs)
+
+
+def _to_geographic(xs, ys, crs):
+    """
+    Transforms coordinates in ``crs`` (as returned by ``_get_crs``) into longitude and latitude. Used for centering
+    projections on data which is not itself in longitude and latitude.
+    """
+    if crs is None:
+        return xs, ys
+    geographic = ccrs.PlateCarree().transform_points(crs, np.asarray(xs, dtype=float), np.asarray(ys, dtype=float))
+    return geographic[:, 0], geographic[:, 1]
+
+
+def _paint_columnar(ax, geoms, projection, clip_box=None, crs=None, **kwargs):
+    """
+    Draws a ``ColumnarGeometry`` of polygons or lines onto the axis as a single ``PathCollection``. In the projected
+    case the vertices are transformed in bulk into the native coordinate reference system of the axis, instead of
+    being handed over to ``cartopy`` one geometry at a time. Note that unlike ``cartopy`` this does not cut geometries
+    crossing the boundaries of the projection.
+
+    Parameters
+    ----------
+    ax : matplotlib.Axes instance
+        The axis being plotted on.
+    geoms : ColumnarGeometry
+        The geometries being drawn.
+    projection : None or geoplot.crs instance
+        The projection, if one is used.
+    clip_box : None or (xmin, xmax, ymin, ymax) tuple, optional
+        If specified, the geometries are clipped to this box before being projected.
+    crs : cartopy.crs object instance, optional
+        The coordinate reference system of the geometries. Defaults to ``ccrs.PlateCarree()``.
+    kwargs : dict
+        Keyword arguments passed to the ``PathCollection``.
+
+    Returns
+    -------
+    ``matplotlib.collections.PathCollection`` instance
+    """
+    collection = mpl.collections.PathCollection(_columnar_paths(ax, geoms, projection, clip_box=clip_box, crs=crs),
+                                                **kwargs)
+    ax.add_collection(collection, autolim=False)
+    return collection
+
+
+def _columnar_paths(ax, geoms, projection, clip_box=None, crs=None):
+    """
+    Converts a ``ColumnarGeometry`` of polygons or lines into ``matplotlib`` paths in the native coordinates of the
+    axis, clipping and projecting them in bulk. Parameters are as for ``_paint_columnar``.
+
+    Returns
+    -------
+    list of ``matplotlib.path.Path`` instances
+    """
+    if clip_box is None:
+        if projection:
+            geoms = geoms.with_xy(*_project_coords(ax, geoms.x, geoms.y, crs=crs))
+        return geoms.paths()
+    paths = _clip_paths(geoms.paths(), clip_box, geoms.geom_type in ('Polygon', 'MultiPolygon'))
+    if projection and paths:
+        # Clipping changes the vertex count of the paths, so the vertices are gathered up for the bulk
+        # transform and split apart again afterwards.
+        stops = np.cumsum([len(path.vertices) for path in paths])
+        vertices = np.concatenate([path.vertices for path in paths])
+        vertices = np.column_stack(_project_coords(ax, vertices[:, 0], vertices[:, 1], crs=crs))
+        paths = [mpl.path.Path(v, path.codes) for v, path in zip(np.split(vertices, stops[:-1]), paths)]
+    return paths
+
+
+def _split_outline_kwargs(kwargs, edgecolor):
+    """
+    Splits the keyword arguments styling polygon outlines off of those styling their fills, for plots which draw
+    their outlines as the arcs of a ``Topology``. Line width and style are moved over to the outlines, while
+    transparency and drawing order are shared by both.
+
+    Parameters
+    ----------
+    kwargs : dict
+        The keyword arguments passed to the plot. Modified in place.
+    edgecolor : matplotlib color
+        The outline color.
+
+    Returns
+    -------
+    dict
+        Keyword arguments for ``_paint_arcs``.
+    """
+    arc_kwargs = {'colors': edgecolor}
+    for key in ('linewidth', 'linestyle'):
+        if key in kwargs:
+            arc_kwargs[key] = kwargs.pop(key)
+    for key in ('alpha', 'zorder'):
+        if key in kwargs:
+            arc_kwargs[key] = kwargs[key]
+    return arc_kwargs
+
+
+def _paint_arcs(ax, topology, projection, cull_box=None, clip_box=None, crs=None, **kwargs):
+    """
+    Draws the arcs of a ``Topology`` onto the axis as a single ``LineCollection``.
+
+    Parameters
+    ----------
+    ax : matplotlib.Axes instance
+        The axis being plotted on.
+    topology : Topology
+        The topology being drawn.
+    projection : None or geoplot.crs instance
+        The projection, if one is used.
+    cull_box : None or (xmin, xmax, ymin, ymax) tuple, optional
+        If specified, arcs falling wholly outside of this box are not drawn.
+    clip_box : None or (xmin, xmax, ymin, ymax) tuple, optional
+        If specified, arcs are clipped to this box before being projected.
+    crs : cartopy.crs object instance, optional
+        The coordinate reference system of the topology. Defaults to ``ccrs.PlateCarree()``.
+    kwargs : dict
+        Keyword arguments passed to the ``LineCollection``.
+
+    Returns
+    -------
+    ``matplotlib.collections.LineCollection`` instance
+    """
+    arcs = topology.arcs
+    if cull_box is not None:
+        arcs = arcs.take(_cull(arcs, cull_box))
+    if clip_box is None:
+        vertices, breaks = np.column_stack([arcs.x, arcs.y]), arcs.offsets[0][1:-1]
+    else:
+        lines = []
+        for path in _clip_paths(arcs.paths(), clip_box, False):
+            starts = [0] if path.codes is None else np.flatnonzero(path.codes == mpl.path.Path.MOVETO)
+            lines.extend(line for line in np.split(path.vertices, starts[1:]) if len(line) > 1)
+        vertices = np.concatenate(lines) if lines else np.empty((0, 2))
+        breaks = np.cumsum([len(line) for line in lines])[:-1]
+
+    # The arcs all share the same style, so they are joined up into a single line, broken apart by ``nan`` vertices.
+    # This is drawn (and written out by vector backends) as one path, instead of one per arc.
+    vertices = np.insert(vertices, breaks, np.nan, axis=0)
+    if projection:
+        vertices = np.column_stack(_project_coords(ax, vertices[:, 0], vertices[:, 1], crs=crs))
+    collection = mpl.collections.LineCollection([vertices], **kwargs)
+    ax.add_collection(collection, autolim=False)
+    return collection
+
+
+def _detail_box(ax, projection, view, crs=None):
+    """
+    Returns the area drawn by a level-of-detail layer for a view of the axis: the view padded by a margin, in the
+    coordinates of the data, as a ``(xmin, xmax, ymin, ymax)`` tuple. Also returns the width of a pixel in these
+    coordinates, at the center of the view.
+    """
+    box = _get_cull_box(ax, projection, view, _DETAIL_MARGIN, crs=crs)
+    pixel = (box[1] - box[0]) / (1 + 2 * _DETAIL_MARGIN) / max(ax.bbox.width, 1)
+    return box, pixel
+
+
+def _pad_view(view):
+    """
+    Pads a view of the axis, in its native coordinates, by the level-of-detail margin.
+    """
+    xmin, xmax = sorted(view[:2])
+    ymin, ymax = sorted(view[2:])
+    dx, dy = (xmax - xmin) * _DETAIL_MARGIN, (ymax - ymin) * _DETAIL_MARGIN
+    return xmin - dx, xmax + dx, ymin - dy, ymax + dy
+
+
+def _paint_detailed_polygons(ax, geoms, colors, projection, clip_box=None, crs=None, topology=None, arc_kwargs=None,
+                             **kwargs):
+    """
+    Draws a ``ColumnarGeometry`` of polygons as a level-of-detail layer. Whenever the view changes, the features
+    outside of it are culled, the rest are simplified down to the size of a pixel, and the result is swapped into the
+    ``PathCollection``. The arcs of a topology, if one is given, are culled (but not simplified) along with them.
+
+    Parameters
+    ----------
+    ax : matplotlib.Axes instance
+        The axis being plotted on. Its extent must already have been set.
+    geoms : ColumnarGeometry
+        The polygons being drawn.
+    colors : list or ndarray
+        One face color per polygon.
+    projection, clip_box, crs
+        As for ``_paint_columnar``.
+    topology : None or Topology, optional
+        The topology whose arcs outline the polygons, if any.
+    arc_kwargs : dict, optional
+        Keyword arguments for ``_paint_arcs``, as returned by ``_split_outline_kwargs``.
+    kwargs : dict
+        Keyword arguments passed to the ``PathCollection``.
+
+    Returns
+    -------
+    ``geoplot.LevelOfDetail`` instance
+    """
+    colors = np.asarray(colors)
+    collection = mpl.collections.PathCollection([], **kwargs)
+    ax.add_collection(collection, autolim=False)
+    arcs = []
+
+    def redraw(view):
+        box, pixel = _detail_box(ax, projection, view, crs=crs)
+        mask = _cull(geoms, box)
+        visible = geoms.take(mask).simplify(pixel)
+        collection.set_paths(_columnar_paths(ax, visible, projection, clip_box=clip_box, crs=crs))
+        collection.set_facecolor(colors[mask])
+        if topology is not None:
+            for artist in arcs:
+                artist.remove()
+            arcs[:] = [_paint_arcs(ax, topology, projection, cull_box=box, clip_box=clip_box, crs=crs, **arc_kwargs)]
+
+    layer = LevelOfDetail(ax, redraw)
+    layer.refresh()
+    return layer
+
+
+def _paint_detailed_points(ax, collection, xs, ys, colors, sizes):
+    """
+    Turns a ``pointplot`` scatter into a level-of-detail layer, which only holds the points inside of the view.
+
+    Parameters
+    ----------
+    ax : matplotlib.Axes instance
+        The axis being plotted on.
+    collection : matplotlib.collections.PathCollection
+        The scatter.
+    xs, ys : ndarray
+        The point coordinates, in the native coordinates of the axis.
+    colors : ndarray
+        The point colors, or a single color shared by all of them.
+    sizes : float or ndarray
+        The point sizes, or a single size shared by all of them.
+
+    Returns
+    -------
+    ``geoplot.LevelOfDetail`` instance
+    """
+    def redraw(view):
+        xmin, xmax, ymin, ymax = _pad_view(view)
+        mask = (xs >= xmin) & (xs <= xmax) & (ys >= ymin) & (ys <= ymax)
+        collection.set_offsets(np.column_stack([xs[mask], ys[mask]]))
+        if len(colors) > 1:
+            collection.set_facecolor(colors[mask])
+        if np.ndim(sizes):
+            collection.set_sizes(np.asarray(sizes)[mask])
+
+    layer = LevelOfDetail(ax, redraw)
+    layer.refresh()
+    return layer
+
+
+def _paint_detailed_raster(ax, image, xs, ys, weights, gridsize):
+    """
+    Turns a ``pointplot`` raster into a level-of-detail layer: whenever the view changes, the points inside of it are
+    re-binned onto a grid of the same size covering just the view. Counts are scaled by the ratio of the area of the
+    original cells to that of the new ones, so that colors (and the colorbar) keep standing for the same density.
+
+    Parameters
+    ----------
+    ax : matplotlib.Axes instance
+        The axis being plotted on.
+    image : matplotlib.image.AxesImage
+        The raster, as drawn by ``_paint_raster``.
+    xs, ys : ndarray
+        The point coordinates, in the native coordinates of the axis.
+    weights : None or ndarray
+        The ``hue`` values being averaged, if any.
+    gridsize : int or (int, int) tuple
+        A copy of the ``gridsize`` top-level parameter.
+
+    Returns
+    -------
+    ``geoplot.LevelOfDetail`` instance
+    """
+    x0, x1, y0, y1 = image.get_extent()
+    area = abs((x1 - x0) * (y1 - y0))
+
+    def redraw(view):
+        xmin, xmax = sorted(view[:2])
+        ymin, ymax = sorted(view[2:])
+        grid = _DensityGrid(gridsize, bounds=(xmin, xmax, ymin, ymax))
+        grid.add(xs, ys, weights)
+        empty = grid.counts == 0
+        if weights is None:
+            data = np.ma.masked_where(empty, grid.counts * (area / ((xmax - xmin) * (ymax - ymin))))
+        else:
+            data = np.ma.masked_where(empty, grid.sums / np.where(empty, 1, grid.counts))
+        image.set_data(data.T)
+        image.set_extent((xmin, xmax, ymin, ymax))
+
+    layer = LevelOfDetail(ax, redraw)
+    layer.refresh()
+    return layer
+
+
+def _paint_detailed_hexagons(ax, collection, xs, ys, values, gridsize, agg, nsig, cmap):
+    """
+    Turns a hexagonal ``aggplot`` into a level-of-detail layer: whenever the view changes, the points inside of it
+    are re-binned into hexagons spanning the view. Colors keep the scale of the full plot, and counts (when no
+    ``hue`` is aggregated) are scaled by the ratio of the area of the original hexagons to that of the new ones.
+
+    Parameters
+    ----------
+    ax : matplotlib.Axes instance
+        The axis being plotted on.
+    collection : matplotlib.collections.PolyCollection
+        The hexagons.
+    xs, ys : ndarray
+        The point coordinates, in the native coordinates of the axis.
+    values : None or ndarray
+        The ``hue`` values being aggregated, if any.
+    gridsize, agg, nsig
+        Copies of the top-level parameters of the same name.
+    cmap : matplotlib.cm.ScalarMappable
+        The colormap of the full plot.
+
+    Returns
+    -------
+    ``geoplot.LevelOfDetail`` instance
+    """
+    finite = np.isfinite(xs) & np.isfinite(ys)
+    width = np.ptp(xs[finite]) if finite.any() else 0
+
+    def redraw(view):
+        xmin, xmax, ymin, ymax = _pad_view(view)
+        mask = finite & (xs >= xmin) & (xs <= xmax) & (ys >= ymin) & (ys <= ymax)
+        verts, counts, aggregates = _hex_aggregate(xs[mask], ys[mask], None if values is None else values[mask],
+                                                   gridsize, agg)
+        if values is None and mask.any() and np.ptp(xs[mask]) > 0:
+            aggregates = aggregates * (width / np.ptp(xs[mask])) ** 2
+        colors = cmap.to_rgba(aggregates)
+        colors[counts <= nsig] = mpl.colors.to_rgba("white")
+        collection.set_verts(verts)
+        collection.set_facecolor(colors)
+
+    layer = LevelOfDetail(ax, redraw)
+    layer.refresh()
+    return layer
+
+
+def _paint_detailed_quadtree(ax, quadtree, hue, nmin, nmax, nsig, agg, cmap, projection, crs=None, **kwargs):
+    """
+    Draws the partitions of a quadtree as a level-of-detail layer. Whenever the view changes, the tree is
+    re-partitioned with ``nmin`` and ``nmax`` scaled down by the fraction of its points which are inside of the view,
+    so that about as many cells are visible at every zoom level, and the cells inside of the view are swapped into
+    the ``PathCollection``. The fraction is rounded to a power of four, which keeps the number of (memoized)
+    partitions of the tree small.
+
+    Parameters
+    ----------
+    ax : matplotlib.Axes instance
+        The axis being plotted on. Its extent must already have been set.
+    quadtree : QuadTree
+        The tree.
+    hue : ndarray
+        The values being aggregated.
+    nmin, nmax, nsig, agg
+        Copies of the top-level parameters of the same name, with the defaults filled in.
+    cmap : matplotlib.cm.ScalarMappable
+        The colormap of the full plot.
+    projection, crs
+        As for ``_paint_columnar``.
+    kwargs : dict
+        Keyword arguments passed to the ``PathCollection``.
+
+    Returns
+    -------
+    ``geoplot.LevelOfDetail`` instance
+    """
+    collection = mpl.collections.PathCollection([], **kwargs)
+    ax.add_collection(collection, autolim=False)
+    xs, ys = quadtree._xs[quadtree.indices], quadtree._ys[quadtree.indices]
+    floor = max(quadtree.max_colocated(), 1)
+
+    def redraw(view):
+        box, _ = _detail_box(ax, projection, view, crs=crs)
+        inside = np.count_nonzero((xs >= box[0]) & (xs <= box[1]) & (ys >= box[2]) & (ys <= box[3]))
+        level = max(int(np.round(np.log(len(xs) / inside) / np.log(4))), 0) if inside else 0
+        lo = max(nmin // 4 ** level, floor)
+        hi = max(nmax // 4 ** level, lo)
+        partitions = quadtree.partition(lo, hi)
+        bounds = np.array([p.bounds for p in partitions], dtype=float).reshape(-1, 4)
+        keep = np.flatnonzero((bounds[:, 0] <= box[1]) & (bounds[:, 1] >= box[0]) &
+                              (bounds[:, 2] <= box[3]) & (bounds[:, 3] >= box[2]))
+        colors = [cmap.to_rgba(agg(hue[partitions[i].indices])) if partitions[i].n > nsig else "white" for i in keep]
+        # Projected cells are densified, so that their edges follow the projection.
+        cells = _rectangles(bounds[keep], 16 if projection else 1)
+        collection.set_paths(_columnar_paths(ax, cells, projection, crs=crs))
+        collection.set_facecolor(colors)
+
+    layer = LevelOfDetail(ax, redraw)
+    layer.refresh()
+    return layer
+
+
+def _rectangles(bounds, segments=1):
+    """
+    Builds a ``ColumnarGeometry`` of rectangles out of an array of ``(xmin, xmax, ymin, ymax)`` rows, with each side
+    split into the given number of segments.
+    """
+    t = np.arange(segments) / segments
+    x0, x1, y0, y1 = (bounds[:, [i]] for i in range(4))
+    zeros = np.zeros_like(t)
+    xs = np.hstack([x0 + (x1 - x0) * t, x1 + zeros, x1 - (x1 - x0) * t, x0 + zeros, x0])
+    ys = np.hstack([y0 + zeros, y0 + (y1 - y0) * t, y1 + zeros, y1 - (y1 - y0) * t, y0])
+    n, npts = xs.shape
+    return ColumnarGeometry(xs.ravel(), ys.ravel(), geom_type='Polygon',
+                            offsets=(np.arange(n + 1), np.arange(n + 1) * npts))
+
+
+def _aggregate_flows(coords, columns, aggs, tolerance=None):
+    """
+    Merges routes sharing the same endpoints. Routes are grouped by hashing their endpoint coordinates, rather than by
+    sorting them.
+
+    Parameters
+    ----------
+    coords : (x0, y0, x1, y1) tuple of ndarray
+        The coordinates of the start and end points of each route.
+    columns : tuple of iterables or None
+        Per-route values to be combined, e.g. ``hue`` and ``scale``. None entries are passed through.
+    aggs : tuple of functions
+        The functions combining the values of merged routes, one per entry of ``columns``, as accepted by
+        ``pandas.Series.groupby(...).agg``.
+    tolerance : float, optional
+        If specified, endpoints are first snapped to a grid of this cell size, and merged routes are drawn between
+        the mean endpoints of their members. Otherwise only identical routes are merged.
+
+    Returns
+    -------
+    (coords, columns) : tuple
+        The coordinates and values of the merged routes, in order of first appearance. Routes with missing
+        coordinates are dropped.
+    """
+    coords = np.column_stack([np.asarray(c, dtype=float) for c in coords])
+    valid = np.isfinite(coords).all(axis=1)
+    coords = coords[valid]
+    keys = coords if tolerance is None else np.round(coords / tolerance)
+    codes = pd.DataFrame(keys).groupby([0, 1, 2, 3], sort=False).ngroup().values
+    n = codes.max() + 1 if len(codes) else 0
+    if tolerance is None:
+        first = np.full(n, len(codes))
+        np.minimum.at(first, codes, np.arange(len(codes)))
+        merged = coords[first]
+    else:
+        counts = np.bincount(codes, minlength=n)
+        merged = np.column_stack([np.bincount(codes, weights=c, minlength=n) / counts for c in coords.T])
+
+    def combine(column, agg):
+        if column is None:
+            return None
+        values = np.asarray(list(column) if not hasattr(column, '__len__') else column)[valid]
+        return pd.Series(values).groupby(codes).agg(agg).values
+
+    return tuple(merged.T), tuple(combine(column, agg) for column, agg in zip(columns, aggs))
+
+
+# The length, in degrees of arc, of the segments great circle routes are broken into.
+_GREAT_CIRCLE_RESOLUTION = 1.0
+
+
+def _great_circle_lines(x0, y0, x1, y1, central_longitude=0.0, resolution=_GREAT_CIRCLE_RESOLUTION):
+    """
+    Computes the great circle routes between pairs of (longitude, latitude) points, all at once. Each route is broken
+    into segments no longer than ``resolution`` degrees of arc, so longer routes get more vertices, and the vertices
+    are spherically interpolated (slerped) between the endpoints.
+
+    Longitudes are wrapped into the 360 degree range centered on ``central_longitude``, and routes crossing its
+    antipode, the seam of a map centered there, are split into two parts, one on each side of the seam.
+
+    Parameters
+    ----------
+    x0, y0, x1, y1 : ndarray
+        The longitudes and latitudes of the start and end points.
+    central_longitude : float, optional
+        The central longitude of the map. Defaults to 0.
+    resolution : float, optional
+        The maximum segment length, in degrees of arc. Defaults to one degree.
+
+    Returns
+    -------
+    A ``ColumnarGeometry`` of ``MultiLineString`` routes, in longitude and latitude.
+    """
+    def to_xyz(lon, lat):
+        lon, lat = np.radians(np.asarray(lon, dtype=float)), np.radians(np.asarray(lat, dtype=float))
+        return np.column_stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+
+    p0, p1 = to_xyz(x0, y0), to_xyz(x1, y1)
+    n = len(p0)
+    omega = np.arccos(np.clip(np.einsum('ij,ij->i', p0, p1), -1, 1))
+    finite = np.isfinite(omega)
+    nsegs = np.ones(n, dtype=int)
+    nsegs[finite] = np.maximum(np.ceil(np.degrees(omega[finite]) / resolution), 1)
+
+    # Slerp every vertex of every route in one go. Routes between (nearly) coincident points fall back to linear
+    # interpolation, which is just as good over such short distances.
+    co = np.concatenate([[0], np.cumsum(nsegs + 1)])
+    route = np.repeat(np.arange(n), nsegs + 1)
+    t = (np.arange(co[-1]) - co[route]) / nsegs[route]
+    sin_omega = np.sin(omega)[route]
+    degenerate = sin_omega < 1e-9
+    safe_sin = np.where(degenerate, 1, sin_omega)
+    w0 = np.where(degenerate, 1 - t, np.sin((1 - t) * omega[route]) / safe_sin)
+    w1 = np.where(degenerate, t, np.sin(t * omega[route]) / safe_sin)
+    p = w0[:, np.newaxis] * p0[route] + w1[:, np.newaxis] * p1[route]
+    lons = np.degrees(np.arctan2(p[:, 1], p[:, 0]))
+    lats = np.degrees(np.arctan2(p[:, 2], np.hypot(p[:, 0], p[:, 1])))
+    west = central_longitude - 180
+    lons = (lons - west) % 360 + west
+
+    # Split routes at the seam. Where consecutive vertices of a route jump more than half way around the globe, a
+    # vertex is inserted on either side of the seam (just inside of it, so that it projects onto the correct side),
+    # and a new part starts at the second of them.
+    breaks = np.flatnonzero((np.abs(np.diff(lons)) > 180) & (route[1:] == route[:-1]))
+    a, b = breaks, breaks + 1
+    eastward = lons[b] < lons[a]
+    seam = np.where(eastward, west + 360, west)
+    unwrapped = np.where(eastward, lons[b] + 360, lons[b] - 360)
+    f = (seam - lons[a]) / (unwrapped - lons[a])
+    seam_lats = lats[a] + f * (lats[b] - lats[a])
+    nudge = np.where(eastward, 1e-9, -1e-9)
+    inserted_lons = np.column_stack([seam - nudge, seam + nudge - np.where(eastward, 360, -360)]).ravel()
+    inserted_lats = np.column_stack([seam_lats, seam_lats]).ravel()
+    lons = np.insert(lons, np.repeat(b, 2), inserted_lons)
+    lats = np.insert(lats, np.repeat(b, 2), inserted_lats)
+
+    route_starts = co[:-1] + 2 * np.searchsorted(b, co[:-1], side='right')
+    break_starts = b + 2 * np.arange(len(b)) + 1
+    part_offsets = np.concatenate([np.sort(np.concatenate([route_starts, break_starts])), [len(lons)]])
+    parts_per_route = 1 + np.bincount(route[a], minlength=n)
+    geom_offsets = np.concatenate([[0], np.cumsum(parts_per_route)])
+    return ColumnarGeometry(lons, lats, geom_type='MultiLineString', offsets=(geom_offsets, part_offsets))
+
+
+def _straight_lines(x0, y0, x1, y1, nsegs=1):
+    """
+    Builds straight routes between pairs of points, each broken into ``nsegs`` equal segments (so that they bend as
+    they should when transformed into another coordinate reference system).
+
+    Parameters
+    ----------
+    x0, y0, x1, y1 : ndarray
+        The coordinates of the start and end points.
+    nsegs : int or ndarray, optional
+        The number of segments per route. Defaults to 1.
+
+    Returns
+    -------
+    A ``ColumnarGeometry`` of ``LineString`` routes.
+    """
+    x0, y0, x1, y1 = [np.asarray(arr, dtype=float) for arr in (x0, y0, x1, y1)]
+    nsegs = np.broadcast_to(np.asarray(nsegs, dtype=int), x0.shape)
+    co = np.concatenate([[0], np.cumsum(nsegs + 1)])
+    route = np.repeat(np.arange(len(x0)), nsegs + 1)
+    t = (np.arange(co[-1]) - co[route]) / nsegs[route]
+    xs = x0[route] + t * (x1 - x0)[route]
+    ys = y0[route] + t * (y1 - y0)[route]
+    return ColumnarGeometry(xs, ys, geom_type='LineString', offsets=(co,))
+
+
+def _grouped_convex_hulls(xs, ys, codes, n):
+    """
+    Computes the convex hulls of many groups of points at once. The points are sorted by group (and, within each
+    group, by coordinate) just once, after which every group occupies a contiguous slice of the sorted arrays. Points
+    lying strictly inside the quadrilateral spanned by the four extreme points of their group cannot be on its hull,
+    and are discarded in bulk beforehand (the Akl-Toussaint heuristic), which leaves only a handful of candidate points
+    per group for Andrew's monotone chain algorithm to go over.
+
+    Parameters
+    ----------
+    xs, ys : ndarray
+        The point coordinates. Non-finite points are ignored.
+    codes : ndarray
+        The integer group of each point, between 0 and ``n - 1``. Points with a negative code are ignored.
+    n : int
+        The number of groups.
+
+    Returns
+    -------
+    (hulls, areas, bounds) : tuple
+        A list of ``(k, 2)`` arrays of hull vertices, one per group, in counterclockwise order. As with ``shapely``,
+        the hull of a group of collinear points is the segment between its two extreme points (``k = 2``), and that of
+        a group of identical points is that point (``k = 1``). Then the ``(n,)`` hull areas, and ``(n, 4)`` hull
+        ``(minx, miny, maxx, maxy)`` bounds. Groups without any points have an empty hull, zero area and ``nan``
+        bounds.
+    """
+    xs, ys, codes = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float), np.asarray(codes)
+    valid = (codes >= 0) & np.isfinite(xs) & np.isfinite(ys)
+    xs, ys, codes = xs[valid], ys[valid], codes[valid]
+
+    # Sort by group, then x, then y, and drop duplicate points, which are now adjacent.
+    order = np.lexsort((ys, xs, codes))
+    xs, ys, codes = xs[order], ys[order], codes[order]
+    unique = np.ones(len(xs), dtype=bool)
+    unique[1:] = (codes[1:] != codes[:-1]) | (xs[1:] != xs[:-1]) | (ys[1:] != ys[:-1])
+    xs, ys, codes = xs[unique], ys[unique], codes[unique]
+
+    starts = np.searchsorted(codes, np.arange(n), side='left')
+    stops = np.searchsorted(codes, np.arange(n), side='right')
+    nonempty = stops > starts
+
+    # The extreme points of each group: leftmost and rightmost come straight out of the sort order, bottommost and
+    # topmost out of a second sort by y.
+    y_order = np.lexsort((xs, ys, codes))
+    left, right = starts[nonempty], stops[nonempty] - 1
+    bottom, top = y_order[starts[nonempty]], y_order[stops[nonempty] - 1]
+    bounds = np.full((n, 4), np.nan)
+    bounds[nonempty] = np.column_stack([xs[left], ys[bottom], xs[right], ys[top]])
+
+    # Akl-Toussaint filter. The quadrilateral runs counterclockwise from the leftmost point, through the bottommost,
+    # rightmost, and topmost ones; points strictly to the left of all four of its edges are strictly inside of it.
+    group = np.zeros(n, dtype=int)
+    group[nonempty] = np.arange(nonempty.sum())
+    g = group[codes]
+    quad = [(xs[left][g], ys[left][g]), (xs[bottom][g], ys[bottom][g]), (xs[right][g], ys[right][g]),
+            (xs[top][g], ys[top][g])]
+    inside = np.ones(len(xs), dtype=bool)
+    for (ax_, ay_), (bx_, by_) in zip(quad, quad[1:] + quad[:1]):
+        inside &= (bx_ - ax_) * (ys - ay_) - (by_ - ay_) * (xs - ax_) > 0
+    xs, ys, codes = xs[~inside], ys[~inside], codes[~inside]
+    starts = np.searchsorted(codes, np.arange(n), side='left')
+    stops = np.searchsorted(codes, np.arange(n), side='right')
+
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    def half_hull(points):
+        chain = []
+        for p in points:
+            while len(chain) >= 2 and cross(chain[-2], chain[-1], p) <= 0:
+                chain.pop()
+            chain.append(p)
+        return chain
+
+    hulls = []
+    areas = np.zeros(n)
+    xs_list, ys_list = xs.tolist(), ys.tolist()
+    for i, (start, stop) in enumerate(zip(starts, stops)):
+        points = list(zip(xs_list[start:stop], ys_list[start:stop]))
+        if len(points) < 3:
+            hulls.append(np.array(points, dtype=float).reshape(-1, 2))
+            continue
+        lower, upper = half_hull(points), half_hull(reversed(points))
+        hull = np.array(lower[:-1] + upper[:-1], dtype=float)
+        hulls.append(hull)
+        if len(hull) > 2:
+            hx, hy = hull[:, 0], hull[:, 1]
+            areas[i] = 0.5 * np.abs(np.dot(hx, np.roll(hy, -1)) - np.dot(hy, np.roll(hx, -1)))
+
+    return hulls, areas, bounds
+
+
+def _hex_aggregate(xs, ys, values, gridsize, agg):
+    """
+    Bins points into the cells of a regular hexagonal grid covering them, and aggregates a variable over each cell.
+    Points are assigned to cells arithmetically, using the same two-lattice scheme as ``matplotlib.pyplot.hexbin``:
+    every point is a candidate for the nearest center of each of two offset rectangular lattices, and the closer of
+    the two wins.
+
+    Parameters
+    ----------
+    xs, ys : ndarray
+        The point coordinates. Non-finite points are ignored.
+    values : None or ndarray
+        The variable being aggregated. If this is None the number of points in each cell is reported instead.
+    gridsize : int
+        The number of hexagons spanning the width of the data.
+    agg : function
+        The aggregation function, applied to the values falling inside of each cell.
+
+    Returns
+    -------
+    (verts, counts, aggregates) : tuple
+        The ``(m, 6, 2)`` vertices of the ``m`` occupied cells, the number of points in each of them, and their
+        aggregate values.
+    """
+    xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+    valid = np.isfinite(xs) & np.isfinite(ys)
+    if not valid.all():
+        xs, ys = xs[valid], ys[valid]
+        values = None if values is None else values[valid]
+    if len(xs) == 0:
+        return np.empty((0, 6, 2)), np.empty(0, dtype=int), np.empty(0)
+
+    xmin, ymin = xs.min(), ys.min()
+    sx = (xs.max() - xmin) / gridsize or 1.0
+    sy = sx * np.sqrt(3)
+    xn, yn = (xs - xmin) / sx, (ys - ymin) / sy
+    ix1, iy1 = np.round(xn), np.round(yn)
+    ix2, iy2 = np.floor(xn), np.floor(yn)
+    on_first = (xn - ix1) ** 2 + 3.0 * (yn - iy1) ** 2 <= (xn - ix2 - 0.5) ** 2 + 3.0 * (yn - iy2 - 0.5) ** 2
+
+    # Cell centers are indexed in half-lattice units, with the first lattice falling on the even indices and the
+    # second on the odd ones, and flattened into a single integer cell id.
+    hx = np.where(on_first, 2 * ix1, 2 * ix2 + 1).astype(np.int64)
+    hy = np.where(on_first, 2 * iy1, 2 * iy2 + 1).astype(np.int64)
+    width = hx.max() + 1
+    cells = hy * width + hx
+
+    groups = pd.Series(np.ones(len(cells)) if values is None else values).groupby(cells)
+    counts = groups.size()
+    aggregates = counts if values is None else groups.agg(agg)
+
+    ids = counts.index.values
+    centers = np.column_stack([xmin + (ids % width) * (sx / 2), ymin + (ids // width) * (sy / 2)])
+    hexagon = np.array([[.5, -.5], [.5, .5], [0., 1.], [-.5, .5], [-.5, -.5], [0., -1.]]) * [sx, sy / 3]
+    return centers[:, np.newaxis, :] + hexagon, counts.values, np.asarray(aggregates.values, dtype=float)
+
+
+def _is_chunked(df):
+    """
+    Checks whether or not the input is an iterator of chunks of data, e.g. a generator of ``GeoDataFrame`` objects,
+    rather than a single dataset.
+
+    Parameters
+    ----------
+    df : object
+        The input data.
+
+    Returns
+    -------
+    boolean
+    """
+    return hasattr(df, '__next__') and not isinstance(df, (pd.DataFrame, pd.Series, ColumnarGeometry))
+
+
+class _DensityGrid:
+    """
+    A fixed-size grid of point counts (and optionally sums of a weight variable), accumulated over a stream of
+    chunks of points.
+
+    If no bounds are given the grid starts out covering the first chunk. Points falling outside of the grid later on
+    are accommodated by doubling the cell size along the offending axis and merging cells pairwise, so the memory
+    footprint of the grid never changes. The final cell size is within a factor of two of the one that would have
+    been used had the full extent of the data been known up front.
+    """
+    def __init__(self, gridsize, bounds=None):
+        nx, ny = (gridsize, gridsize) if np.isscalar(gridsize) else gridsize
+        # Grid dimensions are rounded up to even numbers so that cells can always be merged pairwise.
+        self.shape = (int(nx) + int(nx) % 2, int(ny) + int(ny) % 2)
+        self.bounds = None if bounds is None else tuple(bounds)
+        self.fixed = bounds is not None
+        self.counts = np.zeros(self.shape)
+        self.sums = None
+
+    def add(self, xs, ys, weights=None):
+        """
+        Adds a chunk of points to the grid. Non-finite points are ignored, as are points falling outside of the
+        bounds of the grid if those were fixed at initialization.
+        """
+        keep = np.isfinite(xs) & np.isfinite(ys)
+        if weights is not None:
+            keep &= np.isfinite(weights)
+            if self.sums is None:
+                self.sums = np.zeros(self.shape)
+        if self.fixed:
+            x0, x1, y0, y1 = self.bounds
+            keep &= (xs >= x0) & (xs <= x1) & (ys >= y0) & (ys <= y1)
+        if not keep.all():
+            xs, ys = xs[keep], ys[keep]
+            weights = None if weights is None else weights[keep]
+        if len(xs) == 0:
+            return
+        if not self.fixed:
+            self._fit(xs.min(), xs.max(), ys.min(), ys.max())
+
+        nx, ny = self.shape
+        x0, x1, y0, y1 = self.bounds
+        ix = np.clip(((xs - x0) * (nx / (x1 - x0))).astype(int), 0, nx - 1)
+        iy = np.clip(((ys - y0) * (ny / (y1 - y0))).astype(int), 0, ny - 1)
+        cells = ix * ny + iy
+        self.counts += np.bincount(cells, minlength=nx * ny).reshape(self.shape)
+        if weights is not None:
+            self.sums += np.bincount(cells, weights=weights, minlength=nx * ny).reshape(self.shape)
+
+    def _fit(self, xmin, xmax, ymin, ymax):
+        if self.bounds is None:
+            # Single-valued spans are padded out, so that the grid always has a nonzero size.
+            self.bounds = (xmin, xmin + ((xmax - xmin) or 1.0), ymin, ymin + ((ymax - ymin) or 1.0))
+            return
+        x0, x1, y0, y1 = self.bounds
+        while xmin < x0 or xmax > x1:
+            left = xmin < x0
+            self._coarsen(0, left)
+            x0, x1 = (x0 - (x1 - x0), x1) if left else (x0, x1 + (x1 - x0))
+        while ymin < y0 or ymax > y1:
+            left = ymin < y0
+            self._coarsen(1, left)
+            y0, y1 = (y0 - (y1 - y0), y1) if left else (y0, y1 + (y1 - y0))
+        self.bounds = (x0, x1, y0, y1)
+
+    def _coarsen(self, axis, left):
+        # Merges neighboring cells pairwise along the given axis, and moves the result into the half of the grid
+        # nearest the side which is *not* being grown.
+        for name in ('counts', 'sums'):
+            grid = getattr(self, name)
+            if grid is None:
+                continue
+            shape = list(grid.shape)
+            shape[axis:axis + 1] = [shape[axis] // 2, 2]
+            merged = grid.reshape(shape).sum(axis=axis + 1)
+            pad = np.zeros_like(merged)
+            setattr(self, name, np.concatenate([pad, merged] if left else [merged, pad], axis=axis))
+
+
+def _paint_kde(ax, grid, n_levels=10, shade=False, shade_lowest=True, cmap=None, **kwargs):
+    """
+    Draws the contours of a ``KDEGrid``.
+
+    Parameters
+    ----------
+    ax : AxesSubplot or GeoAxesSubplot instance
+        The axis being plotted on. The grid is drawn in its native coordinates.
+    grid : KDEGrid
+        The density.
+    n_levels : int or list, optional
+        The number of contour levels, or the levels themselves. Defaults to 10.
+    shade : boolean, optional
+        Whether to fill the contours, or only to draw their outlines. Defaults to False.
+    shade_lowest : boolean, optional
+        Whether or not to fill the lowest contour band, which covers the entire grid. Defaults to True.
+    cmap : matplotlib color map instance or str, optional
+        The colormap. Defaults to "BuGn".
+    kwargs : dict, optional
+        Keyword arguments passed to ``ax.contour`` or ``ax.contourf``.
+
+    Returns
+    -------
+    The ``matplotlib`` ``ContourSet``.
+    """
+    levels = n_levels
+    if np.isscalar(n_levels):
+        levels = mpl.ticker.MaxNLocator(n_levels + 1).tick_values(grid.density.min(), grid.density.max())
+    if shade and not shade_lowest:
+        levels = levels[1:]
+    xx, yy = grid.coordinates()
+    contour = ax.contourf if shade else ax.contour
+    return contour(xx, yy, grid.density, levels, cmap=cmap or 'BuGn', **kwargs)
+
+
+def _paint_raster(ax, projection, chunks, hue, gridsize, extent, cmap, vmin, vmax, legend, legend_kwargs, crs=None,
+                  **kwargs):
+    """
+    Streams chunks of point data onto a ``_DensityGrid`` and draws the result as an image. Only running statistics
+    of the data are kept, which are used to set the extent and the colorbar once the stream is exhausted.
+
+    Parameters
+    ----------
+    ax : matplotlib.Axes instance
+        The axis being plotted on.
+    projection : None or geoplot.crs instance
+        The projection, if one is used. Points are binned in the native coordinates of the axis.
+    chunks : iterable
+        The chunks of point data.
+    hue : None, str, or iterable
+        The name of the column to be colorized, or its values if there is just a single chunk.
+    gridsize, extent, cmap, vmin, vmax, legend, legend_kwargs
+        Copies of the top-level parameters of the same name.
+    crs : None or cartopy.crs.Projection instance, optional
+        The coordinate reference system of the data, as returned by ``_get_crs`` on the first chunk.
+    kwargs : dict
+        Keyword arguments passed to ``matplotlib.pyplot.imshow``.
+
+    Returns
+    -------
+    ``matplotlib.image.AxesImage`` instance, or None if there were no points to draw
+    """
+    # If an extent was given the grid covers exactly the visible area, and points outside of it are discarded.
+    grid = _DensityGrid(gridsize, bounds=(ax.get_xlim() + ax.get_ylim()) if extent else None)
+    xmin, xmax, ymin, ymax = np.inf, -np.inf, np.inf, -np.inf
+    hmin, hmax = np.inf, -np.inf
+
+    for chunk in chunks:
+        xs, ys = _get_xy(chunk)
+        xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+        weights = None
+        if hue is not None:
+            weights = np.asarray(chunk[hue] if isinstance(hue, str) else hue, dtype=float)
+            if np.isfinite(weights).any():
+                hmin, hmax = min(hmin, np.nanmin(weights)), max(hmax, np.nanmax(weights))
+        finite = np.isfinite(xs) & np.isfinite(ys)
+        if finite.any():
+            xmin, xmax = min(xmin, xs[finite].min()), max(xmax, xs[finite].max())
+            ymin, ymax = min(ymin, ys[finite].min()), max(ymax, ys[finite].max())
+        if projection:
+            xs, ys = _project_coords(ax, xs, ys, crs=crs)
+        grid.add(xs, ys, weights)
+
+    empty = grid.counts == 0
+    if hue is None:
+        image = np.ma.masked_where(empty, grid.counts)
+        limits = (image.min(), image.max()) if not empty.all() else (0, 1)
+    else:
+        image = np.ma.masked_where(empty, grid.sums / np.where(empty, 1, grid.counts))
+        limits = (hmin, hmax) if np.isfinite(hmin) else (0, 1)
+    cmap = _continuous_colormap(limits, cmap, vmin, vmax)
+
+    imshow_kwargs = {'origin': 'lower', 'interpolation': 'nearest', 'cmap': cmap.cmap, 'norm': cmap.norm}
+    if projection:
+        imshow_kwargs['transform'] = ax.projection
+    else:
+        imshow_kwargs['aspect'] = 'auto'
+    imshow_kwargs.update(kwargs)
+    if grid.bounds is not None:
+        image = ax.imshow(image.T, extent=grid.bounds, **imshow_kwargs)
+    else:
+        image = None
+
+    if legend:
+        _paint_colorbar_legend(ax, np.array(limits), cmap, legend_kwargs)
+
+    # Drawing the image resets the plot limits, so these are set (again) last.
+    if extent or np.isfinite(xmin):
+        _set_extent(ax, projection, extent, (xmin, xmax, ymin, ymax), crs=crs)
+    return image
+
+
+def _get_cull_box(ax, projection, extent, margin, crs=None):
+    """
+    Returns the box outside of which features are culled, or None if no culling is to be done. This is the plot
+    extent, padded by a margin.
+
+    Parameters
+    ----------
+    ax : matplotlib.Axes instance
+        The axis being plotted on. Its extent must already have been set.
+    projection : None or geoplot.crs instance
+        The projection, if one is used.
+    extent : None or (xmin, xmax, ymin, ymax) tuple
+        A copy of the ``extent`` top-level parameter. Culling is only done if this is specified.
+    margin : None or float
+        A copy of the ``cull_margin`` top-level parameter: the fraction of the width and height of the extent to
+        pad it by. Culling is disabled if this is None.
+    crs : None or cartopy.crs.Projection instance, optional
+        The coordinate reference system of the input data, as returned by ``_get_crs``.
+
+    Returns
+    -------
+    None or (xmin, xmax, ymin, ymax) tuple
+        The culling box, in the coordinates of the input data.
+    """
+    if not extent or margin is None:
+        return None
+    if projection:
+        # The projected view is the bounding box of the projected extent, which can take in more than the extent
+        # itself does (e.g. at the corners of a conic projection). So read the visible area back off of the axis.
+        xmin, xmax, ymin, ymax = ax.get_extent(crs=crs if crs is not None else ccrs.PlateCarree())
+    else:
+        xmin, xmax, ymin, ymax = extent
+    dx, dy = (xmax - xmin) * margin, (ymax - ymin) * margin
+    return xmin - dx, xmax + dx, ymin - dy, ymax + dy
+
+
+def _cull(df, box, bounds=None):
+    """
+    Finds the features in a dataset which are (potentially) visible within a box, using their bounding boxes. The
+    ``geopandas`` spatial index is used to answer the query when it is available.
+
+    Parameters
+    ----------
+    df : GeoDataFrame, GeoSeries, or ColumnarGeometry
+        The data being plotted. Ignored if ``bounds`` is specified.
+    box : (xmin, xmax, ymin, ymax) tuple
+        The culling box, as returned by ``_get_cull_box``.
+    bounds : (minxs, minys, maxxs, maxys) tuple, optional
+        Precomputed feature bounding boxes, to be used instead of those of ``df``.
+
+    Returns
+    -------
+    ndarray
+        A boolean mask which is True for the features that are kept.
+    """
+    xmin, xmax, ymin, ymax = box
+    if bounds is None:
+        if isinstance(df, ColumnarGeometry):
+            bounds = df.bounds().T
+        else:
+            geoms = df.geometry
+            try:
+                sindex = geoms.sindex
+            except ImportError:  # No spatial index backend is installed.
+                sindex = None
+            if sindex is not None:
+                mask = np.zeros(len(geoms), dtype=bool)
+                mask[np.fromiter(sindex.intersection((xmin, ymin, xmax, ymax)), dtype=int)] = True
+                return mask
+            bounds = geoms.bounds.values.T
+    minxs, minys, maxxs, maxys = bounds
+    return (minxs <= xmax) & (maxxs >= xmin) & (minys <= ymax) & (maxys >= ymin)
+
+
+def _scale_values(values, limits, scale_func):
+    """
+    Computes the size multiples of the ``scale`` data of a plot.
+
+    Parameters
+    ----------
+    values : iterable
+        The ``scale`` data.
+    limits : (min, max) tuple
+        The limits of the default linear scale.
+    scale_func : callable or None
+        The scaling function factory, as passed to the plot. If None, ``geoplot.linear_scale`` is used. The scaling
+        function it returns is applied to all of the values at once if it is vectorized (see
+        ``geoplot.vectorized``), and to each value in turn otherwise.
+
+    Returns
+    -------
+    (dscale, multiples) : tuple
+        The scaling function, which the legend reuses, and an ndarray of the size multiples of the values.
+    """
+    values = np.asarray(values)
+    dmin, dmax = np.min(values), np.max(values)
+    dscale = scale_func(dmin, dmax) if scale_func else linear_scale(dmin, dmax, limits=limits)
+    if is_vectorized(dscale):
+        return dscale, np.asarray(dscale(values), dtype=float)
+    else:
+        return dscale, np.array([dscale(v) for v in values], dtype=float)
+
+
+def _descending_order(values):
+    """
+    Returns the indices which sort an array of sizes or areas from largest to smallest, as used to draw small markers
+    and sectors in front of the large ones which would otherwise hide them. Ties are drawn in reverse input order.
+    """
+    return np.argsort(np.asarray(values), kind='mergesort')[::-1]
+
+
+def _take(df, mask):
+    """
+    Selects the features of a dataset (or the entries of a per-feature list) flagged by a boolean mask.
+
+    Parameters
+    ----------
+    df : GeoDataFrame, GeoSeries, ColumnarGeometry, ndarray, or list
+        The data being selected from.
+    mask : ndarray
+        The boolean mask, as returned by ``_cull``.
+
+    Returns
+    -------
+    The selected subset, of the same type as the input.
+    """
+    if isinstance(df, ColumnarGeometry):
+        return df.take(mask)
+    elif isinstance(df, list):
+        return [v for v, keep in zip(df, mask) if keep]
+    else:
+        return df[mask]
+
+
+def _clip_geometries(geoms, box):
+    """
+    Clips the ``shapely`` geometries which straddle the edge of a box to that box. Geometries falling wholly inside
+    of the box are passed through as-is.
+
+    Parameters
+    ----------
+    geoms : GeoSeries
+        The geometries being clipped.
+    box : (xmin, xmax, ymin, ymax) tuple
+        The clipping box.
+
+    Returns
+    -------
+    list
+        The clipped geometries.
+    """
+    xmin, xmax, ymin, ymax = box
+    clip_geom = shapely.geometry.box(xmin, ymin, xmax, ymax)
+    out = []
+    for geom, (gxmin, gymin, gxmax, gymax) in zip(geoms, geoms.bounds.values):
+        if gxmin >= xmin and gxmax <= xmax and gymin >= ymin and gymax <= ymax:
+            out.append(geom)
+            continue
+        clipped = geom.intersection(clip_geom)
+        if clipped.geom_type == 'GeometryCollection':
+            # Edges running along the clip box produce lower-dimensional slivers, which are dropped.
+            dim = 2 if 'Polygon' in geom.geom_type else 1
+            parts = [part for part in clipped.geoms
+                     if ('Polygon' in part.geom_type) == (dim == 2) and 'Point' not in part.geom_type]
+            clipped = shapely.ops.unary_union(parts) if parts else shapely.geometry.GeometryCollection()
+        out.append(clipped)
+    return out
+
+
+def _clip_paths(paths, box, polygonal):
+    """
+    Clips the ``matplotlib`` paths which straddle the edge of a box to that box. Used for clipping
+    ``ColumnarGeometry`` input.
+
+    Parameters
+    ----------
+    paths : list of matplotlib.path.Path instances
+        The paths being clipped.
+    box : (xmin, xmax, ymin, ymax) tuple
+        The clipping box.
+    polygonal : boolean
+        Whether the paths are made up of closed polygons or of lines.
+
+    Returns
+    -------
+    list of matplotlib.path.Path instances
+        The clipped paths.
+    """
+    xmin, xmax, ymin, ymax = box
+    bbox = mpl.transforms.Bbox.from_extents(xmin, ymin, xmax, ymax)
+    clip_geom = shapely.geometry.box(xmin, ymin, xmax, ymax)
+    out = []
+    for path in paths:
+        v = path.vertices
+        if len(v) == 0 or (v[:, 0].min() >= xmin and v[:, 0].max() <= xmax and
+                           v[:, 1].min() >= ymin and v[:, 1].max() <= ymax):
+            out.append(path)
+        elif polygonal:
+            out.append(path.clip_to_bbox(bbox))
+        else:
+            # matplotlib can only clip polygons, so lines are clipped using shapely instead.
+            starts = np.flatnonzero(path.codes == mpl.path.Path.MOVETO)
+            clipped = shapely.geometry.MultiLineString(np.split(v, starts[1:])).intersection(clip_geom)
+            lines = [np.asarray(line.coords) for line in getattr(clipped, 'geoms', [clipped])
+                     if line.geom_type == 'LineString' and not line.is_empty]
+            if lines:
+                out.append(mpl.path.Path.make_compound_path(*[mpl.path.Path(line) for line in lines]))
+            else:
+                out.append(mpl.path.Path(np.empty((0, 2))))
+    return out
+
+
+def _get_envelopes_min_maxes(envelopes):
+    """
+    Returns the extrema of the inputted polygonal envelopes. Used for setting chart extent where appropriate. Note
+    tha the ``Quadtree.bounds`` object property serves a similar role.
+
+    Parameters
+    ----------
+    envelopes : GeoSeries
+        The envelopes of the given geometries, as would be returned by e.g. ``data.geometry.envelope.exterior``.
+
+    Returns
+    -------
+    (xmin, xmax, ymin, ymax) : tuple
+        The data extrema.
+
+    """
+    xmin = np.min(envelopes.map(lambda linearring: np.min([linearring.coords[1][0],
+                                                          linearring.coords[2][0],
+                                                          linearring.coords[3][0],
+                                                          linearring.coords[4][0]])))
+    xmax = np.max(envelopes.map(lambda linearring: np.max([linearring.coords[1][0],
+                                                          linearring.coords[2][0],
+                                                          linearring.coords[3][0],
+                                                          linearring.coords[4][0]])))
+    ymin = np.min(envelopes.map(lambda linearring: np.min([linearring.coords[1][1],
+                                                           linearring.coords[2][1],
+                                                           linearring.coords[3][1],
+                                                           linearring.coords[4][1]])))
+    ymax = np.max(envelopes.map(lambda linearring: np.max([linearring.coords[1][1],
+                                                           linearring.coords[2][1],
+                                                           linearring.coords[3][1],
+                                                           linearring.coords[4][1]])))
+    return xmin, xmax, ymin, ymax
+
+
+def _get_envelopes_centroid(envelopes):
+    """
+    Returns the centroid of an inputted geometry column. Not currently in use, as this is now handled by this
+    library's CRS wrapper directly. Light wrapper over ``_get_envelopes_min_maxes``.
+
+    Parameters
+    ----------
+    envelopes : GeoSeries
+        The envelopes of the given geometries, as would be returned by e.g. ``data.geometry.envelope``.
+
+    Returns
+    -------
+    (mean_x, mean_y) : tuple
+        The data centroid.
+    """
+    xmin, xmax, ymin, ymax = _get_envelopes_min_maxes(envelopes)
+    return np.mean(xmin, xmax), np.mean(ymin, ymax)
+
+
+def _set_extent(ax, projection, extent, extrema, crs=None):
+    """
+    Sets the plot extent.
+
+    Parameters
+    ----------
+    ax : cartopy.GeoAxesSubplot instance
+        The axis whose boundaries are being tweaked.
+    projection : None or geoplot.crs instance
+        The projection, if one is being used.
+    extent : None or (xmin, xmax, ymin, ymax) tuple
+        A copy of the ``extent`` top-level parameter, if the user choses to specify their own extent. These values
+        will be used if ``extent`` is non-``None``.
+    extrema : None or (xmin, xmax, ymin, ymax) tuple
+        Plot-calculated extrema. These values, which are calculated in the plot above and passed to this function
+        (different plots require different calculations), will be used if a user-provided ``extent`` is not provided.
+    crs : None or cartopy.crs.Projection instance, optional
+        The coordinate reference system of the ``extrema``, as returned by ``_get_crs``. A user-provided ``extent`` is
+        always in longitude and latitude.
+
+    Returns
+    -------
+    None
+    """
+    if extent and projection:  # Input ``extent`` into set_extent().
+        ax.set_extent(extent)
+    elif extent and not projection:  # Input ``extent`` into set_ylim, set_xlim.
+        xmin, xmax, ymin, ymax = extent
+        ax.set_xlim((xmin, xmax))
+        ax.set_ylim((ymin, ymax))
+    if not extent and projection:  # Input ``extrema`` into set_extent.
+        xmin, xmax, ymin, ymax = extrema
+        ax.set_extent((xmin, xmax, ymin, ymax), crs=crs)
+    if not extent and not projection:  # Input ``extrema`` into set_ylim, set_xlim.
+        xmin, xmax, ymin, ymax = extrema
+        ax.set_xlim((xmin, xmax))
+        ax.set_ylim((ymin, ymax))
+
+
+def _lay_out_axes(ax, projection):
+    """
+    ``cartopy`` enables a a transparent background patch and an "outline" patch by default. This short method simply
+    hides these extraneous visual features. If the plot is a pure ``matplotlib`` one, it does the same thing by
+    removing the axis altogether.
+
+    Parameters
+    ----------
+    ax : matplotlib.Axes instance
+        The ``matplotlib.Axes`` instance being manipulated.
+    projection : None or geoplot.crs instance
+        The projection, if one is used.
+
+    Returns
+    -------
+    None
+    """
+    if projection is not None:
+        try:
+            ax.background_patch.set_visible(False)
+            ax.outline_patch.set_visible(False)
+        except AttributeError:  # Testing...
+            pass
+    else:
+        plt.gca().axison = False
+
+
+def _validate_hue(df, hue):
+    """
+    The top-level ``hue`` parameter present in most plot types accepts a variety of input types. This method
+    condenses this variety into a single preferred format---an array---which is expected by all submethods working
+    with the data downstream of it.
+
+    Parameters
+    ----------
+    df : GeoDataFrame
+        The full data input, from which standardized ``hue`` information may need to be extracted.
+    hue : Series, GeoSeries, iterable, str
+        The data column whose entries are being discretely colorized, as (loosely) passed by the top-level ``hue``
+        variable.
+
+    Returns
+    -------
+    hue : ndarray
+        The ``hue`` parameter input as an array. See ``_as_values``.
+    """
+    if hue is None:
+        return None
+    elif isinstance(hue, str):
+        return _as_values(df[hue])
+    else:
+        return _as_values(hue)
+
+
+def _validate_scale(df, scale):
+    """
+    Standardizes the top-level ``scale`` parameter, which, like ``hue``, is either the name of a column of the data
+    or the data itself.
+
+    Parameters
+    ----------
+    df : GeoDataFrame
+        The full data input.
+    scale : Series, iterable, str
+        The ``scale`` data, or the name of the column of ``df`` containing it.
+
+    Returns
+    -------
+    scale : ndarray
+        The ``scale`` parameter input as an array. See ``_as_values``.
+    """
+    if scale is None:
+        return None
+    elif isinstance(scale, str):
+        return _as_values(df[scale])
+    else:
+        return _as_values(scale)
+
+
+def _as_values(values):
+    """
+    Returns a data column as an ``ndarray``, aligned with the data by position (the index of a ``Series`` is
+    ignored). Arrays, and ``Series`` of ``numpy`` types, are returned as views, without being copied; iterables
+    without a length, such as generators, are read into one array.
+    """
+    if not hasattr(values, '__len__'):
+        values = list(values)
+    return np.asarray(values)
 
 
 def _continuous_colormap(hue, cmap, vmin, vmax):
@@ -2403,8 +4313,8 @@ def _continuous_colormap(hue, cmap, vmin, vmax):
     cmap : ``mpl.cm.ScalarMappable`` instance
         A normalized scalar version of the input ``cmap`` which has been fitted to the data and inputs.
     """
-    mn = min(hue) if vmin is None else vmin
-    mx = max(hue) if vmax is None else vmax
+    mn = np.nanmin(hue) if vmin is None else vmin
+    mx = np.nanmax(hue) if vmax is None else vmax
     norm = mpl.colors.Normalize(vmin=mn, vmax=mx)
     return mpl.cm.ScalarMappable(norm=norm, cmap=cmap)
 
@@ -2415,7 +4325,8 @@ def _discrete_colorize(categorical, hue, scheme, k, cmap, vmin, vmax):
     ordinal one. If a scheme is provided we compute a distribution for the given data. If one is not provided we
     assume that the input data is categorical.
 
-    This code makes extensive use of ``geopandas`` choropleth facilities.
+    Non-categorical data is binned using a ``Classifier``. An unfitted one is fit to ``hue`` here, and kept fit, so
+    that later plots passed the same instance reuse its classes.
 
     Parameters
     ----------
@@ -2425,11 +4336,11 @@ def _discrete_colorize(categorical, hue, scheme, k, cmap, vmin, vmax):
         The data column whose entries are being discretely colorized. Note that although top-level plotter ``hue``
         parameters ingest many argument signatures, not just iterables, they are all preprocessed to standardized
         iterables before this method is called.
-    scheme : str
-        The PySAL binning scheme to be used for splitting data values (or rather, the the string representation
-        thereof).
+    scheme : str or Classifier
+        The binning scheme to be used for splitting data values: either the name of one, or a ``Classifier``.
     k : int
-        The number of bins which will be used. This parameter will be ignored if ``categorical`` is True. The default
+        The number of bins which will be used. This parameter will be ignored if ``categorical`` is True, or if
+        ``scheme`` is a ``Classifier``, which sets its own number of bins. The default
         value should be 5---this should be set before this method is called.
     cmap : ``matplotlib.cm`` instance
         The `matplotlib` colormap instance which will be used to colorize the geometries. This colormap
@@ -2447,11 +4358,17 @@ def _discrete_colorize(categorical, hue, scheme, k, cmap, vmin, vmax):
         A tuple meant for assignment containing the values for various properties set by this method call.
     """
     if not categorical:
-        binning = __pysal_choro(hue, scheme, k=k)
-        values = binning.yb
-        binedges = [binning.yb.min()] + binning.bins.tolist()
-        categories = ['{0:.2f} - {1:.2f}'.format(binedges[i], binedges[i + 1])
-                      for i in range(len(binedges) - 1)]
+        classifier = scheme if isinstance(scheme, Classifier) else Classifier(scheme, k=k)
+        if classifier.n == 0:
+            classifier.fit(hue)
+        # Missing values belong to no class, and are drawn in the "bad" color of the colormap, as they are on a
+        # continuous one.
+        classes = classifier.classify(hue)
+        values = np.where(classes < 0, np.nan, classes)
+        categories = classifier.categories
+        # Normalize over every class, not just those present, so that plots sharing a classifier share colors too.
+        vmin = 0 if vmin is None else vmin
+        vmax = len(categories) - 1 if vmax is None else vmax
     else:
         categories = np.unique(hue)
         if len(categories) > 10:
@@ -2611,9 +4528,8 @@ def _validate_buckets(categorical, k, scheme):
         The number of categories to use. This variable has no effect if ``categorical`` is True, and will be set to 5
         by default if it is False and not already given.
 
-    scheme : str
-        The PySAL scheme that the variable will be categorized according to (or rather, a string representation
-        thereof).
+    scheme : str or Classifier
+        The scheme that the variable will be categorized according to: either the name of one, or a ``Classifier``.
 
     Returns
     -------
@@ -2623,6 +4539,8 @@ def _validate_buckets(categorical, k, scheme):
     if categorical and (k != 5 or scheme):
         raise ValueError("Invalid input: categorical cannot be specified as True simultaneously with scheme or k "
                          "parameters")
+    if isinstance(scheme, Classifier):
+        k = scheme.k
     if k > 10:
         warnings.warn("Generating a choropleth using a categorical column with over 10 individual categories. "
                       "This is not recommended!")
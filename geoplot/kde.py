@@ -0,0 +1,172 @@
+"""
+This module implements the density estimates drawn by ``kdeplot``. Estimating the density is by far the most expensive
+part of drawing a KDE plot: every point contributes a Gaussian kernel to every cell of the grid the density is
+evaluated on. A ``KDEGrid`` holds the result of doing so once, and ``kdeplot`` accepts one in place of data, in which
+case only the contours are drawn. This makes restyling a plot (changing its ``n_levels``, ``cmap`` or ``shade``) or
+drawing several variants of it almost free.
+
+Grids are built from data by ``geoplot.kde_grid``, and may be saved to and loaded from ``.npz`` files, so that they can
+be cached between sessions.
+"""
+
+import json
+import numpy as np
+from geoplot.parallel import chunk_bounds, parallel_map
+
+__all__ = ['KDEGrid']
+
+# Bumped whenever the layout of saved grids changes.
+_FORMAT_VERSION = 1
+
+
+class KDEGrid:
+    """
+    A kernel density estimate evaluated on a regular grid.
+
+    Properties
+    ----------
+    density : ndarray
+        The density, a ``(ny, nx)`` array whose rows run along the y axis and whose columns run along the x axis.
+    extent : (xmin, xmax, ymin, ymax)
+        The coordinates of the first and last grid lines along each axis, in the coordinates of the plot.
+    bandwidth : (bw_x, bw_y)
+        The standard deviation of the kernel along each axis, in the coordinates of the plot.
+    projection : None or str
+        The PROJ.4 definition of the projection the grid was estimated in, or None if it was estimated in the
+        coordinates of the data (for plots without a projection). A grid may only be drawn onto a plot with the same
+        projection.
+    center : None or (central_longitude, central_latitude)
+        The centering of the data, which ``kdeplot`` loads the projection with, as it would for the data itself.
+    extrema : None or (xmin, xmax, ymin, ymax)
+        The extrema of the data in its own coordinate reference system, which are the default extent of the plot.
+    crs : None or str
+        The WKT definition of the coordinate reference system of the data, or None if it is in longitude and latitude.
+    """
+    def __init__(self, density, extent, bandwidth, projection=None, center=None, extrema=None, crs=None):
+        """
+        Instantiation method. Grids are usually built with ``geoplot.kde_grid`` or ``KDEGrid.from_points`` instead.
+
+        Parameters
+        ----------
+        density : ndarray
+            The density.
+        extent : (xmin, xmax, ymin, ymax)
+            The extent of the grid.
+        bandwidth : (bw_x, bw_y)
+            The bandwidth of the kernel.
+        projection, center, extrema, crs : optional
+            Metadata about the plot the grid is meant for. See the properties of the class.
+
+        Returns
+        -------
+        A ``KDEGrid`` instance.
+        """
+        self.density = np.asarray(density, dtype=float)
+        if self.density.ndim != 2:
+            raise ValueError("Expected a two-dimensional density, but got an array of shape {0}.".format(
+                self.density.shape))
+        self.extent = tuple(float(v) for v in extent)
+        self.bandwidth = tuple(float(v) for v in bandwidth)
+        self.projection = projection
+        self.center = None if center is None else tuple(float(v) for v in center)
+        self.extrema = None if extrema is None else tuple(float(v) for v in extrema)
+        self.crs = crs
+
+    @classmethod
+    def from_points(cls, xs, ys, bw='scott', gridsize=100, cut=3, **metadata):
+        """
+        Estimates the density of a set of points with a Gaussian kernel (``scipy.stats.gaussian_kde``). Non-finite
+        points are ignored. The grid spans the points, plus ``cut`` bandwidths on either side. Large grids are
+        evaluated in parallel (see ``geoplot.set_workers``).
+
+        Parameters
+        ----------
+        xs, ys : ndarray
+            The point coordinates, in the coordinates of the plot.
+        bw : "scott", "silverman", or float, optional
+            The bandwidth estimation method, or a scalar factor which the covariance of the data is multiplied by to
+            get the covariance of the kernel. Defaults to Scott's rule.
+        gridsize : int, optional
+            The number of grid lines along each axis. Defaults to 100.
+        cut : float, optional
+            The number of bandwidths the grid extends past the extremes of the data by. Defaults to 3.
+        metadata : dict, optional
+            The ``projection``, ``center``, ``extrema`` and ``crs`` of the grid.
+
+        Returns
+        -------
+        A ``KDEGrid`` instance.
+        """
+        from scipy import stats
+        xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+        finite = np.isfinite(xs) & np.isfinite(ys)
+        if not finite.all():
+            xs, ys = xs[finite], ys[finite]
+        if len(xs) < 2:
+            raise ValueError("At least two points are needed to estimate a density, but got {0}.".format(len(xs)))
+
+        kde = stats.gaussian_kde(np.vstack([xs, ys]), bw_method='scott' if bw == 'scotts' else bw)
+        bw_x, bw_y = np.sqrt(np.diag(kde.covariance))
+        x_support = np.linspace(xs.min() - bw_x * cut, xs.max() + bw_x * cut, gridsize)
+        y_support = np.linspace(ys.min() - bw_y * cut, ys.max() + bw_y * cut, gridsize)
+        gx, gy = (g.ravel() for g in np.meshgrid(x_support, y_support))
+
+        # The work of evaluating a chunk of the grid is proportional to its size times the number of points.
+        chunks = chunk_bounds(len(gx), size=len(gx) * len(xs), min_chunk=2**24)
+        density = np.concatenate(parallel_map(_evaluate, [(kde, gx[a:b], gy[a:b]) for a, b in chunks]))
+        extent = (x_support[0], x_support[-1], y_support[0], y_support[-1])
+        return cls(density.reshape(len(y_support), len(x_support)), extent, (bw_x, bw_y), **metadata)
+
+    def coordinates(self):
+        """
+        Returns the coordinates of the grid points, as a pair of ``(ny, nx)`` arrays.
+        """
+        ny, nx = self.density.shape
+        xmin, xmax, ymin, ymax = self.extent
+        return np.meshgrid(np.linspace(xmin, xmax, nx), np.linspace(ymin, ymax, ny))
+
+    def save(self, path):
+        """
+        Saves the grid to an ``.npz`` file.
+
+        Parameters
+        ----------
+        path : str or file
+            The file. As with ``numpy.savez``, a ``.npz`` extension is added to paths without one.
+
+        Returns
+        -------
+        None
+        """
+        meta = {'version': _FORMAT_VERSION, 'projection': self.projection, 'center': self.center,
+                'extrema': self.extrema, 'crs': self.crs}
+        np.savez(path, density=self.density, extent=np.array(self.extent), bandwidth=np.array(self.bandwidth),
+                 meta=np.array(json.dumps(meta)))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads a grid saved by ``save``.
+
+        Parameters
+        ----------
+        path : str or file
+            The file.
+
+        Returns
+        -------
+        A ``KDEGrid`` instance.
+        """
+        with np.load(path, allow_pickle=False) as archive:
+            meta = json.loads(str(archive['meta']))
+            if meta.pop('version') != _FORMAT_VERSION:
+                raise ValueError("The grid at {0} was saved by an incompatible version of geoplot.".format(path))
+            return cls(archive['density'], archive['extent'], archive['bandwidth'], **meta)
+
+    def __repr__(self):
+        ny, nx = self.density.shape
+        return "<KDEGrid: {0}x{1} cells, bandwidth ({2:g}, {3:g})>".format(nx, ny, *self.bandwidth)
+
+
+def _evaluate(kde, xs, ys):
+    return kde(np.vstack([xs, ys]))
@@ -0,0 +1,135 @@
+"""
+This module implements zoom-aware level of detail for interactive plots. ``choropleth``, ``aggplot`` and ``pointplot``
+accept a ``lod`` parameter which, when set, attaches a ``LevelOfDetail`` to the axis they draw on. It listens for
+changes to the axis limits, and after every pan or zoom recomputes the plot for the part of it which is visible, at a
+detail level fit for the new scale, and swaps the result into the existing artists.
+
+In interactive backends (notebook widgets, Qt, and so on) refreshes are debounced with a timer of the figure
+canvas, so that a drag or a scroll only triggers a single refresh once it comes to rest. Non-interactive backends
+have no event loop for timers to run on, so there the plot is refreshed right away, whenever the limits change.
+"""
+
+import matplotlib as mpl
+
+__all__ = ['LevelOfDetail', 'refresh_detail']
+
+
+class LevelOfDetail:
+    """
+    Redraws a plot layer whenever the limits of its axis change.
+
+    Properties
+    ----------
+    ax : matplotlib.Axes instance
+        The axis being watched.
+    redraw : callable
+        The function called with the visible ``(xmin, xmax, ymin, ymax)`` of the axis, in its native coordinates,
+        which updates the layer's artists to match.
+    delay : int
+        The number of milliseconds the limits have to stay put for before a refresh is run.
+    """
+    def __init__(self, ax, redraw, delay=200):
+        """
+        Instantiation method. Registers the limit callbacks on the axis, and attaches the instance to it
+        (``matplotlib`` only keeps weak references to callbacks, so something else has to keep them alive).
+
+        Parameters
+        ----------
+        ax : matplotlib.Axes instance
+            The axis being watched.
+        redraw : callable
+            The layer's redraw function.
+        delay : int, optional
+            The debounce interval, in milliseconds. Defaults to 200.
+
+        Returns
+        -------
+        A ``LevelOfDetail`` instance.
+        """
+        self.ax, self.redraw, self.delay = ax, redraw, delay
+        self._view = None
+        self._timer, self._timer_canvas = None, None
+        self._busy = False
+        self._cids = [ax.callbacks.connect('xlim_changed', self._schedule),
+                      ax.callbacks.connect('ylim_changed', self._schedule)]
+        if not hasattr(ax, '_geoplot_lod'):
+            ax._geoplot_lod = []
+        ax._geoplot_lod.append(self)
+
+    def _schedule(self, ax):
+        if self._busy:
+            return
+        canvas = self.ax.figure.canvas
+        if self._timer is None or self._timer_canvas is not canvas:
+            self._timer, self._timer_canvas = canvas.new_timer(interval=self.delay), canvas
+            self._timer.single_shot = True
+            self._timer.add_callback(self._fire)
+        if type(self._timer) is mpl.backend_bases.TimerBase:
+            # The base timer class never fires.
+            self.refresh()
+        else:
+            self._timer.stop()
+            self._timer.start()
+
+    def _fire(self):
+        if self.refresh():
+            self.ax.figure.canvas.draw_idle()
+
+    def refresh(self, force=False):
+        """
+        Redraws the layer for the current view, unless it has already been drawn for it.
+
+        Parameters
+        ----------
+        force : boolean, optional
+            Whether or not to redraw the layer even if the view hasn't changed. Defaults to False.
+
+        Returns
+        -------
+        boolean
+            Whether or not the layer was redrawn.
+        """
+        if self._busy:
+            return False
+        # Reading the limits, or updating artists, may cause the axis to autoscale, which would otherwise trigger
+        # another refresh from within this one.
+        self._busy = True
+        try:
+            view = tuple(self.ax.get_xlim()) + tuple(self.ax.get_ylim())
+            if view == self._view and not force:
+                return False
+            self.redraw(view)
+            self._view = view
+        finally:
+            self._busy = False
+        return True
+
+    def disconnect(self):
+        """
+        Stops watching the axis. The layer is left as it was last drawn.
+        """
+        for cid in self._cids:
+            self.ax.callbacks.disconnect(cid)
+        self._cids = []
+        if self._timer is not None:
+            self._timer.stop()
+        if self in getattr(self.ax, '_geoplot_lod', []):
+            self.ax._geoplot_lod.remove(self)
+
+
+def refresh_detail(ax):
+    """
+    Immediately redraws every level-of-detail layer of an axis for its current view, without waiting out the
+    debounce interval. Useful for saving a figure right after changing its limits in an interactive session.
+
+    Parameters
+    ----------
+    ax : matplotlib.Axes instance
+        The axis.
+
+    Returns
+    -------
+    None
+    """
+    for layer in list(getattr(ax, '_geoplot_lod', [])):
+        layer.refresh()
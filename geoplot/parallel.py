@@ -0,0 +1,220 @@
+"""
+This module implements the parallel preprocessing layer of the plot functions. Bulk geometry work (centroids, bounds,
+simplification, affine scaling, conversion out of ``shapely`` objects, and reprojection) is split into contiguous
+chunks, which are run on a ``concurrent.futures`` executor, and the results are put back together in their original
+order. Every chunk is processed independently of the others, so results are the same whatever the number of workers.
+
+Parallelism is off by default; ``set_workers`` turns it on. Work which releases the GIL (``numpy`` array operations
+and ``pyproj`` transforms) is run on a pool of threads. Work which doesn't (iterating over ``shapely`` objects) is run
+on a pool of processes, which pays for pickling the inputs and outputs of every chunk, but is otherwise the only way
+of putting more than one core to work on it. Large arrays which every task reads from (but no task writes to) may be
+put in shared memory with ``shared_arrays``, so that process workers map them instead of having them pickled over.
+"""
+
+import concurrent.futures
+import contextlib
+import os
+import numpy as np
+
+__all__ = ['set_workers']
+
+# The worker count and executor kind set by ``set_workers``.
+_CONFIG = {'workers': 1, 'executor': None}
+
+# The executors created by this module, by kind. These are kept around between plots, as starting them up is costly.
+_pools = {}
+
+
+def set_workers(workers=None, executor=None):
+    """
+    Sets the number of workers used to preprocess large geometry arrays, for every plot type. Arrays are only split up
+    once they are large enough to keep every worker busy for a while, so small plots always run serially.
+
+    .. code-block:: python
+
+        gplt.set_workers(32)
+        gplt.choropleth(parcels, hue='value', projection=gcrs.AlbersEqualArea())
+
+    Parameters
+    ----------
+    workers : int or None, optional
+        The number of workers. Pass 1 to process everything serially in the calling thread, which is the default
+        before this function is called, or None to use one worker per CPU.
+    executor : None, "thread", "process", or concurrent.futures.Executor, optional
+        The kind of executor. Defaults to None, which runs work that releases the GIL on threads and all other work
+        on processes. Pass "thread" or "process" to run all work on one kind, or an ``Executor`` instance to run all
+        work on it (in which case ``workers`` only sets how many chunks work is split into).
+
+    Returns
+    -------
+    None
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if int(workers) < 1:
+        raise ValueError("The number of workers must be at least 1, not {0}.".format(workers))
+    if not (executor is None or executor in ('thread', 'process') or
+            isinstance(executor, concurrent.futures.Executor)):
+        raise ValueError("Invalid executor {0}; expected None, 'thread', 'process', or a concurrent.futures.Executor "
+                         "instance.".format(executor))
+    for pool in _pools.values():
+        pool.shutdown(wait=False)
+    _pools.clear()
+    _CONFIG['workers'], _CONFIG['executor'] = int(workers), executor
+
+
+def chunk_bounds(n, size=None, min_chunk=2**16):
+    """
+    Splits a run of items into contiguous chunks, one per worker, but no more than there are chunks at least
+    ``min_chunk`` units of work large.
+
+    Parameters
+    ----------
+    n : int
+        The number of items.
+    size : int, optional
+        The amount of work the items make up altogether, e.g. their total number of vertices. Defaults to ``n``.
+    min_chunk : int, optional
+        The smallest amount of work worth handing to a worker of its own.
+
+    Returns
+    -------
+    list of (start, stop) tuples
+    """
+    size = n if size is None else size
+    k = max(min(_CONFIG['workers'], n, size // min_chunk), 1)
+    edges = np.linspace(0, n, k + 1).astype(np.int64)
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def parallel_map(func, args, releases_gil=True):
+    """
+    Calls a function once per tuple of arguments on the configured executor, and returns the results in order. A
+    single call is run in the calling thread.
+
+    Parameters
+    ----------
+    func : callable
+        The function. Work run on processes has to be picklable, so this has to be defined at the top level of a
+        module (or be a method of a class which is).
+    args : list of tuples
+        The arguments of each call.
+    releases_gil : boolean, optional
+        Whether or not the function spends most of its time with the GIL released, in which case it is run on threads
+        by default. Defaults to True.
+
+    Returns
+    -------
+    list
+    """
+    if len(args) <= 1 or _CONFIG['workers'] == 1:
+        return [func(*a) for a in args]
+    return list(_executor(releases_gil).map(func, *zip(*args)))
+
+
+class SharedArray:
+    """
+    A read-only view of an array copied into a block of shared memory. Pickling one only pickles the name of the
+    block, and unpickling it in another process maps the block into that process, so the array itself is never
+    copied to the workers. Array arguments of ``parallel_map`` functions which may be ``SharedArray`` instances should
+    be passed through ``np.asarray``.
+
+    Properties
+    ----------
+    shape : tuple
+        The shape of the array.
+    dtype : numpy.dtype
+        The type of the array.
+    """
+    def __init__(self, array):
+        """
+        Instantiation method. Copies the array into a new block of shared memory, which is released by ``close``.
+
+        Parameters
+        ----------
+        array : array-like
+            The array.
+
+        Returns
+        -------
+        A ``SharedArray`` instance.
+        """
+        from multiprocessing import shared_memory
+        array = np.ascontiguousarray(array)
+        self.shape, self.dtype = array.shape, array.dtype
+        self._shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._owner = True
+        self.array[...] = array
+
+    @property
+    def array(self):
+        view = np.ndarray(self.shape, dtype=self.dtype, buffer=self._shm.buf)
+        if not self._owner:
+            view.flags.writeable = False
+        return view
+
+    def __array__(self, dtype=None, copy=None):
+        return self.array if dtype is None else self.array.astype(dtype)
+
+    def __getstate__(self):
+        return self._shm.name, self.shape, self.dtype
+
+    def __setstate__(self, state):
+        from multiprocessing import shared_memory
+        name, self.shape, self.dtype = state
+        self._owner = False
+        # Workers share their parent's resource tracker, with which the block is already registered.
+        self._shm = shared_memory.SharedMemory(name=name)
+
+    def close(self):
+        """
+        Releases the block of shared memory. The array may no longer be used afterwards.
+        """
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+@contextlib.contextmanager
+def shared_arrays(*arrays, releases_gil=True):
+    """
+    Shares arrays with the workers of the executor ``parallel_map`` would use for the same ``releases_gil`` value, for
+    the duration of a ``with`` block. Threads already share memory with the calling thread, as does a serial run, in
+    which case the arrays are passed through as they are; otherwise they're copied into ``SharedArray`` instances,
+    which are released on leaving the block.
+
+    Parameters
+    ----------
+    arrays : array-like
+        The arrays.
+    releases_gil : boolean, optional
+        As in ``parallel_map``. Defaults to True.
+
+    Returns
+    -------
+    A context manager giving a list of the arrays, or of ``SharedArray`` copies of them.
+    """
+    if _CONFIG['workers'] == 1 or not isinstance(_executor(releases_gil), concurrent.futures.ProcessPoolExecutor):
+        yield list(arrays)
+        return
+    shared = []
+    try:
+        for array in arrays:
+            shared.append(SharedArray(array))
+        yield shared
+    finally:
+        for array in shared:
+            array.close()
+
+
+def _executor(releases_gil):
+    executor = _CONFIG['executor']
+    if isinstance(executor, concurrent.futures.Executor):
+        return executor
+    kind = executor or ('thread' if releases_gil else 'process')
+    if kind not in _pools:
+        if kind == 'thread':
+            _pools[kind] = concurrent.futures.ThreadPoolExecutor(max_workers=_CONFIG['workers'])
+        else:
+            _pools[kind] = concurrent.futures.ProcessPoolExecutor(max_workers=_CONFIG['workers'])
+    return _pools[kind]
@@ -7,24 +7,43 @@ The routines here are used by the ``geoplot.aggplot`` plot type, and only when n
 """
 
 from collections import Iterable
+import copy
+import hashlib
+import numpy as np
+import pandas as pd
+from geoplot.columnar import ColumnarGeometry
+from geoplot.cache import IdentityCache
+from geoplot.parallel import chunk_bounds, parallel_map, shared_arrays
 
 
 class QuadTree:
     """
     This module's core class. For more on quadtrees cf. https://en.wikipedia.org/wiki/Quadtree.
 
+    The centroids of the input geometries are computed once, when the root of the tree is built. Subtrees share
+    these with their root, and only keep track of which of them they contain, so splitting a tree requires no further
+    geometric work. Partitions are memoized per ``(nmin, nmax)`` pair, so a tree may be reused to re-aggregate the
+    same data cheaply (as ``aggplot`` does via ``cached_quadtree``).
+
+    When ``geoplot.set_workers`` has been used to allow more than one worker, large trees are partitioned in
+    parallel: the top few levels of the tree are split serially, until there are enough subtrees to keep every worker
+    busy, and those are then partitioned independently of one another. The result is the same as that of the serial
+    algorithm.
+
     Properties
     ----------
     data : GeoDataFrame
-        An efficient shallow copy reference to the class's ``gdf`` data initialization input. This is retained for
-        downstream aggregation purposes.
+        The rows of the class's ``gdf`` data initialization input which are contained in this instance. This is
+        retained for downstream aggregation purposes.
     bounds : (minx, maxx, miny, maxy)
         A tuple of boundaries for data contained in the quadtree. May be passed as an initialization input via
         ``bounds`` or left to the ``QuadTree`` instance to compute for itself.
+    indices : ndarray
+        The positional indices of the rows of the ``gdf`` data initialization input contained in this instance.
     agg : dict
         An aggregated dictionary whose keys consist of coordinates within the instance's ``bounds`` and whose values
-        consist of the indices of rows in the ``data`` property corresponding with those points. This additional
-        bookkeeping is necessary because a single coordinate may contain many individual data points.
+        consist of the positional indices of the points at those coordinates. This additional bookkeeping is
+        necessary because a single coordinate may contain many individual data points.
     n : int
         The number of points contained in the current QuadTree instance.
     """
@@ -34,83 +53,259 @@ class QuadTree:
 
         Parameters
         ----------
-        gdf : GeoDataFrame
+        gdf : GeoDataFrame or ColumnarGeometry
             The data being geospatially aggregated.
         bounds : None or (minx, maxx, miny, maxy), optional
-            Precomputed extrema of the ``gdf`` input. If not provided beforehand
+            Precomputed extrema of the ``gdf`` input. If provided, only the points within these bounds are
+            included in the tree.
 
         Returns
         -------
         A baked `QuadTree` class instance.
         """
+        if isinstance(gdf, ColumnarGeometry):
+            xs, ys = gdf.centroid()
+        else:
+            centroids = gdf.geometry.centroid
+            empty = np.array([c is None or c.is_empty for c in centroids], dtype=bool)
+            xs = np.array([np.nan if e else c.x for c, e in zip(centroids, empty)], dtype=float)
+            ys = np.array([np.nan if e else c.y for c, e in zip(centroids, empty)], dtype=float)
+        keep = np.isfinite(xs) & np.isfinite(ys)
+
         if bounds:
             self.bounds = minx, maxx, miny, maxy = bounds
-            gdf = gdf[gdf.geometry.centroid.map(lambda b: (minx < b.x < maxx) & (miny < b.y < maxy))]
+            keep &= (xs >= minx) & (xs <= maxx) & (ys >= miny) & (ys <= maxy)
+        elif isinstance(gdf, ColumnarGeometry):
+            minx, miny, maxx, maxy = gdf.total_bounds()
+            self.bounds = (minx, maxx, miny, maxy)
         else:
             b = gdf.geometry.bounds
             minx, miny = b[['minx', 'miny']].min().values
             maxx, maxy = b[['maxx', 'maxy']].max().values
             self.bounds = (minx, maxx, miny, maxy)
-        gdf = gdf[[not c.is_empty for c in gdf.geometry.centroid]]
-        if len(gdf) > 0:
-            centroids = gdf.geometry.centroid
-            xs, ys = [c.x for c in centroids], [c.y for c in centroids]
-            geo = gdf.assign(x=xs, y=ys, centroid=centroids).reset_index()
-            groups = geo.groupby(['x', 'y'])
-            self.agg = dict()
-            self.n = 0
-            for ind, subgroup in groups:
-                self.n += len(subgroup.index.values)
-                self.agg[ind] = subgroup.index.values
-            self.data = gdf
-        else:
-            self.agg = dict()
-            self.n = 0
-            self.data = gdf
+
+        self._gdf, self._xs, self._ys = gdf, xs, ys
+        self.indices = np.flatnonzero(keep)
+        self.n = len(self.indices)
+        self._partitions = dict()
+        self._root = True
+
+    @classmethod
+    def _subtree(cls, parent, bounds, indices):
+        tree = cls.__new__(cls)
+        tree._gdf, tree._xs, tree._ys = parent._gdf, parent._xs, parent._ys
+        tree.bounds = bounds
+        tree.indices = indices
+        tree.n = len(indices)
+        tree._partitions = dict()
+        tree._root = False
+        return tree
+
+    def _bind(self, gdf):
+        """
+        Returns a shallow copy of this tree whose data is ``gdf``. Everything else, including the memoized
+        partitions, is shared with this tree.
+        """
+        tree = copy.copy(self)
+        tree._gdf = gdf
+        return tree
+
+    @property
+    def data(self):
+        if isinstance(self._gdf, ColumnarGeometry):
+            return self._gdf.take(self.indices)
+        return self._gdf.iloc[self.indices]
+
+    @property
+    def agg(self):
+        groups = pd.Series(self.indices).groupby([self._xs[self.indices], self._ys[self.indices]])
+        return {coord: group.values for coord, group in groups}
+
+    def max_colocated(self):
+        """
+        Returns the largest number of points sharing a single coordinate. Partitioning can never separate these.
+        """
+        if self.n == 0:
+            return 0
+        xs, ys = self._xs[self.indices], self._ys[self.indices]
+        return pd.DataFrame({'x': xs, 'y': ys}).groupby(['x', 'y']).size().max()
 
     def split(self):
         """
-        Splits the current QuadTree instance four ways through the midpoint.
+        Splits the current QuadTree instance four ways through the midpoint. Points lying exactly on a split line
+        are assigned to the quadrant above or to the right of it, so that every point ends up in exactly one
+        quadrant.
 
         Returns
         -------
         A list of four "sub" QuadTree instances, corresponding with the first, second, third, and fourth quartiles,
         respectively.
         """
-        # TODO: Investigate why a small number of entries are lost every time this method is run.
         min_x, max_x, min_y, max_y = self.bounds
         mid_x, mid_y = (min_x + max_x) / 2, (min_y + max_y) / 2
+        left = self._xs[self.indices] < mid_x
+        bottom = self._ys[self.indices] < mid_y
         q1 = (min_x, mid_x, mid_y, max_y)
         q2 = (min_x, mid_x, min_y, mid_y)
         q3 = (mid_x, max_x, mid_y, max_y)
         q4 = (mid_x, max_x, min_y, mid_y)
-        return [QuadTree(self.data, bounds=q1), QuadTree(self.data, bounds=q2), QuadTree(self.data, bounds=q3),
-                QuadTree(self.data, bounds=q4)]
+        return [QuadTree._subtree(self, q1, self.indices[left & ~bottom]),
+                QuadTree._subtree(self, q2, self.indices[left & bottom]),
+                QuadTree._subtree(self, q3, self.indices[~left & ~bottom]),
+                QuadTree._subtree(self, q4, self.indices[~left & bottom])]
 
     def partition(self, nmin, nmax):
         """
         This method call decomposes a QuadTree instances into a list of sub- QuadTree instances which are the
-        smallest possible geospatial "buckets", given the current splitting rules, containing at least ``thresh``
-        points.
+        smallest possible geospatial "buckets", given the current splitting rules, containing at least ``nmin``
+        points. The result is memoized.
 
         Parameters
         ----------
-        thresh : int
+        nmin : int
             The minimum number of points per partition. Care should be taken not to set this parameter to be too
             low, as in large datasets a small cluster of highly adjacent points may result in a number of
             sub-recursive splits possibly in excess of Python's global recursion limit.
+        nmax : int
+            The maximum number of points per partition. Partitions containing more points than this are split
+            regardless of ``nmin``.
 
         Returns
         -------
         partitions : list of QuadTree object instances
             A list of sub- QuadTree instances which are the smallest possible geospatial "buckets", given the current
-            splitting rules, containing at least ``thresh`` points.
+            splitting rules, containing at least ``nmin`` points.
         """
-        if self.n < nmin:
-            return [self]
-        else:
-            ret = subpartition(self, nmin, nmax)
-            return flatten(ret)
+        key = (nmin, nmax)
+        if key not in self._partitions:
+            if self.n < nmin:
+                partitions = [self]
+            elif self._root and len(chunk_bounds(self.n)) > 1:
+                # Subtrees are always partitioned serially, as they're either part of a parallel run already or
+                # were split off a tree too small to be worth one.
+                partitions = self._partition_parallel(nmin, nmax)
+            else:
+                partitions = flatten(subpartition(self, nmin, nmax))
+            # Only the bounds and indices of the partitions are memoized, so that the memo holds no reference to the
+            # data of the tree, which may be shared with trees over other copies of it (see ``cached_quadtree``).
+            self._partitions[key] = [(p.bounds, p.indices) for p in partitions]
+        return [QuadTree._subtree(self, bounds, indices) for bounds, indices in self._partitions[key]]
+
+    def _frontier(self, nmin, nmax, size):
+        """
+        Splits the top levels of the tree breadth-first, following the same rules as ``subpartition``, until at least
+        ``size`` subtrees are left to partition (or none are).
+
+        Returns
+        -------
+        A list of ``(QuadTree, final)`` tuples, in the order ``subpartition`` would visit them, where ``final`` is
+        whether or not the subtree is a partition in its own right.
+        """
+        nodes = [(self, False)]
+        pending = 1
+        while 0 < pending < size:
+            expanded = []
+            for tree, final in nodes:
+                if final or tree.n < nmin:
+                    expanded.append((tree, True))
+                    continue
+                subtrees = tree.split()
+                if tree.n <= nmax and any([t.n < nmin for t in subtrees]):
+                    expanded.append((tree, True))
+                else:
+                    expanded.extend((t, False) for t in subtrees)
+            nodes = expanded
+            pending = sum(not final for _, final in nodes)
+        return nodes
+
+    def _partition_parallel(self, nmin, nmax):
+        """
+        Partitions the tree with one task per subtree of its frontier, four times as many as there are workers so
+        that a few dense subtrees don't hold up the rest. The centroid coordinates, which every task reads from, are
+        shared with the workers rather than copied to them.
+        """
+        nodes = self._frontier(nmin, nmax, 4 * len(chunk_bounds(self.n)))
+        pending = [tree for tree, final in nodes if not final]
+        with shared_arrays(self._xs, self._ys, releases_gil=False) as (xs, ys):
+            results = iter(parallel_map(_partition_subtree,
+                                        [(xs, ys, tree.bounds, tree.indices, nmin, nmax) for tree in pending],
+                                        releases_gil=False))
+        partitions = []
+        for tree, final in nodes:
+            if final:
+                partitions.append(tree)
+            else:
+                partitions.extend(QuadTree._subtree(self, bounds, indices) for bounds, indices in next(results))
+        return partitions
+
+
+# The most memory the trees retained by ``cached_quadtree`` may take up.
+_CACHE_BYTES = 2**27
+_cache = IdentityCache(_CACHE_BYTES)
+
+
+def cached_quadtree(df):
+    """
+    Returns a ``QuadTree`` of a dataset, reusing the one built the last time this same dataset was seen. Trees are
+    cached by the identity of the dataset object (and of its geometry column), for as long as it is alive; a dataset
+    whose geometry is modified in place should be plotted after calling ``geoplot.clear_memory_cache``. The least
+    recently used trees are evicted once the cached trees take up more than 128 MB.
+
+    Parameters
+    ----------
+    df : GeoDataFrame or ColumnarGeometry
+        The data being geospatially aggregated.
+
+    Returns
+    -------
+    A `QuadTree` class instance.
+    """
+    owners = _geometry_owners(df)
+    tree = _cache.get(owners)
+    if tree is None:
+        # The cached tree is detached from the dataset, which it would otherwise keep alive.
+        tree = QuadTree(df)._bind(None)
+        _cache.put(owners, tree, tree._xs.nbytes + tree._ys.nbytes + tree.indices.nbytes)
+    return tree._bind(df)
+
+
+def _geometry_owners(df):
+    """
+    Returns the objects a structure derived from the geometry of a dataset is cached by: the dataset itself, and its
+    geometry array, which is replaced whenever its geometry column is reassigned.
+    """
+    if isinstance(df, ColumnarGeometry):
+        return (df,)
+    return (df, df.geometry.values)
+
+
+def _geometry_hash(df):
+    """
+    Hashes the geometry of a dataset. Geometries are hashed by their bounding boxes, which is enough to catch any
+    change that would move their centroids in practice, and is much cheaper than hashing every vertex.
+    """
+    h = hashlib.sha1()
+    if isinstance(df, ColumnarGeometry):
+        h.update(df.geom_type.encode('utf-8'))
+        for arr in (df.x, df.y) + df.offsets:
+            h.update(np.ascontiguousarray(arr).tobytes())
+    else:
+        h.update(np.ascontiguousarray(df.geometry.bounds.values, dtype=float).tobytes())
+    return h.hexdigest()
+
+
+def _partition_subtree(xs, ys, bounds, indices, nmin, nmax):
+    """
+    Partitions a subtree of the points at ``xs`` and ``ys``. Run on the workers of ``QuadTree._partition_parallel``.
+
+    Returns
+    -------
+    A list of the ``(bounds, indices)`` of each partition.
+    """
+    tree = QuadTree.__new__(QuadTree)
+    tree._gdf, tree._xs, tree._ys = None, np.asarray(xs), np.asarray(ys)
+    tree = QuadTree._subtree(tree, bounds, indices)
+    return [(p.bounds, p.indices) for p in tree.partition(nmin, nmax)]
 
 
 def subpartition(quadtree, nmin, nmax):
@@ -0,0 +1,152 @@
+"""
+This module implements scaling functions for the ``scale_func`` parameter of ``pointplot``, ``cartogram`` and
+``sankey``.
+
+A ``scale_func`` is a factory of two variables, the minimum and maximum of the ``scale`` data, which returns the
+function that maps each data value to a size multiple. By default that function is called once per value. A function
+marked with the ``vectorized`` decorator (or a ``numpy`` ufunc) is instead called just once, on an array holding all of
+the values, which is much faster on large datasets. Every scaler here is vectorized.
+"""
+
+import numpy as np
+
+__all__ = ['vectorized', 'linear_scale', 'log_scale', 'sqrt_scale', 'power_scale']
+
+
+def vectorized(func):
+    """
+    Marks a scaling function as vectorized: able to take an array of values and return an array of the same shape.
+    Plots then call it once on all of their ``scale`` data, instead of once per value.
+
+    .. code-block:: python
+
+        def trivial_scale(minval, maxval):
+            @gplt.vectorized
+            def scalar(vals):
+                return np.full(np.shape(vals), 2.0)
+            return scalar
+
+    Parameters
+    ----------
+    func : callable
+        The scaling function.
+
+    Returns
+    -------
+    The same function, marked.
+    """
+    func.vectorized = True
+    return func
+
+
+def is_vectorized(func):
+    """
+    Returns whether or not a scaling function may be called on an array of values.
+    """
+    return isinstance(func, np.ufunc) or getattr(func, 'vectorized', False)
+
+
+def linear_scale(minval, maxval, limits=(0.5, 2)):
+    """
+    A linear scale, mapping ``minval`` to the lower and ``maxval`` to the upper of the ``limits``. This is the default
+    scale of every plot type, which uses its own ``limits`` parameter for it.
+
+    Parameters
+    ----------
+    minval, maxval : float
+        The extrema of the data.
+    limits : (min, max) tuple, optional
+        The size multiples the extrema map to. Use ``functools.partial`` to change these when passing this function as
+        a ``scale_func``.
+
+    Returns
+    -------
+    A vectorized scaling function.
+    """
+    return _normalized_scale(minval, maxval, limits, lambda t: t)
+
+
+def power_scale(minval, maxval, limits=(0.5, 2), exponent=2):
+    """
+    A power scale. Values are normalized to the range between ``minval`` and ``maxval``, raised to ``exponent``, and
+    then mapped linearly onto the ``limits``.
+
+    Parameters
+    ----------
+    minval, maxval : float
+        The extrema of the data.
+    limits : (min, max) tuple, optional
+        The size multiples the extrema map to.
+    exponent : float, optional
+        The exponent. Defaults to 2.
+
+    Returns
+    -------
+    A vectorized scaling function.
+    """
+    return _normalized_scale(minval, maxval, limits, lambda t: np.power(t, exponent))
+
+
+def sqrt_scale(minval, maxval, limits=(0.5, 2)):
+    """
+    A square root scale: a ``power_scale`` with an exponent of one half. Sizing ``pointplot`` markers with it, which
+    are sized by area, makes their radii rather than their areas grow linearly with the data.
+
+    Parameters
+    ----------
+    minval, maxval : float
+        The extrema of the data.
+    limits : (min, max) tuple, optional
+        The size multiples the extrema map to.
+
+    Returns
+    -------
+    A vectorized scaling function.
+    """
+    return _normalized_scale(minval, maxval, limits, np.sqrt)
+
+
+def log_scale(minval, maxval, limits=(0.5, 2)):
+    """
+    A logarithmic scale, for data spanning several orders of magnitude. The logarithms of the values are mapped
+    linearly onto the ``limits``. The data must be strictly positive.
+
+    Parameters
+    ----------
+    minval, maxval : float
+        The extrema of the data.
+    limits : (min, max) tuple, optional
+        The size multiples the extrema map to.
+
+    Returns
+    -------
+    A vectorized scaling function.
+    """
+    if minval <= 0:
+        raise ValueError("A logarithmic scale requires strictly positive data, but the minimum value is "
+                         "{0}.".format(minval))
+    log_min = np.log(minval)
+    return _normalized_scale(log_min, np.log(maxval), limits, lambda t: t, transform=np.log)
+
+
+def _normalized_scale(minval, maxval, limits, curve, transform=None):
+    """
+    Builds a vectorized scaling function which applies ``transform`` to values, normalizes the result to the unit
+    interval using the (already transformed) ``minval`` and ``maxval``, applies ``curve``, and maps that onto the
+    ``limits``.
+    """
+    lower, upper = limits
+    span = maxval - minval
+    if span == 0 or np.isinf((upper - lower) / span):
+        # Edge case: if dmax, dmin are <=10**-30 or so, the slope will overflow and eval to infinity.
+        raise ValueError("The data range provided to the 'scale' variable is too small for this scaling function. "
+                         "Normalize your data or provide a custom 'scale_func'.")
+
+    @vectorized
+    def scalar(vals):
+        vals = np.asarray(vals, dtype=float)
+        if transform is not None:
+            vals = transform(vals)
+        return lower + (upper - lower) * curve((vals - minval) / span)
+
+    return scalar
@@ -0,0 +1,123 @@
+"""
+This module implements a shared-boundary topology of polygon data, in the spirit of TopoJSON
+(https://github.com/topojson/topojson-specification). Adjacent polygons (census tracts, precincts, and the like)
+share most of their borders, so stroking every ring independently draws each shared border twice. A ``Topology``
+breaks the rings down into segments, keeps a single copy of each segment, and strings the survivors back together
+into arcs, which ``polyplot`` and ``choropleth`` draw as a single ``LineCollection`` when passed ``topology=True``.
+
+Segments are matched on their exact endpoint coordinates, in either direction, so borders are only recognized as
+shared if the polygons on either side of them use the same vertices (as is the case for data derived from a common
+topology, which most administrative boundary files are).
+"""
+
+import numpy as np
+from geoplot.columnar import ColumnarGeometry
+from geoplot.cache import IdentityCache
+from geoplot.quad import _geometry_owners
+
+__all__ = ['Topology', 'cached_topology']
+
+
+class Topology:
+    """
+    The unique boundary arcs of a column of polygons.
+
+    Properties
+    ----------
+    arcs : ColumnarGeometry
+        The arcs, as ``LineString`` data. Every segment of every ring of the input appears in exactly one arc, and
+        every arc is a run of consecutive segments of a single ring.
+    n_segments : int
+        The number of ring segments in the input, shared segments counted once per ring.
+    n_unique : int
+        The number of distinct segments, which is the number drawn.
+    """
+    def __init__(self, df):
+        """
+        Instantiation method. Builds the topology.
+
+        Parameters
+        ----------
+        df : GeoDataFrame, GeoSeries, or ColumnarGeometry
+            The polygons.
+
+        Returns
+        -------
+        A ``Topology`` instance.
+        """
+        if not isinstance(df, ColumnarGeometry):
+            df = ColumnarGeometry.from_geoseries(df.geometry if hasattr(df, 'geometry') else df)
+        if df.geom_type not in ('Polygon', 'MultiPolygon'):
+            raise ValueError("A topology can only be built out of polygons, not '{0}' geometries.".format(
+                df.geom_type))
+        x, y = df.x + 0.0, df.y + 0.0  # Adding zero turns -0.0 into 0.0, which would otherwise not match.
+
+        # Every vertex but the last of each ring starts a segment.
+        ro, _ = df.ring_offsets()
+        starts = np.ones(len(x), dtype=bool)
+        starts[ro[1:][ro[1:] > ro[:-1]] - 1] = False
+        starts[ro[-1]:] = False
+        v = np.flatnonzero(starts)
+        x0, y0, x1, y1 = x[v], y[v], x[v + 1], y[v + 1]
+        valid = np.isfinite(x0) & np.isfinite(y0) & np.isfinite(x1) & np.isfinite(y1) & ((x0 != x1) | (y0 != y1))
+        v, x0, y0, x1, y1 = v[valid], x0[valid], y0[valid], x1[valid], y1[valid]
+
+        # Put the endpoints of each segment into a canonical order, so that the same segment traversed in opposite
+        # directions (as it is by the polygons on either side of it) has the same key. Keep its first occurrence.
+        swap = (x0 > x1) | ((x0 == x1) & (y0 > y1))
+        keys = np.column_stack([np.where(swap, x1, x0), np.where(swap, y1, y0),
+                                np.where(swap, x0, x1), np.where(swap, y0, y1)])
+        keys = np.ascontiguousarray(keys).view(np.dtype((np.void, keys.dtype.itemsize * 4))).ravel()
+        _, first = np.unique(keys, return_index=True)
+        v = v[np.sort(first)]
+
+        # String runs of consecutive kept segments back together. A run is broken wherever a segment was dropped,
+        # and at the end of every ring (the vertex ending a ring never starts a segment).
+        if len(v):
+            run_starts = np.flatnonzero(np.concatenate([[True], v[1:] != v[:-1] + 1]))
+        else:
+            run_starts = np.array([], dtype=np.int64)
+        run_ends = np.append(run_starts[1:], len(v)) - 1
+        # Each arc holds the start vertex of each of its segments, plus the end vertex of its final segment.
+        run_ids = np.repeat(np.arange(len(run_starts)), np.diff(np.append(run_starts, len(v))))
+        indices = np.empty(len(v) + len(run_starts), dtype=np.int64)
+        indices[np.arange(len(v)) + run_ids] = v
+        indices[run_ends + np.arange(len(run_starts)) + 1] = v[run_ends] + 1
+        offsets = np.append(run_starts + np.arange(len(run_starts)), len(indices))
+
+        self.arcs = ColumnarGeometry(x[indices], y[indices], geom_type='LineString', offsets=(offsets,),
+                                      crs=df.crs)
+        self.n_segments = len(keys)
+        self.n_unique = len(v)
+
+    def __repr__(self):
+        return "<Topology: {0} arcs, {1} of {2} segments>".format(len(self.arcs), self.n_unique, self.n_segments)
+
+
+# The most memory the topologies retained by ``cached_topology`` may take up.
+_CACHE_BYTES = 2**27
+_cache = IdentityCache(_CACHE_BYTES)
+
+
+def cached_topology(df):
+    """
+    Returns the ``Topology`` of a dataset, reusing the one built the last time this same dataset was seen.
+    Topologies are cached in the same way as the trees of ``cached_quadtree``: by the identity of the dataset, for as
+    long as it is alive, up to 128 MB of them.
+
+    Parameters
+    ----------
+    df : GeoDataFrame, GeoSeries, or ColumnarGeometry
+        The polygons.
+
+    Returns
+    -------
+    A ``Topology`` class instance.
+    """
+    owners = _geometry_owners(df)
+    topology = _cache.get(owners)
+    if topology is None:
+        topology = Topology(df)
+        arcs = topology.arcs
+        _cache.put(owners, topology, arcs.x.nbytes + arcs.y.nbytes + sum(o.nbytes for o in arcs.offsets))
+    return topology
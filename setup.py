@@ -2,8 +2,9 @@ from setuptools import setup
 setup(
     name = 'geoplot',
     packages = ['geoplot'], # this must be the same as the name above
-    install_requires=['matplotlib', 'seaborn', 'pandas', 'geopandas', 'cartopy'],
-    py_modules=['geoplot', 'crs', 'utils', 'quad'],
+    install_requires=['matplotlib', 'scipy', 'pandas', 'geopandas', 'cartopy'],
+    py_modules=['geoplot', 'crs', 'utils', 'quad', 'columnar', 'cache', 'classify', 'scales', 'bundle', 'topology',
+                'kde', 'lod', 'parallel'],
     version = '0.0.3',
     description = 'High-level geospatial plotting for Python.',
     author = 'Aleksey Bilogur',
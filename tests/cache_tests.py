@@ -0,0 +1,129 @@
+"""
+This test file runs tests of the on-disk dataset cache and of the in-memory caches of derived structures.
+"""
+
+import sys; sys.path.insert(0, '../')
+import geoplot as gplt
+import geoplot.cache
+import geoplot.quad
+import geoplot.crs as gcrs
+import matplotlib.pyplot as plt
+import pyproj
+import unittest
+import gc
+import weakref
+import tempfile
+import shutil
+import os
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.dir, 'cache')
+        self.path = os.path.join(self.dir, 'polys.geojson')
+        polys = gplt.utils.gaussian_polygons(gplt.utils.gaussian_points(n=100), n=4)
+        self.gdf = gpd.GeoDataFrame({'name': list('abcd')[:len(polys)], 'value': np.arange(len(polys))},
+                                    geometry=polys)
+        self.gdf.to_file(self.path, driver='GeoJSON')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_round_trip(self):
+        miss = geoplot.cache.read_file(self.path, cache_dir=self.cache_dir)
+        hit = geoplot.cache.read_file(self.path, cache_dir=self.cache_dir)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        self.assertIsInstance(hit.x, np.ndarray)
+        self.assertFalse(hit.x.flags.writeable)  # Memory-mapped, not copied.
+        np.testing.assert_array_equal(miss.x, hit.x)
+        np.testing.assert_array_equal(hit['value'], self.gdf['value'])
+        self.assertEqual(list(hit['name']), list(self.gdf['name']))
+        self.assertEqual(list(geoplot.cache.read_file(self.path, columns=['value'],
+                                                      cache_dir=self.cache_dir).data.columns), ['value'])
+
+    def test_invalidation(self):
+        geoplot.cache.read_file(self.path, cache_dir=self.cache_dir)
+        self.gdf.iloc[:2].to_file(self.path, driver='GeoJSON')
+        os.utime(self.path, (0, 0))
+        self.assertEqual(len(geoplot.cache.read_file(self.path, cache_dir=self.cache_dir)), 2)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+        geoplot.cache.clear_cache(self.cache_dir)
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_null_values(self):
+        path = os.path.join(self.dir, 'nulls.geojson')
+        self.gdf.assign(name=['a', None, 'c', 'd'], flag=[True, None, False, True]).to_file(path, driver='GeoJSON')
+        expected = gpd.read_file(path)
+        for cg in (geoplot.cache.read_file(path, cache_dir=self.cache_dir),
+                   geoplot.cache.read_file(path, cache_dir=self.cache_dir)):
+            for c in ('name', 'flag'):
+                self.assertEqual(list(pd.isnull(cg[c])), list(pd.isnull(expected[c])))
+                self.assertEqual(list(cg[c][pd.notnull(cg[c])]), list(expected[c].dropna()))
+
+        # Object columns which aren't read from files by every driver.
+        flags = pd.Series([True, None, False], dtype=object, name='flag')
+        geoplot.cache._save_column(self.dir, 'flag', flags)
+        self.assertEqual(list(geoplot.cache._load_column(self.dir, 'flag')), [True, None, False])
+        with self.assertRaises(ValueError):
+            geoplot.cache._save_column(self.dir, 'mixed', pd.Series(['a', 1], dtype=object, name='mixed'))
+
+    def test_projected_round_trip(self):
+        # Shift the polygons into New York, and store them in the State Plane coordinates of Long Island.
+        path = os.path.join(self.dir, 'projected.geojson')
+        projected = self.gdf.set_crs(epsg=4326)
+        shifted = projected.geometry.scale(0.01, 0.01, origin=(0, 0)).translate(-73.9, 40.7)
+        projected = projected.set_geometry(shifted).to_crs(epsg=2263)
+        projected.to_file(path, driver='GeoJSON')
+
+        for cg in (geoplot.cache.read_file(path, cache_dir=self.cache_dir),
+                   geoplot.cache.read_file(path, cache_dir=self.cache_dir)):
+            self.assertEqual(pyproj.CRS.from_user_input(cg.crs), pyproj.CRS.from_epsg(2263))
+        for derived in (cg.take([0, 1]), cg.scale(0.5), cg.simplify(10)):
+            self.assertIs(derived.crs, cg.crs)
+
+        try:
+            ax = gplt.polyplot(cg, projection=gcrs.AlbersEqualArea())
+            xmin, xmax, ymin, ymax = ax.get_extent(ax.projection.as_geodetic())
+            self.assertTrue(-75 < xmin < xmax < -73 and 40 < ymin < ymax < 42)
+        finally:
+            plt.close()
+
+
+class TestMemoryCache(unittest.TestCase):
+
+    def test_identity_cache(self):
+        cache = geoplot.cache.IdentityCache(max_bytes=100)
+        a, b, c = np.zeros(1), np.zeros(1), np.zeros(1)
+        cache.put((a,), 'a', 60)
+        self.assertEqual(cache.get((a,)), 'a')
+        self.assertIsNone(cache.get((b,)))
+        cache.put((b, c), 'bc', 60)  # Evicts the entry for a.
+        self.assertIsNone(cache.get((a,)))
+        self.assertEqual(cache.get((b, c)), 'bc')
+
+        del c
+        gc.collect()
+        self.assertEqual((len(cache), cache.nbytes), (0, 0))
+
+        cache.put((a,), 'a', 60)
+        gplt.clear_memory_cache()
+        self.assertEqual((len(cache), cache.nbytes), (0, 0))
+
+    def test_cached_quadtree(self):
+        points = gplt.ColumnarGeometry.from_geoseries(gplt.utils.gaussian_points(n=100))
+        tree = geoplot.quad.cached_quadtree(points)
+        self.assertIs(tree._gdf, points)
+        self.assertIs(geoplot.quad.cached_quadtree(points)._partitions, tree._partitions)
+
+        # The cache doesn't keep the data alive.
+        ref = weakref.ref(points)
+        del points, tree
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertEqual(len(geoplot.quad._cache), 0)
@@ -0,0 +1,79 @@
+"""
+This test file runs tests of the classification schemes used for binning ``hue`` values.
+"""
+
+import sys; sys.path.insert(0, '../')
+import geoplot as gplt
+import unittest
+import itertools
+import numpy as np
+
+
+class TestClassifier(unittest.TestCase):
+
+    def setUp(self):
+        self.values = np.random.RandomState(0).lognormal(size=2000)
+
+    def test_schemes(self):
+        for scheme in ['Quantiles', 'equal_interval', 'Fisher_Jenks']:
+            classifier = gplt.Classifier(scheme, k=4).fit(self.values)
+            classes = classifier.classify(self.values)
+            self.assertEqual(len(classifier.bins), 4)
+            self.assertEqual(len(classifier.categories), 4)
+            self.assertEqual(classifier.bins[-1], self.values.max())
+            self.assertEqual(set(classes), {0, 1, 2, 3})
+            # Classes are ordered: every value in a class is no greater than that class's upper edge.
+            self.assertTrue((self.values <= classifier.bins[classes]).all())
+
+    def test_fisher_jenks_is_optimal(self):
+        values = np.random.RandomState(1).randint(0, 50, size=12).astype(float)
+        bins = gplt.Classifier('Fisher_Jenks', k=3).fit(values).bins
+
+        def deviation(classes):
+            return sum(((values[classes == c] - values[classes == c].mean()) ** 2).sum() for c in set(classes))
+
+        uniques = np.unique(values)
+        best = min(deviation(np.searchsorted(np.append(uniques[list(cuts)], uniques[-1]), values))
+                   for cuts in itertools.combinations(range(len(uniques) - 1), 2))
+        self.assertAlmostEqual(deviation(np.searchsorted(bins, values)), best)
+
+    def test_sampling(self):
+        classifier = gplt.Classifier('Quantiles', k=5, sample=500, random_state=0)
+        for chunk in np.array_split(self.values, 7):
+            classifier.partial_fit(chunk)
+        self.assertEqual(classifier.n, len(self.values))
+        self.assertEqual((classifier.min, classifier.max), (self.values.min(), self.values.max()))
+        exact = gplt.Classifier('Quantiles', k=5).fit(self.values).bins
+        np.testing.assert_allclose(classifier.bins[:-1], exact[:-1], rtol=0.25)
+
+    def test_approximate_fisher_jenks(self):
+        exact = gplt.Classifier('Fisher_Jenks', k=5, resolution=None).fit(self.values)
+        approximate = gplt.Classifier('Fisher_Jenks', k=5, resolution=100).fit(self.values)
+        self.assertEqual(len(approximate.bins), 5)
+        self.assertAlmostEqual(exact.gvf, exact.gvf_exact)
+        self.assertAlmostEqual(approximate.gvf_exact, exact.gvf)
+        self.assertLessEqual(approximate.gvf, approximate.gvf_exact)
+        self.assertGreater(approximate.gvf, approximate.gvf_exact - 0.01)
+        self.assertLess(gplt.Classifier('Equal_interval', k=5).fit(self.values).gvf, exact.gvf_exact)
+
+    def test_score(self):
+        sampled = gplt.Classifier('Fisher_Jenks', k=5, sample=200, random_state=0).fit(self.values)
+        exact = gplt.Classifier('Fisher_Jenks', k=5, resolution=None).fit(self.values)
+        self.assertAlmostEqual(exact.score(np.append(self.values, np.nan)), exact.gvf)
+        # Breaks fit to a sample fit the full dataset no better than exact breaks do.
+        self.assertLessEqual(sampled.score(self.values), exact.gvf_exact)
+        self.assertGreater(sampled.score(self.values), exact.gvf_exact - 0.05)
+
+    def test_missing_values(self):
+        values = np.append(self.values, [np.nan, np.inf])
+        classifier = gplt.Classifier('Quantiles', k=4).fit(values)
+        self.assertEqual(classifier.n, len(self.values))
+        classes = classifier.classify(values)
+        self.assertEqual(list(classes[-2:]), [-1, -1])
+        self.assertEqual(set(classes[:-2]), {0, 1, 2, 3})
+
+        # Unclassed values are drawn in the "bad" color of the colormap, rather than that of the highest class.
+        cmap, _, hue_values = gplt.geoplot._discrete_colorize(False, values, classifier, 4, None, None, None)
+        colors = cmap.to_rgba(np.asarray(hue_values))
+        np.testing.assert_array_equal(colors[-2:], [cmap.cmap.get_bad()] * 2)
+        self.assertFalse((colors[:-2] == cmap.cmap.get_bad()).all(axis=1).any())
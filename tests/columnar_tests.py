@@ -0,0 +1,45 @@
+"""
+This test file runs tests of the compact geometry columns.
+"""
+
+import sys; sys.path.insert(0, '../')
+import geoplot as gplt
+import unittest
+import numpy as np
+from shapely.geometry import box, LineString, MultiPolygon, Polygon
+
+
+class TestQuantizedGeometry(unittest.TestCase):
+
+    def setUp(self):
+        t = np.linspace(0, 2 * np.pi, 20)
+        rings = [np.c_[i + 0.4 * np.cos(t), j + 0.4 * np.sin(t)] for i in range(20) for j in range(10)]
+        self.polygons = [Polygon(ring) for ring in rings]
+        self.polygons[3] = MultiPolygon([box(0, 0, 0.1, 0.1), box(0.2, 0.2, 0.3, 0.3)])
+        self.columnar = gplt.ColumnarGeometry.from_geoseries(self.polygons)
+
+    def test_round_trip(self):
+        quantized = gplt.QuantizedGeometry.from_geoseries(self.polygons, resolution=10000)
+        step = 20.8 / 10000
+        self.assertTrue(np.abs(quantized.x - self.columnar.x).max() <= step / 2 + 1e-12)
+        self.assertTrue(np.abs(quantized.y - self.columnar.y).max() <= step / 2 + 1e-12)
+        for original, decoded in zip(self.polygons, quantized.to_geoseries()):
+            self.assertLess(original.hausdorff_distance(decoded), step)
+        self.assertLessEqual(quantized.nbytes * 4, self.columnar.x.nbytes + self.columnar.y.nbytes)
+
+    def test_take(self):
+        quantized = gplt.QuantizedGeometry.from_columnar(self.columnar)
+        for indices in ([5, 3, 0, 3], np.arange(200) % 3 == 0):
+            taken = quantized.take(indices)
+            self.assertIsInstance(taken, gplt.QuantizedGeometry)
+            expected = quantized.with_xy(quantized.x, quantized.y).take(indices)
+            np.testing.assert_array_equal(taken.x, expected.x)
+            np.testing.assert_array_equal(taken.y, expected.y)
+            for a, b in zip(taken.offsets, expected.offsets):
+                np.testing.assert_array_equal(a, b)
+
+    def test_missing_coordinates(self):
+        lines = gplt.QuantizedGeometry.from_geoseries([LineString([(0, 0), (1, 1)])])
+        points = gplt.QuantizedGeometry([0, np.nan, 2], [0, np.nan, 2])
+        self.assertTrue(np.isnan(points.x[1]) and np.isnan(points.take([1]).y[0]))
+        np.testing.assert_allclose(lines.x, [0, 1])
@@ -6,8 +6,10 @@ listed in the API Reference work.
 
 import sys; sys.path.insert(0, '../')
 import geoplot as gplt
+import geoplot.crs as gcrs
 import unittest
 import geopandas as gpd
+import matplotlib as mpl
 import matplotlib.pyplot as plt
 from shapely.geometry import Point, LineString
 import numpy as np
@@ -47,10 +49,25 @@ series_paths = gpd.GeoSeries(list_paths)
 def map_paths(): return map(lambda i: list_paths[i], list(range(len(list_paths))))
 dataframe_gaussian_points = dataframe_gaussian_points.assign(paths=list_paths)
 
+# Columnar input.
+columnar_gaussian_points = gplt.ColumnarGeometry.from_geoseries(series_gaussian_points,
+                                                                data=pd.DataFrame({'hue_var': [1, 2, 3, 4]}))
+columnar_gaussian_polys = gplt.ColumnarGeometry.from_geoseries(series_gaussian_polys,
+                                                               data=pd.DataFrame({'hue_var': [1, 2, 3, 4]}))
+columnar_start_points = gplt.ColumnarGeometry.from_xy([p.x for p in list_start_points],
+                                                      [p.y for p in list_start_points])
+columnar_end_points = gplt.ColumnarGeometry.from_xy([p.x for p in list_end_points], [p.y for p in list_end_points])
+columnar_paths = gplt.ColumnarGeometry.from_geoseries(list_paths)
+quantized_gaussian_points = gplt.QuantizedGeometry.from_columnar(columnar_gaussian_points)
+quantized_gaussian_polys = gplt.QuantizedGeometry.from_columnar(columnar_gaussian_polys)
+
 # (Aggplot) geometry.
 dataframe_gaussian_points = dataframe_gaussian_points.assign(mock_category=np.random.randint(1, 5))
 aggplot_geometries = dataframe_gaussian_polys.set_index('hue_var', drop=True)
 
+# Projected coordinate reference system input.
+projected_gaussian_polys = gpd.GeoDataFrame(dataframe_gaussian_polys, crs='epsg:3857')
+
 
 class TestDataInputFormats(unittest.TestCase):
 
@@ -63,6 +80,22 @@ class TestDataInputFormats(unittest.TestCase):
             gplt.pointplot(dataframe_gaussian_points, hue=series_hue_values, k=None)
             gplt.pointplot(dataframe_gaussian_points, hue=map_hue_values(), k=None)
             gplt.pointplot(dataframe_gaussian_points, hue='hue_var', k=None)
+
+            gplt.pointplot(columnar_gaussian_points, hue='hue_var', k=None)
+            gplt.pointplot(columnar_gaussian_points, hue=list_hue_values, k=None)
+            gplt.pointplot(quantized_gaussian_points, hue='hue_var', k=None)
+
+            gplt.pointplot(dataframe_gaussian_points, hue='hue_var', extent=(-1, 1, -1, 1))
+            gplt.pointplot(columnar_gaussian_points, hue='hue_var', extent=(-1, 1, -1, 1), cull_margin=None)
+
+            gplt.pointplot(dataframe_gaussian_points, raster=True, gridsize=8)
+            gplt.pointplot(dataframe_gaussian_points, raster=True, gridsize=8, lod=True)
+            gplt.pointplot(columnar_gaussian_points, hue='hue_var', lod=True)
+            gplt.pointplot(iter([dataframe_gaussian_points, columnar_gaussian_points]), hue='hue_var')
+
+            gplt.pointplot(dataframe_gaussian_points, scale='hue_var', scale_func=gplt.log_scale)
+            gplt.pointplot(dataframe_gaussian_points, scale='hue_var', scale_func=lambda dmin, dmax: lambda v: 2)
+            gplt.pointplot(dataframe_gaussian_points, hue=np.array(list_hue_values), scale=np.array(list_hue_values))
         finally: plt.close()
 
     def test_kdeplot(self):
@@ -77,6 +110,13 @@ class TestDataInputFormats(unittest.TestCase):
         finally:
             plt.close()
 
+    def test_kdeplot_columnar_and_grid(self):
+        try:
+            gplt.kdeplot(columnar_gaussian_points)
+            gplt.kdeplot(gplt.kde_grid(dataframe_gaussian_points))
+        finally:
+            plt.close()
+
     def test_cartogram(self):
         try:
             gplt.cartogram(series_gaussian_polys, scale=list_hue_values)
@@ -86,6 +126,8 @@ class TestDataInputFormats(unittest.TestCase):
             gplt.cartogram(dataframe_gaussian_polys, hue=series_hue_values, scale=list_hue_values)
             gplt.cartogram(dataframe_gaussian_polys, hue=map_hue_values(), scale=list_hue_values)
             gplt.cartogram(dataframe_gaussian_polys, hue='hue_var', scale=list_hue_values)
+
+            gplt.cartogram(columnar_gaussian_polys, hue='hue_var', scale='hue_var')
         finally:
             plt.close()
 
@@ -94,6 +136,18 @@ class TestDataInputFormats(unittest.TestCase):
             gplt.polyplot(series_gaussian_polys)
             gplt.polyplot(dataframe_gaussian_polys)
 
+            gplt.polyplot(columnar_gaussian_polys)
+            gplt.polyplot(quantized_gaussian_polys)
+
+            gplt.polyplot(dataframe_gaussian_polys, extent=(-1, 1, -1, 1), clip_extent=True)
+            gplt.polyplot(columnar_gaussian_polys, extent=(-1, 1, -1, 1), clip_extent=True)
+
+            gplt.polyplot(projected_gaussian_polys, projection=gcrs.AlbersEqualArea())
+            gplt.polyplot(projected_gaussian_polys, projection=gcrs.AlbersEqualArea(), extent=(-1, 1, -1, 1))
+
+            gplt.polyplot(columnar_gaussian_polys, topology=True)
+            gplt.polyplot(dataframe_gaussian_polys, topology=gplt.Topology(dataframe_gaussian_polys),
+                          facecolor='lightgray', extent=(-1, 1, -1, 1), clip_extent=True)
         finally:
             plt.close()
 
@@ -106,6 +160,21 @@ class TestDataInputFormats(unittest.TestCase):
             gplt.choropleth(dataframe_gaussian_polys, hue=series_hue_values)
             gplt.choropleth(dataframe_gaussian_polys, hue=map_hue_values())
             gplt.choropleth(dataframe_gaussian_polys, hue='hue_var')
+
+            gplt.choropleth(columnar_gaussian_polys, hue='hue_var')
+            gplt.choropleth(columnar_gaussian_polys, hue=list_hue_values)
+            gplt.choropleth(quantized_gaussian_polys, hue='hue_var')
+
+            gplt.choropleth(dataframe_gaussian_polys, hue='hue_var', extent=(-1, 1, -1, 1))
+            gplt.choropleth(columnar_gaussian_polys, hue='hue_var', extent=(-1, 1, -1, 1), clip_extent=True)
+            gplt.choropleth(projected_gaussian_polys, hue='hue_var', projection=gcrs.AlbersEqualArea())
+            gplt.choropleth(columnar_gaussian_polys, hue='hue_var', topology=True, edgecolor='white')
+            gplt.choropleth(dataframe_gaussian_polys, hue='hue_var', lod=True)
+            gplt.choropleth(columnar_gaussian_polys, hue='hue_var', topology=True, lod=True)
+
+            classifier = gplt.Classifier('Equal_interval', k=3)
+            gplt.choropleth(dataframe_gaussian_polys, hue='hue_var', scheme=classifier)
+            gplt.choropleth(columnar_gaussian_polys, hue=list_hue_values[:2] * 2, scheme=classifier)
         finally:
             plt.close()
 
@@ -131,6 +200,28 @@ class TestDataInputFormats(unittest.TestCase):
 
             gplt.sankey(dataframe_gaussian_points, path='paths')
 
+            gplt.sankey(start=columnar_start_points, end=columnar_end_points)
+            gplt.sankey(path=columnar_paths)
+
+            gplt.sankey(start=list_start_points, end=list_end_points, extent=(-1, 1, -1, 1))
+            gplt.sankey(path=list_paths, extent=(-1, 1, -1, 1), clip_extent=True)
+            gplt.sankey(path=columnar_paths, extent=(-1, 1, -1, 1), clip_extent=True)
+
+            gplt.sankey(start=list_start_points * 2, end=list_end_points * 2, scale=list(range(8)), aggregate=True)
+            gplt.sankey(start=columnar_start_points, end=columnar_end_points, scale=list_hue_values, aggregate=10,
+                        agg=np.mean)
+            gplt.sankey(start=list_start_points, end=list_end_points, bundle=True)
+            gplt.sankey(start=columnar_start_points, end=columnar_end_points, bundle=True,
+                        bundle_kwargs={'cycles': 3})
+
+        finally:
+            plt.close()
+
+    def test_sankey_aggregate_string_hue(self):
+        try:
+            ax = gplt.sankey(start=list_start_points * 2, end=list_end_points * 2, hue=['a', 'b'] * 4,
+                             categorical=True, scale=list(range(8)), aggregate=True, legend=True, legend_var='hue')
+            self.assertEqual([text.get_text() for text in ax.get_legend().get_texts()], ['a', 'b'])
         finally:
             plt.close()
 
@@ -164,5 +255,38 @@ class TestDataInputFormats(unittest.TestCase):
                          by=map(lambda v: v, list(dataframe_gaussian_points['mock_category'])),
                          geometry=aggplot_geometries)  # Map
 
+            gplt.aggplot(columnar_gaussian_points, hue='hue_var')
+
+            gplt.aggplot(dataframe_gaussian_points, hue=list_hue_values, kind='hex', gridsize=5)
+            gplt.aggplot(columnar_gaussian_points, hue='hue_var', kind='hex', nsig=1)
+            gplt.aggplot(columnar_gaussian_points, kind='hex')
+
+            gplt.aggplot(columnar_gaussian_points, hue='hue_var', lod=True)
+            gplt.aggplot(columnar_gaussian_points, hue='hue_var', kind='hex', lod=True)
+
+            quadtree = gplt.QuadTree(dataframe_gaussian_points)
+            gplt.aggplot(dataframe_gaussian_points, hue='hue_var', quadtree=quadtree)
+            gplt.aggplot(dataframe_gaussian_points, hue=list_hue_values, agg=np.median, quadtree=quadtree)
+        finally:
+            plt.close()
+
+    def test_aggplot_hex_insignificant(self):
+        try:
+            # No cell holds more than nsig points: every cell is blank, and the legend spans the values of every cell.
+            ax = gplt.aggplot(columnar_gaussian_points, hue='hue_var', kind='hex', nsig=10, legend=True)
+            facecolors = ax.collections[0].get_facecolors()
+            np.testing.assert_array_equal(facecolors, [mpl.colors.to_rgba("white")] * len(facecolors))
+            self.assertEqual(ax.figure.axes[-1].get_ylim(), (1, 4))
+        finally:
+            plt.close()
+
+    def test_aggplot_mismatched_quadtree(self):
+        quadtree = gplt.QuadTree(columnar_gaussian_points)
+        shifted = columnar_gaussian_points.with_xy(columnar_gaussian_points.x + 1, columnar_gaussian_points.y)
+        try:
+            with self.assertRaises(ValueError):
+                gplt.aggplot(columnar_gaussian_points.take([0, 1, 2]), hue=[1, 2, 3], quadtree=quadtree)
+            with self.assertRaises(ValueError):
+                gplt.aggplot(shifted, hue=list_hue_values, quadtree=quadtree)
         finally:
             plt.close()
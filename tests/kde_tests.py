@@ -0,0 +1,49 @@
+"""
+This test file runs tests of precomputed kernel density estimate grids.
+"""
+
+import sys; sys.path.insert(0, '../')
+import geoplot as gplt
+import geoplot.crs as gcrs
+import matplotlib.pyplot as plt
+import unittest
+import os
+import tempfile
+import numpy as np
+
+
+class TestKDEGrid(unittest.TestCase):
+
+    def setUp(self):
+        xs, ys = np.random.RandomState(0).normal(0, 1, (2, 500))
+        self.points = gplt.ColumnarGeometry.from_xy(xs, ys)
+
+    def tearDown(self):
+        plt.close('all')
+
+    def test_restyle(self):
+        grid = gplt.kde_grid(self.points, gridsize=50)
+        self.assertEqual(grid.density.shape, (50, 50))
+        ax = gplt.kdeplot(grid, n_levels=[0.01, 0.02, 0.05])
+        np.testing.assert_array_equal(ax.collections[-1].levels, [0.01, 0.02, 0.05])
+        ax = gplt.kdeplot(grid, shade=True, shade_lowest=False, cmap='Purples')
+        self.assertGreater(ax.collections[-1].levels[0], 0)
+        with self.assertRaises(ValueError):
+            gplt.kdeplot(grid, bw=0.5)
+
+    def test_projection(self):
+        grid = gplt.kde_grid(self.points, projection=gcrs.AlbersEqualArea())
+        gplt.kdeplot(grid, projection=gcrs.AlbersEqualArea())
+        with self.assertRaises(ValueError):
+            gplt.kdeplot(grid, projection=gcrs.Mercator())
+        with self.assertRaises(ValueError):
+            gplt.kdeplot(gplt.kde_grid(self.points), projection=gcrs.AlbersEqualArea())
+
+    def test_save_and_load(self):
+        grid = gplt.kde_grid(self.points, projection=gcrs.AlbersEqualArea())
+        path = os.path.join(tempfile.mkdtemp(), 'grid.npz')
+        grid.save(path)
+        loaded = gplt.KDEGrid.load(path)
+        np.testing.assert_array_equal(loaded.density, grid.density)
+        for attr in ('extent', 'bandwidth', 'projection', 'center', 'extrema', 'crs'):
+            self.assertEqual(getattr(loaded, attr), getattr(grid, attr))
@@ -53,7 +53,15 @@ class TestDataInputFormats(unittest.TestCase):
 
             gplt.pointplot(list_gaussian_points, legend_kwargs={'fancybox': False})
             gplt.pointplot(list_gaussian_points, projection=gcrs.PlateCarree(), legend_kwargs={'fancybox': False})
-        finally: plt.close()
+
+            gplt.set_rasterization_thresholds(features=2)
+            ax = gplt.pointplot(list_gaussian_points)
+            assert ax.collections[-1].get_rasterized()
+            ax = gplt.pointplot(list_gaussian_points, rasterized=False)
+            assert not ax.collections[-1].get_rasterized()
+        finally:
+            gplt.set_rasterization_thresholds()
+            plt.close()
 
     def test_kdeplot(self):
         # All keyword arguments are passed directly to KDEPlot and not mutated.
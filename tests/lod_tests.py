@@ -0,0 +1,50 @@
+"""
+This test file runs tests of the zoom-aware level-of-detail plot layers.
+"""
+
+import sys; sys.path.insert(0, '../')
+import geoplot as gplt
+import matplotlib.pyplot as plt
+import unittest
+import numpy as np
+import pandas as pd
+from shapely.geometry import Polygon
+
+
+class TestLevelOfDetail(unittest.TestCase):
+
+    def tearDown(self):
+        plt.close('all')
+
+    def test_choropleth(self):
+        t = np.linspace(0, 2 * np.pi, 100)
+        polygons = [Polygon(np.c_[i + 0.4 * np.cos(t), j + 0.4 * np.sin(t)]) for i in range(10) for j in range(10)]
+        polygons = gplt.ColumnarGeometry.from_geoseries(polygons, data=pd.DataFrame({'v': np.arange(100)}))
+        ax = gplt.choropleth(polygons, hue='v', lod=True, figsize=(2, 2))
+        collection = ax.collections[0]
+        self.assertEqual(len(collection.get_paths()), 100)
+        # Circles a few pixels across are simplified.
+        self.assertLess(sum(len(path.vertices) for path in collection.get_paths()), 100 * 100)
+
+        ax.set_xlim(-0.5, 1.5)
+        ax.set_ylim(-0.5, 1.5)
+        self.assertEqual(len(collection.get_paths()), 9)
+        self.assertEqual(len(collection.get_facecolor()), 9)
+        self.assertEqual(len(collection.get_paths()[0].vertices), len(polygons.take([0]).x))
+
+    def test_pointplot(self):
+        xs = np.linspace(0, 1, 101)
+        points = gplt.ColumnarGeometry.from_xy(xs, xs, data=pd.DataFrame({'v': xs}))
+        ax = gplt.pointplot(points, hue='v', k=None, lod=True)
+        collection = ax.collections[0]
+        ax.set_xlim(0, 0.5)
+        ax.set_ylim(0, 0.5)
+        # The view is padded by a tenth of its size on either side.
+        self.assertEqual(len(collection.get_offsets()), 56)
+        self.assertEqual(len(collection.get_facecolor()), 56)
+
+        layer = ax._geoplot_lod[0]
+        layer.disconnect()
+        ax.set_xlim(0, 0.1)
+        gplt.refresh_detail(ax)
+        self.assertEqual(len(collection.get_offsets()), 56)
@@ -0,0 +1,57 @@
+"""
+This test file runs memory regression tests of the plot entry points on large inputs: of the peak during a call, and
+of what stays allocated after it. Both are measured with ``tracemalloc``, which ``numpy`` reports its array
+allocations to, relative to the size of the input coordinates.
+"""
+
+import sys; sys.path.insert(0, '../')
+import geoplot as gplt
+import geoplot.crs as gcrs
+import matplotlib.pyplot as plt
+import unittest
+import gc
+import tracemalloc
+import numpy as np
+
+
+class TestPeakMemory(unittest.TestCase):
+
+    n = 5 * 10**6
+
+    def setUp(self):
+        rs = np.random.RandomState(0)
+        self.points = gplt.ColumnarGeometry.from_xy(rs.rand(self.n), rs.rand(self.n))
+        self.values = rs.rand(self.n)
+        self.input_bytes = self.points.x.nbytes + self.points.y.nbytes
+
+    def tearDown(self):
+        plt.close('all')
+
+    def peak(self, func):
+        tracemalloc.start()
+        try:
+            func()
+            return tracemalloc.get_traced_memory()[1] / self.input_bytes
+        finally:
+            tracemalloc.stop()
+
+    def test_pointplot(self):
+        # Uniformly colored points are drawn with a single color, and the coordinates aren't copied.
+        self.assertLess(self.peak(lambda: gplt.pointplot(self.points)), 4)
+        # Sorting by size and culling to the extent gather each per-point array once.
+        self.assertLess(self.peak(lambda: gplt.pointplot(self.points, scale=self.values)), 11)
+        self.assertLess(self.peak(lambda: gplt.pointplot(self.points, extent=(0, 0.5, 0, 0.5))), 2)
+
+    def test_retained(self):
+        tracemalloc.start()
+        try:
+            # The projected coordinates are cached for as long as the input is alive, and released along with it.
+            gplt.pointplot(self.points, projection=gcrs.PlateCarree())
+            plt.close('all')
+            gc.collect()
+            self.assertLess(tracemalloc.get_traced_memory()[0] / self.input_bytes, 1.5)
+            self.points = None
+            gc.collect()
+            self.assertLess(tracemalloc.get_traced_memory()[0] / self.input_bytes, 0.1)
+        finally:
+            tracemalloc.stop()
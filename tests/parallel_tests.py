@@ -0,0 +1,47 @@
+"""
+This test file runs tests of the parallel geometry preprocessing layer.
+"""
+
+import sys; sys.path.insert(0, '../')
+import geoplot as gplt
+from geoplot.parallel import chunk_bounds
+import unittest
+import numpy as np
+from shapely.geometry import box
+
+
+class TestParallel(unittest.TestCase):
+
+    def tearDown(self):
+        gplt.set_workers(1)
+
+    def test_chunk_bounds(self):
+        gplt.set_workers(4)
+        self.assertEqual(chunk_bounds(10, min_chunk=1), [(0, 2), (2, 5), (5, 7), (7, 10)])
+        self.assertEqual(chunk_bounds(10, size=2**17), [(0, 5), (5, 10)])
+        self.assertEqual(chunk_bounds(0), [(0, 0)])
+        with self.assertRaises(ValueError):
+            gplt.set_workers(0)
+
+    def test_results_are_independent_of_workers(self):
+        boxes = [box(x, y, x + 0.5, y + 0.5) for x, y in np.random.RandomState(0).uniform(-50, 50, (40000, 2))]
+        results = []
+        for workers in (1, 3):
+            gplt.set_workers(workers, executor='thread')
+            column = gplt.ColumnarGeometry.from_geoseries(boxes)
+            results.append([column.x, column.offsets[-1], column.bounds(), column.centroid()[0],
+                            column.simplify(1).x, column.scale(np.linspace(0.5, 2, len(column))).y])
+        for serial, parallel in zip(*results):
+            np.testing.assert_array_equal(serial, parallel)
+
+    def test_quadtree_partition_is_independent_of_workers(self):
+        from geoplot.quad import QuadTree
+        points = np.random.RandomState(0).normal(0, 1, (150000, 2))
+        column = gplt.ColumnarGeometry.from_xy(points[:, 0], points[:, 1])
+        results = []
+        for workers in (1, 3):
+            gplt.set_workers(workers, executor='thread')
+            results.append(QuadTree(column).partition(20, 5000))
+        self.assertEqual([p.bounds for p in results[0]], [p.bounds for p in results[1]])
+        for serial, parallel in zip(*results):
+            np.testing.assert_array_equal(serial.indices, parallel.indices)
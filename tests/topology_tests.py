@@ -0,0 +1,45 @@
+"""
+This test file runs tests of the shared-boundary topologies used for drawing polygon outlines.
+"""
+
+import sys; sys.path.insert(0, '../')
+import geoplot as gplt
+import geoplot.topology
+import unittest
+import gc
+import weakref
+import numpy as np
+import shapely.ops
+from shapely.geometry import box, Polygon
+
+
+class TestTopology(unittest.TestCase):
+
+    def test_shared_borders_are_kept_once(self):
+        # A 3x3 grid of unit squares has 36 ring segments, 12 of which are interior borders shared by two squares.
+        squares = [box(i, j, i + 1, j + 1) for i in range(3) for j in range(3)]
+        topology = gplt.Topology(squares)
+        self.assertEqual(topology.n_segments, 36)
+        self.assertEqual(topology.n_unique, 24)
+        arcs = topology.arcs.to_geoseries()
+        self.assertAlmostEqual(sum(arc.length for arc in arcs), 24)
+        self.assertTrue(shapely.ops.unary_union(arcs).equals(shapely.ops.unary_union([s.boundary for s in squares])))
+
+    def test_holes(self):
+        # The hole is filled in by a second polygon, which traverses it in the opposite direction.
+        hole = [(1, 1), (2, 1), (2, 2), (1, 2)]
+        polygons = [Polygon([(0, 0), (4, 0), (4, 4), (0, 4)], [hole]), Polygon(hole[::-1])]
+        topology = gplt.Topology(gplt.ColumnarGeometry.from_geoseries(polygons))
+        self.assertEqual(topology.n_unique, 8)
+        self.assertAlmostEqual(sum(arc.length for arc in topology.arcs.to_geoseries()), 20)
+
+    def test_cache(self):
+        polygons = gplt.ColumnarGeometry.from_geoseries([box(0, 0, 1, 1), box(1, 0, 2, 1)])
+        self.assertIs(gplt.cached_topology(polygons), gplt.cached_topology(polygons))
+
+        # The cache doesn't keep the data alive.
+        ref = weakref.ref(polygons)
+        del polygons
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertEqual(len(geoplot.topology._cache), 0)